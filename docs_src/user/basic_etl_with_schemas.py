@@ -0,0 +1,28 @@
+import pandas as pd
+from models import AfterSchema, BeforeSchema
+from sqlalchemy import create_engine
+
+from extralo import ETL, CSVSource, SchemaValidation, SQLDestination
+
+engine = create_engine("sqlite:///data.sqlite")
+
+
+def my_transformer(data: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    data["days_since_start"] = (pd.Timestamp.now() - data["policy_start_date"]).dt.days
+    return {"data": data}
+
+
+etl = ETL(
+    sources={"data": CSVSource("data.csv", parse_dates=["policy_start_date"])},
+    transformer=my_transformer,
+    destinations={
+        "data": [
+            SQLDestination(engine, "data_group", None, if_exists="replace"),
+        ],
+    },
+    before={"data": BeforeSchema},
+    after={"data": AfterSchema},
+    validation=SchemaValidation(chunk_size=500_000),
+)
+
+etl.execute()
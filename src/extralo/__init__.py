@@ -1,25 +1,56 @@
 from loguru import logger
 
+from .async_etl import AsyncDestinationAdapter, AsyncETL, AsyncSourceAdapter
+from .compaction import DtypeCompaction
 from .destinations import (
+    ArrowDeltaLakeDestination,
     CSVAppendDestination,
     CSVDestination,
     DeltaLakeDestination,
+    DeltaLakeMaintenance,
     JSONDestination,
+    JSONLinesDestination,
     JSONObjDestination,
+    JSONObjStreamDestination,
+    ParquetDestination,
     SparkDeltaLakeDestination,
     SQLAppendDestination,
     SQLDestination,
     XLSXAppendDestination,
     XLSXDestination,
+    XLSXWorkbookDestination,
 )
 from .etl import ETL, ETLSequentialLoad
-from .sources import CSVSource, DeltaLakeSource, JSONSource, SASSource, SparkDeltaLakeSource, SQLSource, XLSXSource
+from .runner import ETLRunner, ETLScheduler, RunReport
+from .sources import (
+    ArrowDeltaLakeSource,
+    CSVSource,
+    DeltaLakeSource,
+    DirectorySource,
+    JSONSource,
+    ParquetSource,
+    SASSource,
+    SparkDeltaLakeSource,
+    SQLSource,
+    XLSXSource,
+)
+from .transform_cache import TransformCache
+from .validation import SchemaValidation
 
 logger.disable("extralo")
 
 __all__ = [
     "ETL",
     "ETLSequentialLoad",
+    "AsyncETL",
+    "AsyncSourceAdapter",
+    "AsyncDestinationAdapter",
+    "ETLRunner",
+    "ETLScheduler",
+    "RunReport",
+    "DtypeCompaction",
+    "TransformCache",
+    "SchemaValidation",
     "CSVSource",
     "SQLSource",
     "SASSource",
@@ -29,12 +60,21 @@ __all__ = [
     "CSVDestination",
     "XLSXAppendDestination",
     "XLSXDestination",
+    "XLSXWorkbookDestination",
     "SQLAppendDestination",
     "DeltaLakeDestination",
     "DeltaLakeSource",
+    "ArrowDeltaLakeSource",
+    "ArrowDeltaLakeDestination",
+    "DeltaLakeMaintenance",
     "SparkDeltaLakeDestination",
     "SparkDeltaLakeSource",
     "JSONDestination",
     "JSONObjDestination",
+    "JSONLinesDestination",
+    "JSONObjStreamDestination",
     "JSONSource",
+    "ParquetSource",
+    "ParquetDestination",
+    "DirectorySource",
 ]
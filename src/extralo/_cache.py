@@ -0,0 +1,75 @@
+import threading
+from collections import Counter
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from extralo.source import CacheableSource
+
+T = TypeVar("T")
+
+
+def source_key(source: object) -> Hashable:
+    """The key used to find the sources that read the same data: their cache key, or their identity."""
+    key = source.cache_key() if isinstance(source, CacheableSource) else None
+    if key is None:
+        return ("identity", id(source))
+    return key
+
+
+class SourceCache:
+    """Extract each source once, sharing the data with every consumer that asks for the same key.
+
+    The consumers of each key are registered beforehand, and the data is dropped as soon as all of them got it.
+    The data can be invalidated when it may be stale, so the consumers asking for it afterwards extract it again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future[Any]] = {}
+        self._uses: Counter[Hashable] = Counter()
+
+    def register(self, key: Hashable) -> None:
+        """Register a consumer for the given key."""
+        with self._lock:
+            self._uses[key] += 1
+
+    def get(self, key: Hashable, extract: Callable[[], T]) -> T:
+        """Get the data for the given key, extracting it only if no other consumer did it yet.
+
+        Args:
+            key (Hashable): The key of the source.
+            extract (Callable[[], T]): The function that extracts the data.
+
+        Returns:
+            T: The data extracted, shared by all the consumers of the key.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+        if owner:
+            try:
+                future.set_result(extract())
+            except BaseException as e:
+                future.set_exception(e)
+        try:
+            return future.result()
+        finally:
+            self._release(key)
+
+    def invalidate(self) -> None:
+        """Forget the data extracted so far, including the running extractions.
+
+        The consumers already waiting for an extraction still get its data.
+        """
+        with self._lock:
+            self._futures.clear()
+
+    def _release(self, key: Hashable) -> None:
+        with self._lock:
+            self._uses[key] -= 1
+            if self._uses[key] <= 0:
+                del self._uses[key]
+                self._futures.pop(key, None)
@@ -0,0 +1,94 @@
+import json
+import os
+import shutil
+import threading
+from typing import Any, Literal
+
+from extralo._ipc import persist, restore
+
+_STATE_FILE = "state.json"
+_STAGES = ("extracted", "transformed")
+
+
+class Checkpoint:
+    """The intermediate data and the loaded destinations of an ETL run, persisted in a directory.
+
+    The data of each stage is written to one file per key, and `state.json` records the files, the destinations that
+    already succeeded, as `<key>:<index>`, and what the sources record when committed.
+
+    Args:
+        directory (str): The directory where the checkpoint is kept.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._state = self._read_state()
+
+    def stage(self) -> Literal["extract", "transform", "load"]:
+        """The step an ETL run should be resumed from."""
+        if "transformed" in self._state:
+            return "load"
+        if "extracted" in self._state:
+            return "transform"
+        return "extract"
+
+    def save(self, stage: Literal["extracted", "transformed"], data: dict[str, Any]) -> None:
+        """Persist the data of a stage."""
+        directory = os.path.join(self._directory, stage)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        files = {
+            name: os.path.relpath(persist(value, os.path.join(directory, str(index))), self._directory)
+            for index, (name, value) in enumerate(data.items())
+        }
+        with self._lock:
+            self._state[stage] = files
+            self._write_state()
+
+    def restore(self, stage: Literal["extracted", "transformed"]) -> dict[str, Any]:
+        """Read back the data of a stage, memory-mapping the Arrow files."""
+        return {name: restore(os.path.join(self._directory, file)) for name, file in self._state[stage].items()}
+
+    def save_sources(self, pending: dict[str, Any]) -> None:
+        """Persist what each source records when committed, like the new files of a `DirectorySource`."""
+        with self._lock:
+            self._state["sources"] = pending
+            self._write_state()
+
+    def sources(self) -> dict[str, Any]:
+        """Read back what each source records when committed."""
+        return self._state.get("sources", {})
+
+    def is_loaded(self, name: str, index: int) -> bool:
+        """Whether the destination with the given index succeeded for the given key."""
+        return f"{name}:{index}" in self._state.get("loaded", [])
+
+    def mark_loaded(self, name: str, index: int) -> None:
+        """Record that the destination with the given index succeeded for the given key."""
+        with self._lock:
+            self._state.setdefault("loaded", []).append(f"{name}:{index}")
+            self._write_state()
+
+    def clear(self) -> None:
+        """Remove the checkpoint files, keeping anything else in the directory."""
+        with self._lock:
+            for stage in _STAGES:
+                shutil.rmtree(os.path.join(self._directory, stage), ignore_errors=True)
+            if os.path.exists(os.path.join(self._directory, _STATE_FILE)):
+                os.remove(os.path.join(self._directory, _STATE_FILE))
+            self._state = {}
+
+    def _read_state(self) -> dict[str, Any]:
+        path = os.path.join(self._directory, _STATE_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_state(self) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(self._directory, _STATE_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self._state, file)
+        os.replace(f"{path}.tmp", path)
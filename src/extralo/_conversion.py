@@ -0,0 +1,110 @@
+import threading
+from collections.abc import Callable, Generator, Hashable
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class ConversionCache:
+    """The conversions shared between the destinations of the data in a single load.
+
+    The cache is created for the load and dropped with it. The data is identified by its `id`, and the cache keeps a
+    reference to it while registered, so the `id` can't be reused by other data in the meantime.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[Any, int, dict[Hashable, Future[Any]]]] = {}
+
+    def register(self, data: Any) -> None:
+        """Share the conversions of the given data between its destinations, until it's released."""
+        with self._lock:
+            _, count, conversions = self._entries.get(id(data), (data, 0, {}))
+            self._entries[id(data)] = (data, count + 1, conversions)
+
+    def release(self, data: Any) -> None:
+        """Release a registration of the given data, dropping its conversions after the last one."""
+        with self._lock:
+            entry = self._entries.get(id(data))
+            if entry is None:
+                return
+            _, count, conversions = entry
+            if count <= 1:
+                del self._entries[id(data)]
+            else:
+                self._entries[id(data)] = (data, count - 1, conversions)
+
+    def is_shared(self, data: Any) -> bool:
+        """Whether the conversions of the given data are shared between destinations."""
+        with self._lock:
+            return id(data) in self._entries
+
+    def cached(self, data: Any, key: Hashable, convert: Callable[[], R]) -> R:
+        """Convert the data, reusing the result of an equal conversion made for another destination.
+
+        Args:
+            data (Any): The data being converted.
+            key (Hashable): A key that is equal for the conversions that give the same result.
+            convert (Callable[[], R]): The function that converts the data.
+
+        Returns:
+            R: The converted data. When the data is not registered, it's converted every time.
+        """
+        with self._lock:
+            entry = self._entries.get(id(data))
+            if entry is None:
+                future = None
+                owner = True
+            else:
+                conversions = entry[2]
+                future = conversions.get(key)
+                owner = future is None
+                if future is None:
+                    future = conversions[key] = Future()
+        if future is None:
+            return convert()
+        if owner:
+            try:
+                future.set_result(convert())
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+
+_current: ContextVar[Optional[ConversionCache]] = ContextVar("extralo_conversions", default=None)
+
+
+@contextmanager
+def using(cache: Optional[ConversionCache]) -> Generator[None, None, None]:
+    """Make the destinations loaded inside the context share their conversions through the given cache."""
+    token = _current.set(cache)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def is_shared(data: Any) -> bool:
+    """Whether the conversions of the given data are shared between destinations in the current load."""
+    cache = _current.get()
+    return cache is not None and cache.is_shared(data)
+
+
+def cached(data: Any, key: Hashable, convert: Callable[[], R]) -> R:
+    """Convert the data, reusing the result of an equal conversion made for another destination in the current load.
+
+    Args:
+        data (Any): The data being converted.
+        key (Hashable): A key that is equal for the conversions that give the same result.
+        convert (Callable[[], R]): The function that converts the data.
+
+    Returns:
+        R: The converted data. Outside of a load, or when the data is not registered, it's converted every time.
+    """
+    cache = _current.get()
+    if cache is None:
+        return convert()
+    return cache.cached(data, key, convert)
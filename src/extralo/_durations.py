@@ -0,0 +1,111 @@
+import math
+import os
+import threading
+from collections.abc import Sized
+from typing import Any, Literal, Optional
+
+from extralo._store import JSONStore
+
+TaskKind = Literal["extract", "load"]
+
+_SIZE_ATTRIBUTES = ("_file", "_path", "_table_uri")
+
+
+def _path_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(path) for file in files)
+
+
+def source_size(source: object) -> Optional[int]:
+    """Estimate the size of a source from its local file or directory, in bytes, or None when it's unknown."""
+    for attribute in _SIZE_ATTRIBUTES:
+        path = getattr(source, attribute, None)
+        if isinstance(path, (str, os.PathLike)) and os.path.exists(path):
+            return _path_size(os.fspath(path))
+    return None
+
+
+def data_size(data: Any) -> Optional[int]:
+    """Estimate the size of data to be loaded, as its number of records, or None when it's unknown."""
+    if isinstance(data, Sized):
+        return len(data)
+    return None
+
+
+class DurationStore:
+    """The durations of the extract and load tasks in earlier runs, used to start the longest tasks first.
+
+    Tasks without a recorded duration are estimated from their size, using the average time per unit of size of the
+    recorded tasks of the same kind. Tasks that can't be estimated are assumed to be the longest.
+
+    Args:
+        path (str): The path to the JSON file where the durations are kept.
+        smoothing (float, optional): The weight of the newest duration in the recorded average. Defaults to 0.5.
+    """
+
+    def __init__(self, path: str, smoothing: float = 0.5) -> None:
+        self._store = JSONStore(path)
+        self._smoothing = smoothing
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._entries = self._store.read()
+        self._rates = self._compute_rates()
+
+    def estimate(self, kind: TaskKind, key: str, size: Optional[int]) -> float:
+        """Estimate the duration of a task, in seconds.
+
+        Args:
+            kind (Literal["extract", "load"]): The kind of task.
+            key (str): The key that identifies the task across runs.
+            size (Optional[int]): The size of the task, used when no duration was recorded.
+
+        Returns:
+            float: The estimated duration, or infinity when it can't be estimated.
+        """
+        entry = self._entries.get(f"{kind}:{key}")
+        if entry is not None:
+            return entry["seconds"]
+        rate = self._rates.get(kind)
+        if size is None or rate is None:
+            return math.inf
+        return size * rate
+
+    def recorded(self, kind: TaskKind, key: str) -> bool:
+        """Whether a duration was recorded for the task in an earlier run."""
+        return f"{kind}:{key}" in self._entries
+
+    def record(self, kind: TaskKind, key: str, seconds: float, size: Optional[int]) -> None:
+        """Record the duration of a task, to be saved by `flush`."""
+        with self._lock:
+            self._pending[f"{kind}:{key}"] = {"seconds": seconds, "size": size}
+
+    def flush(self) -> None:
+        """Save the recorded durations, averaging them with the ones from earlier runs."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        def update(entries: dict[str, Any]) -> None:
+            for key, entry in pending.items():
+                previous = entries.get(key)
+                seconds, size = entry["seconds"], entry["size"]
+                if previous is not None:
+                    seconds = self._smoothing * seconds + (1 - self._smoothing) * previous["seconds"]
+                    # The size is not computed again for the tasks that already have a duration.
+                    size = previous.get("size") if size is None else size
+                entries[key] = {"seconds": seconds, "size": size}
+
+        self._entries = self._store.update(update)
+        self._rates = self._compute_rates()
+
+    def _compute_rates(self) -> dict[str, float]:
+        seconds: dict[str, float] = {}
+        sizes: dict[str, float] = {}
+        for key, entry in self._entries.items():
+            if entry.get("size"):
+                kind = key.split(":", 1)[0]
+                seconds[kind] = seconds.get(kind, 0.0) + entry["seconds"]
+                sizes[kind] = sizes.get(kind, 0.0) + entry["size"]
+        return {kind: seconds[kind] / sizes[kind] for kind in sizes}
@@ -0,0 +1,97 @@
+import os
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import IO, Any
+
+_thread_locks: dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _lock_handle(handle: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt  # noqa: PLC0415
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+    else:
+        import fcntl  # noqa: PLC0415
+
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_handle(handle: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt  # noqa: PLC0415
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+    else:
+        import fcntl  # noqa: PLC0415
+
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _same_file(handle: IO[Any], path: str) -> bool:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(handle.fileno())
+    return (stat.st_dev, stat.st_ino) == (opened.st_dev, opened.st_ino)
+
+
+def _acquire(path: str) -> IO[Any]:
+    # Another holder may remove the lock file right after we opened it, in which case we locked a file that is no
+    # longer at the path, and must try again with the new one.
+    while True:
+        handle = open(path, "a+b")  # noqa: SIM115
+        try:
+            _lock_handle(handle)
+            if _same_file(handle, path):
+                return handle
+            _unlock_handle(handle)
+        except BaseException:
+            handle.close()
+            raise
+        handle.close()
+
+
+def _release(handle: IO[Any], path: str) -> None:
+    try:
+        if os.name != "nt":
+            os.remove(path)
+        _unlock_handle(handle)
+    finally:
+        handle.close()
+    if os.name == "nt":
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def file_lock(path: str) -> Generator[None, None, None]:
+    """Hold an exclusive lock on the given path, across threads and processes.
+
+    The lock is taken on a `.lock` file next to the path, so the path itself can be replaced while the lock is held.
+    The `.lock` file is removed when the lock is released.
+
+    Args:
+        path (str): The path to lock.
+
+    Yields:
+        None: The lock is held until the context exits.
+    """
+    path = os.path.abspath(path)
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(path, threading.Lock())
+
+    with thread_lock:
+        lock_path = f"{path}.lock"
+        handle = _acquire(lock_path)
+        try:
+            yield
+        finally:
+            _release(handle, lock_path)
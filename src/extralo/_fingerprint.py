@@ -0,0 +1,61 @@
+import hashlib
+import re
+import threading
+from typing import Any, Optional
+
+import pandas as pd
+
+from extralo._store import JSONStore
+
+
+def fingerprint(data: Any) -> Optional[str]:
+    """Compute a digest of the contents of a DataFrame, or None for any other data or unhashable contents."""
+    if not isinstance(data, pd.DataFrame):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in data.dtypes.items()]).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+def destination_key(destination: object) -> str:
+    """The identity of a destination, like its file or table: its repr without memory addresses, or its type."""
+    cls = type(destination)
+    if cls.__repr__ is object.__repr__:
+        return f"{cls.__module__}.{cls.__qualname__}"
+    return re.sub(r" at 0x[0-9a-fA-F]+", "", repr(destination))
+
+
+class FingerprintStore:
+    """The fingerprints of the data last loaded to each destination, used to skip loading unchanged data.
+
+    Args:
+        path (str): The path to the JSON file where the fingerprints are kept.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._store = JSONStore(path)
+        self._lock = threading.Lock()
+        self._pending: dict[str, str] = {}
+        self._fingerprints = self._store.read()
+
+    def unchanged(self, key: str, digest: Optional[str]) -> bool:
+        """Whether the data with the given fingerprint was the last one loaded to the destination with the key."""
+        return digest is not None and self._fingerprints.get(key) == digest
+
+    def record(self, key: str, digest: Optional[str]) -> None:
+        """Record the fingerprint of the data loaded to the destination with the key, to be saved by `flush`."""
+        if digest is None:
+            return
+        with self._lock:
+            self._pending[key] = digest
+
+    def flush(self) -> None:
+        """Save the recorded fingerprints."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            self._fingerprints = self._store.update(lambda fingerprints: fingerprints.update(pending))
@@ -0,0 +1,76 @@
+# type: ignore
+import contextlib
+import os
+import pickle
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from extralo.compaction import memory_usage
+
+_KIND_KEY = b"extralo.kind"
+
+
+def nbytes(data: Any) -> Optional[int]:
+    """Compute the memory used by data that can be written to Arrow IPC files, or None for any other data."""
+    if isinstance(data, pd.DataFrame):
+        return memory_usage(data)
+    if isinstance(data, pa.Table):
+        return data.nbytes
+    return None
+
+
+def write_ipc(data: Any, path: str) -> None:
+    """Write a DataFrame or a pyarrow Table to an Arrow IPC file."""
+    if isinstance(data, pd.DataFrame):
+        table = pa.Table.from_pandas(data)
+        kind = b"pandas"
+    else:
+        table = data
+        kind = b"arrow"
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _KIND_KEY: kind})
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_ipc(path: str) -> Any:
+    """Read an Arrow IPC file written by `write_ipc`, memory-mapping it instead of reading it in memory."""
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    metadata = dict(table.schema.metadata or {})
+    kind = metadata.pop(_KIND_KEY, b"arrow")
+    if kind == b"pandas":
+        # One block per column, so the numeric columns can be used straight from the mapped file.
+        return table.to_pandas(split_blocks=True)
+    return table.replace_schema_metadata(metadata or None)
+
+
+def persist(data: Any, path: str) -> str:
+    """Persist data to an Arrow IPC file when possible, or to a pickle file otherwise.
+
+    Args:
+        data (Any): The data to persist.
+        path (str): The path of the file, without the extension.
+
+    Returns:
+        str: The path of the file written, with the extension.
+    """
+    if nbytes(data) is not None:
+        try:
+            write_ipc(data, f"{path}.arrow")
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(f"{path}.arrow")
+        else:
+            return f"{path}.arrow"
+    with open(f"{path}.pickle", "wb") as file:
+        pickle.dump(data, file)
+    return f"{path}.pickle"
+
+
+def restore(path: str) -> Any:
+    """Read back data persisted by `persist`."""
+    if path.endswith(".arrow"):
+        return read_ipc(path)
+    with open(path, "rb") as file:
+        return pickle.load(file)  # noqa: S301
@@ -0,0 +1,46 @@
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+ARROW_ENABLED = "spark.sql.execution.arrow.pyspark.enabled"
+
+_lock = threading.Lock()
+_active: dict[int, tuple[int, Optional[str]]] = {}
+
+
+@contextmanager
+def arrow_enabled(spark: Any, enabled: bool = True) -> Generator[None, None, None]:
+    """Enable the Arrow-based transfer between pandas and Spark in the session, restoring the previous value after.
+
+    The value is restored only when the last of the concurrent users of the same session exits.
+
+    Args:
+        spark (SparkSession): The Spark session.
+        enabled (bool, optional): Whether to enable the transfer. Defaults to True, and False keeps the session as is.
+
+    Yields:
+        None: The transfer is enabled until the context exits.
+    """
+    if not enabled:
+        yield
+        return
+
+    key = id(spark)
+    with _lock:
+        count, previous = _active.get(key, (0, None))
+        if not count:
+            previous = spark.conf.get(ARROW_ENABLED, None)
+            spark.conf.set(ARROW_ENABLED, "true")
+        _active[key] = (count + 1, previous)
+    try:
+        yield
+    finally:
+        with _lock:
+            count, previous = _active.pop(key)
+            if count > 1:
+                _active[key] = (count - 1, previous)
+            elif previous is None:
+                spark.conf.unset(ARROW_ENABLED)
+            else:
+                spark.conf.set(ARROW_ENABLED, previous)
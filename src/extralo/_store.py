@@ -0,0 +1,43 @@
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+from extralo._filelock import file_lock
+
+
+class JSONStore:
+    """A small JSON file shared by threads and processes, updated under a file lock.
+
+    Args:
+        path (str): The path to the JSON file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def read(self) -> dict[str, Any]:
+        """Read the contents of the store, or an empty dict when it doesn't exist yet."""
+        if not os.path.exists(self._path):
+            return {}
+        with open(self._path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def update(self, update: Callable[[dict[str, Any]], None]) -> dict[str, Any]:
+        """Change the contents of the store in place, without losing concurrent updates.
+
+        Args:
+            update (Callable[[dict[str, Any]], None]): A function that modifies the current contents.
+
+        Returns:
+            dict[str, Any]: The updated contents.
+        """
+        with file_lock(self._path):
+            contents = self.read()
+            update(contents)
+            directory = os.path.dirname(os.path.abspath(self._path))
+            os.makedirs(directory, exist_ok=True)
+            with open(f"{self._path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(contents, file)
+            os.replace(f"{self._path}.tmp", self._path)
+        return contents
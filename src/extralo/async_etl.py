@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, Generic, Literal, Optional, TypeVar, Union
+
+from extralo import _conversion as conversions
+from extralo._cache import source_key
+from extralo.destination import AsyncDestination, Destination
+from extralo.etl import ETL, TransformerFunction, _records, _replayable, _shallow_copy
+from extralo.source import AsyncSource, Source
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from extralo.compaction import DtypeCompaction
+
+T = TypeVar("T")
+
+
+class AsyncSourceAdapter(Generic[T]):
+    """Make a synchronous source awaitable, by extracting the data in a worker thread.
+
+    Args:
+        source (Source): The synchronous source.
+    """
+
+    def __init__(self, source: Source[T]) -> None:
+        self._source = source
+
+    async def extract(self) -> T:
+        """Extracts the data from the source in a worker thread.
+
+        Returns:
+            T: The extracted data.
+        """
+        return await asyncio.to_thread(self._source.extract)
+
+    def __repr__(self) -> str:
+        return repr(self._source)
+
+
+class AsyncDestinationAdapter(Generic[T]):
+    """Make a synchronous destination awaitable, by loading the data in a worker thread.
+
+    Args:
+        destination (Destination): The synchronous destination.
+    """
+
+    def __init__(self, destination: Destination[T]) -> None:
+        self._destination = destination
+
+    async def load(self, data: T) -> None:
+        """Load the given data into the destination in a worker thread.
+
+        Args:
+            data (T): The data to be loaded into the destination.
+        """
+        await asyncio.to_thread(self._destination.load, data)
+
+    def __repr__(self) -> str:
+        return repr(self._destination)
+
+
+def to_async_source(source: Union[Source[T], AsyncSource[T]]) -> AsyncSource[T]:  # noqa: UP007
+    """Return the source itself if it's asynchronous, or wrap it in an `AsyncSourceAdapter` otherwise."""
+    if inspect.iscoroutinefunction(source.extract):
+        return source  # type: ignore
+    return AsyncSourceAdapter(source)  # type: ignore
+
+
+def to_async_destination(destination: Union[Destination[T], AsyncDestination[T]]) -> AsyncDestination[T]:  # noqa: UP007
+    """Return the destination itself if it's asynchronous, or wrap it in an `AsyncDestinationAdapter` otherwise."""
+    if inspect.iscoroutinefunction(destination.load):
+        return destination  # type: ignore
+    return AsyncDestinationAdapter(destination)  # type: ignore
+
+
+class AsyncETL(ETL[T]):
+    """Same as ETL, but runs in an asyncio event loop instead of threads.
+
+    Sources and destinations can be asynchronous, with an `async` `extract` or `load` method, or synchronous, in which
+    case they run in a worker thread with `asyncio.to_thread`. The compaction and the transformer also run in a worker
+    thread, so they don't block the event loop. Many ETLs can be executed concurrently in the same loop, sharing a
+    semaphore to limit the total number of extractions and loads running at the same time. It can also be given to an
+    `ETLRunner`, which executes it in its own event loop.
+
+    Args:
+        sources (dict[str, Union[Source, AsyncSource]]): A dictionary with the sources to extract data from.
+        destinations (dict[str, list[Union[Destination, AsyncDestination]]]): A dictionary with the destinations to
+            load data to.
+        transformer (Callable[..., dict[str, DataFrame]], optional): A transformer to transform the data.
+            No transformation is done by default.
+        name (str, optional): The name of the ETL, used in the logs.
+        columns (Union[dict[str, list[str]], Literal["infer"]], optional): The columns required for each key of the
+            sources. Defaults to None, which reads all columns.
+        compaction (Union[DtypeCompaction, dict[str, DtypeCompaction]], optional): Rules to compact the column types
+            of the extracted DataFrames. Defaults to None, which keeps the types as extracted.
+        max_concurrency (int, optional): The maximum number of extractions and loads running at the same time, when
+            no semaphore is given to `execute`. Defaults to 5.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        sources: dict[str, Union[Source[T], AsyncSource[T]]],  # noqa: UP007
+        destinations: dict[str, list[Union[Destination[T], AsyncDestination[T]]]],  # noqa: UP007
+        transformer: Optional[TransformerFunction[T]] = None,  # noqa: UP045
+        name: Optional[str] = None,  # noqa: UP045
+        columns: Optional[Union[dict[str, list[str]], Literal["infer"]]] = None,  # noqa: UP007, UP045
+        compaction: Optional[Union[DtypeCompaction, dict[str, DtypeCompaction]]] = None,  # noqa: UP007, UP045
+        max_concurrency: int = 5,
+    ) -> None:
+        super().__init__(
+            sources,  # type: ignore
+            destinations,  # type: ignore
+            transformer=transformer,
+            name=name,
+            columns=columns,
+            compaction=compaction,
+        )
+        self._max_concurrency = max_concurrency
+
+    async def execute(self, semaphore: Optional[asyncio.Semaphore] = None) -> None:  # type: ignore[override]  # noqa: UP045
+        """Execute the ETL process.
+
+        Args:
+            semaphore (Optional[asyncio.Semaphore], optional): A semaphore limiting the extractions and loads running
+                at the same time, which can be shared by several ETLs. Defaults to None, which creates one with
+                `max_concurrency`.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self._max_concurrency)
+        self._logger.info(f"Starting ETL process for {self._name}.", status="running")
+        self._logger = self._status_loggers["running"]
+        try:
+            data = await self.extract(semaphore)
+            data = await asyncio.to_thread(self.compact, data)
+            data = await asyncio.to_thread(self._transformed, data)
+            await self._load_async(data, semaphore)
+            await asyncio.to_thread(self._commit_sources)
+        except Exception as e:
+            self._status_loggers["failed"].error(f"Failed to execute ETL process for {self._name}: \n {e}")
+            self._discard_destinations()
+            raise e
+        else:
+            self._status_loggers["success"].success(f"ETL process for {self._name} executed successfully.")
+
+    async def extract(self, semaphore: Optional[asyncio.Semaphore] = None) -> dict[str, T]:  # type: ignore[override]  # noqa: UP045
+        """Extract the data from the provided sources concurrently.
+
+        Equivalent sources, the same object or sources with equal `cache_key`, are extracted only once. The keys after
+        the first get a shallow copy of the DataFrame, which shares its values with the others.
+
+        Args:
+            semaphore (Optional[asyncio.Semaphore], optional): A semaphore limiting the extractions running at the
+                same time. Defaults to None, which creates one with `max_concurrency`.
+
+        Returns:
+            dict[str, DataFrame]: A dictionary with the data extracted from the sources.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self._max_concurrency)
+        keys = {name: source_key(source) for name, source in self._sources.items()}
+        tasks: dict[Hashable, asyncio.Future[T]] = {}
+        for name, source in self._sources.items():
+            if keys[name] not in tasks:
+                tasks[keys[name]] = asyncio.ensure_future(self._extract_async(source, semaphore))
+        extracted = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+        data: dict[str, T] = {}
+        for name in self._sources:
+            value = extracted[keys[name]]
+            duplicate = any(value is other for other in data.values())
+            data[name] = _shallow_copy(value) if duplicate else value
+        return data
+
+    async def load(self, data: dict[str, T], semaphore: Optional[asyncio.Semaphore] = None) -> None:  # type: ignore[override]  # noqa: UP045
+        """Load the data to the provided destinations concurrently.
+
+        Args:
+            data (dict[str, DataFrame]): The data to be loaded. The keys must match the keys of the destinations.
+            semaphore (Optional[asyncio.Semaphore], optional): A semaphore limiting the loads running at the same
+                time. Defaults to None, which creates one with `max_concurrency`.
+        """
+        await self._load_async(dict(data), semaphore or asyncio.Semaphore(self._max_concurrency))
+
+    def _source_keys(self) -> list[Hashable]:  # noqa: PLR6301
+        # The extractions don't go through a shared source cache, so no consumer is registered in it.
+        return []
+
+    async def _extract_async(self, source: Union[Source[T], AsyncSource[T]], semaphore: asyncio.Semaphore) -> T:  # noqa: UP007
+        async with semaphore:
+            self._logger.info(f"Starting extraction for {source}")
+            data = await to_async_source(source).extract()
+            self._logger.info(f"Extracted {_records(data)} from {source}")
+            return data
+
+    async def _load_one(
+        self,
+        data: T,
+        destination: Union[Destination[T], AsyncDestination[T]],  # noqa: UP007
+        semaphore: asyncio.Semaphore,
+        cache: conversions.ConversionCache,
+    ) -> None:
+        async with semaphore:
+            self._logger.info(f"Starting load of {_records(data)} to {destination}")
+            with conversions.using(cache):
+                await to_async_destination(destination).load(data)
+            self._logger.info(f"Loaded {_records(data)} to {destination}")
+
+    async def _load_key(
+        self, data: dict[str, T], name: str, semaphore: asyncio.Semaphore, cache: conversions.ConversionCache
+    ) -> None:
+        # The key is removed from `data` once all of its destinations finish, so it can be freed early, and its
+        # conversions are shared between the destinations. Streams sent to several destinations are read whole.
+        if len(self._destinations[name]) > 1:
+            data[name] = await asyncio.to_thread(_replayable, data[name])
+        cache.register(data[name])
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._load_one(data[name], destination, semaphore, cache)
+                    for destination in self._destinations[name]
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            cache.release(data.pop(name))
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+    async def _load_async(self, data: dict[str, T], semaphore: asyncio.Semaphore) -> None:
+        # The conversions shared between the destinations of each key are dropped with the load.
+        cache = conversions.ConversionCache()
+        results: list[Any] = await asyncio.gather(
+            *(self._load_key(data, name, semaphore, cache) for name in self._destinations), return_exceptions=True
+        )
+        await asyncio.to_thread(self._flush_destinations)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise Exception(f"Failed to load data: {errors[0]}") from errors[0]
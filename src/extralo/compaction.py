@@ -0,0 +1,121 @@
+from typing import Any, Literal, Optional, Union
+
+import pandas as pd
+
+_DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+
+
+def memory_usage(data: pd.DataFrame) -> int:
+    """Compute the memory used by a DataFrame, including the contents of object columns.
+
+    Args:
+        data (DataFrame): The DataFrame to measure.
+
+    Returns:
+        int: The memory used by the DataFrame, in bytes.
+    """
+    return int(data.memory_usage(deep=True).sum())
+
+
+class DtypeCompaction:
+    """Rules to reduce the memory used by a pandas DataFrame by changing the types of its columns.
+
+    Integer columns are downcast to the smallest type that holds their values, low-cardinality text columns are
+    converted to categoricals, the remaining text columns can be converted to Arrow-backed strings, and date-like
+    text columns can be parsed to datetimes.
+
+    Args:
+        downcast (bool, optional): Whether to downcast the integer columns. Defaults to True.
+        downcast_floats (bool, optional): Whether to downcast the float columns to float32, which loses precision.
+            Defaults to False.
+        categorical_threshold (Optional[float], optional): Convert the text columns whose ratio of unique values to
+            rows is at most this value to categoricals. Defaults to 0.5. None disables the conversion.
+        arrow_strings (bool, optional): Whether to convert the remaining text columns to Arrow-backed strings.
+            Defaults to False.
+        parse_dates (Optional[Union[list[str], Literal["infer"]]], optional): The text columns to parse as dates,
+            or "infer" to parse the text columns whose values all start with a full date, like "2024-05-05" or
+            "2024-05-05T10:00". Defaults to None.
+        columns (Optional[list[str]], optional): The columns to compact. Defaults to None, which compacts all
+            columns.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        downcast: bool = True,
+        downcast_floats: bool = False,
+        categorical_threshold: Optional[float] = 0.5,
+        arrow_strings: bool = False,
+        parse_dates: Optional[Union[list[str], Literal["infer"]]] = None,
+        columns: Optional[list[str]] = None,
+    ) -> None:
+        self._downcast = downcast
+        self._downcast_floats = downcast_floats
+        self._categorical_threshold = categorical_threshold
+        self._arrow_strings = arrow_strings
+        self._parse_dates = parse_dates
+        self._columns = columns
+
+    def compact(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Compact the types of the columns of the given DataFrame.
+
+        Args:
+            data (DataFrame): The DataFrame to compact.
+
+        Returns:
+            DataFrame: A DataFrame with the same values and more compact column types.
+        """
+        compacted = data.copy(deep=False)
+        for position, column in enumerate(data.columns):
+            if self._columns is None or column in self._columns:
+                compacted.isetitem(position, self._compact_column(column, data.iloc[:, position]))
+        return compacted
+
+    def _compact_column(self, name: Any, column: pd.Series) -> pd.Series:
+        kind = column.dtype.kind
+        if kind in "iu" and self._downcast:
+            return pd.to_numeric(column, downcast="unsigned" if column.min() >= 0 else "integer")
+        if kind == "f" and self._downcast_floats:
+            return pd.to_numeric(column, downcast="float")
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return column
+        if pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            return self._compact_text(name, column)
+        return column
+
+    def _compact_text(self, name: Any, column: pd.Series) -> pd.Series:
+        if self._parse_dates == "infer" or (self._parse_dates is not None and name in self._parse_dates):
+            dates = self._to_datetime(column, strict=self._parse_dates != "infer")
+            if dates is not None:
+                return dates
+
+        if self._categorical_threshold is not None and len(column):
+            try:
+                unique = column.nunique(dropna=True)
+            except TypeError:
+                # Columns holding unhashable values, like lists or dicts, are left as they are.
+                return column
+            if unique / len(column) <= self._categorical_threshold:
+                return column.astype("category")
+        if self._arrow_strings:
+            return column.astype("string[pyarrow]")
+        return column
+
+    @staticmethod
+    def _to_datetime(column: pd.Series, strict: bool) -> Optional[pd.Series]:
+        values = column.dropna()
+        if not len(values) or not all(isinstance(value, str) for value in values.head(100)):
+            if strict:
+                raise ValueError(f"Column '{column.name}' does not hold dates as text")
+            return None
+        if not strict and not values.str.match(_DATE_PATTERN).all():
+            # Only full dates with separators are inferred, so codes like "2001" are kept as text.
+            return None
+        try:
+            return pd.to_datetime(column, format="ISO8601")
+        except (ValueError, TypeError):
+            if strict:
+                raise
+            return None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(downcast={self._downcast}, parse_dates={self._parse_dates})"
@@ -13,3 +13,15 @@ class Destination(Generic[T_contra], Protocol):
             data (T_contra): The data to be loaded into the destination.
         """
         ...
+
+
+class AsyncDestination(Generic[T_contra], Protocol):
+    """Generic protocol for a destination that loads data to somewhere without blocking the event loop."""
+
+    async def load(self, data: T_contra) -> None:
+        """Load the given data into the destination.
+
+        Args:
+            data (T_contra): The data to be loaded into the destination.
+        """
+        ...
@@ -1,12 +1,22 @@
-from .delta_lake import DeltaLakeDestination, SparkDeltaLakeDestination
+from .delta_lake import (
+    ArrowDeltaLakeDestination,
+    DeltaLakeDestination,
+    DeltaLakeMaintenance,
+    SparkDeltaLakeDestination,
+)
 from .file import (
     CSVAppendDestination,
     CSVDestination,
     JSONDestination,
+    JSONLinesDestination,
     JSONObjDestination,
+    JSONObjStreamDestination,
     XLSXAppendDestination,
     XLSXDestination,
+    XLSXSheetDestination,
+    XLSXWorkbookDestination,
 )
+from .parquet import ParquetDestination
 from .sql import SQLAppendDestination, SQLDestination
 
 __all__ = [
@@ -15,9 +25,16 @@ __all__ = [
     "CSVAppendDestination",
     "XLSXAppendDestination",
     "XLSXDestination",
+    "XLSXWorkbookDestination",
+    "XLSXSheetDestination",
     "SQLAppendDestination",
     "DeltaLakeDestination",
+    "ArrowDeltaLakeDestination",
+    "DeltaLakeMaintenance",
     "SparkDeltaLakeDestination",
     "JSONDestination",
     "JSONObjDestination",
+    "JSONLinesDestination",
+    "JSONObjStreamDestination",
+    "ParquetDestination",
 ]
@@ -3,25 +3,150 @@ from typing import Any, Literal, Optional, Union
 
 import pandas as pd
 
+from extralo._conversion import cached
+from extralo._spark import arrow_enabled
+
+_MAINTENANCE_OPERATIONS = {"OPTIMIZE", "VACUUM START", "VACUUM END"}
+
+
+def _writes_since(table: Any, operation: str, limit: int) -> int:
+    writes = 0
+    for commit in table.history(limit):
+        if commit.get("operation") == operation:
+            break
+        if commit.get("operation") not in _MAINTENANCE_OPERATIONS:
+            writes += 1
+    return writes
+
+
+class DeltaLakeMaintenance:
+    """A maintenance policy for a Delta Lake table, run by `DeltaLakeDestination` after each load.
+
+    The table is compacted (or Z-ordered, when `z_order` is given) when any of the compaction policies is met, and
+    vacuumed every `vacuum_every` writes. The writes are counted from the table history, so the policies work across
+    runs and across destinations writing to the same table.
+
+    Args:
+        optimize_every (Optional[int], optional): Compact the table after this many writes since the last
+            compaction. Defaults to None.
+        max_small_files (Optional[int], optional): Compact the table when it has more than this many files smaller
+            than `small_file_size`. Defaults to None.
+        small_file_size (int, optional): The size in bytes below which a file is considered small.
+            Defaults to 32 MiB.
+        target_size (Optional[int], optional): The target size in bytes of the compacted files. Defaults to None,
+            which uses the table configuration.
+        z_order (Optional[list[str]], optional): Z-order the table on these columns instead of just compacting it.
+            Defaults to None.
+        vacuum_every (Optional[int], optional): Vacuum the table after this many writes since the last vacuum.
+            Defaults to None.
+        vacuum_retention_hours (Optional[int], optional): The retention of the removed files when vacuuming.
+            Defaults to None, which uses the table configuration.
+        enforce_retention_duration (bool, optional): Whether to refuse to vacuum with a retention shorter than the
+            table configuration. Defaults to True.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        optimize_every: Optional[int] = None,
+        max_small_files: Optional[int] = None,
+        small_file_size: int = 32 * 1024 * 1024,
+        target_size: Optional[int] = None,
+        z_order: Optional[list[str]] = None,
+        vacuum_every: Optional[int] = None,
+        vacuum_retention_hours: Optional[int] = None,
+        enforce_retention_duration: bool = True,
+    ) -> None:
+        self._optimize_every = optimize_every
+        self._max_small_files = max_small_files
+        self._small_file_size = small_file_size
+        self._target_size = target_size
+        self._z_order = z_order
+        self._vacuum_every = vacuum_every
+        self._vacuum_retention_hours = vacuum_retention_hours
+        self._enforce_retention_duration = enforce_retention_duration
+
+    def run(self, table_uri: str, storage_options: Optional[dict[str, str]] = None) -> None:
+        """Run the maintenance steps whose policies are met.
+
+        Args:
+            table_uri (str): The path to the Delta Lake table.
+            storage_options (Optional[dict[str, str]], optional): The options of the storage backend, like the
+                credentials of a cloud storage. Defaults to None.
+        """
+        import deltalake as dl  # noqa: PLC0415
+
+        table = dl.DeltaTable(table_uri, storage_options=storage_options)
+        if self._should_optimize(table):
+            if self._z_order:
+                table.optimize.z_order(self._z_order, target_size=self._target_size)
+            else:
+                table.optimize.compact(target_size=self._target_size)
+
+        if self._vacuum_every and _writes_since(table, "VACUUM END", self._vacuum_every * 3) >= self._vacuum_every:
+            table.vacuum(
+                retention_hours=self._vacuum_retention_hours,
+                dry_run=False,
+                enforce_retention_duration=self._enforce_retention_duration,
+            )
+
+    def _should_optimize(self, table: Any) -> bool:
+        if self._optimize_every and _writes_since(table, "OPTIMIZE", self._optimize_every * 3) >= self._optimize_every:
+            return True
+        if self._max_small_files is not None:
+            import pyarrow as pa  # noqa: PLC0415
+            import pyarrow.compute as pc  # noqa: PLC0415
+
+            sizes = pa.table(table.get_add_actions(flatten=True)).column("size_bytes")
+            return pc.sum(pc.less(sizes, self._small_file_size)).as_py() > self._max_small_files
+        return False
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(optimize_every={self._optimize_every}, "
+            f"max_small_files={self._max_small_files}, vacuum_every={self._vacuum_every})"
+        )
+
 
 class DeltaLakeDestination:
     """A destination class for saving data to a Delta Lake table.
 
+    Besides the modes of `write_deltalake`, the "merge" mode upserts the data using the Delta merge API, keyed on the
+    `merge_on` columns: matched rows are updated, unmatched rows are inserted and, optionally, the rows of the table
+    without a match in the data are deleted. Only the files with affected rows are rewritten. If the table does not
+    exist yet, it is created with the data.
+
     Args:
         table_uri (str): The path to the Delta Lake table.
-        **kwargs: Additional keyword arguments to be passed to the save function.
+        mode (Literal["error", "append", "overwrite", "ignore", "merge"]): The mode for writing data.
+        merge_on (Optional[list[str]], optional): The columns that identify a row, required by the "merge" mode.
+            Defaults to None.
+        delete_unmatched (bool, optional): Whether the "merge" mode deletes the rows of the table that are not in
+            the data. Defaults to False.
+        target_file_size (Optional[int], optional): The target size in bytes of the written files.
+            Defaults to None, which uses the table configuration.
+        max_row_group_size (Optional[int], optional): The maximum number of rows in each row group of the written
+            files. Defaults to None.
+        maintenance (Optional[DeltaLakeMaintenance], optional): The maintenance policy to run after each load.
+            Defaults to None.
+        **kwargs: Additional keyword arguments to be passed to the save function. The `storage_options` are also
+            used by the merge and the maintenance.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         table_uri: str,
-        mode: Literal["error", "append", "overwrite", "ignore"],
+        mode: Literal["error", "append", "overwrite", "ignore", "merge"],
         partition_by: Optional[Union[list[str], str]] = None,
         schema: Optional[Any] = None,
+        merge_on: Optional[list[str]] = None,
+        delete_unmatched: bool = False,
+        target_file_size: Optional[int] = None,
+        max_row_group_size: Optional[int] = None,
+        maintenance: Optional[DeltaLakeMaintenance] = None,
         **kwargs: Any,
     ) -> None:
         try:
-            import deltalake  # noqa: F401, PLC0415
+            import deltalake  # noqa: PLC0415
         except ImportError as err:
             raise ImportError(
                 "DeltaLake is required to use DeltaLakeDestination. Please install it with `pip install deltalake`."
@@ -31,6 +156,17 @@ class DeltaLakeDestination:
         self._partition_by = partition_by
         self._kwargs = kwargs
         self._schema = schema
+        self._maintenance = maintenance
+        if mode == "merge" and not merge_on:
+            raise ValueError("merge_on is required when mode is 'merge'")
+        self._merge_on = merge_on
+        self._delete_unmatched = delete_unmatched
+        if target_file_size is not None:
+            self._kwargs["target_file_size"] = target_file_size
+        if max_row_group_size is not None:
+            if "writer_properties" in kwargs:
+                raise ValueError("Use either max_row_group_size or writer_properties, not both")
+            self._kwargs["writer_properties"] = deltalake.WriterProperties(max_row_group_size=max_row_group_size)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(table={self._table_uri}, mode={self._mode})"
@@ -41,16 +177,83 @@ class DeltaLakeDestination:
         Args:
             data (DataFrame): The DataFrame to be loaded.
         """
-        import deltalake as dl  # noqa: PLC0415
+        self._write(self._convert(data))
 
+    def _convert(self, data: pd.DataFrame) -> Any:
         if self._schema:
             import pyarrow as pa
 
-            data = pa.Table.from_pandas(data).cast(self._schema)
+            schema = self._schema
+            data = cached(data, ("arrow", schema), lambda: pa.Table.from_pandas(data).cast(schema))
+        return data
+
+    def _write(self, data: Any) -> None:
+        import deltalake as dl  # noqa: PLC0415
+
+        storage_options = self._kwargs.get("storage_options")
+        if self._mode == "merge" and dl.DeltaTable.is_deltatable(self._table_uri, storage_options=storage_options):
+            self._merge(data)
+        else:
+            mode = "append" if self._mode == "merge" else self._mode
+            dl.write_deltalake(
+                table_or_uri=self._table_uri, data=data, mode=mode, partition_by=self._partition_by, **self._kwargs
+            )
+        if self._maintenance is not None:
+            self._maintenance.run(self._table_uri, storage_options=storage_options)
 
-        dl.write_deltalake(
-            table_or_uri=self._table_uri, data=data, mode=self._mode, partition_by=self._partition_by, **self._kwargs
+    def _merge(self, data: Any) -> None:
+        import deltalake as dl  # noqa: PLC0415
+        import pyarrow as pa  # noqa: PLC0415
+
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+
+        predicate = " AND ".join(f"target.`{column}` = source.`{column}`" for column in self._merge_on)
+        merger = (
+            dl.DeltaTable(self._table_uri, storage_options=self._kwargs.get("storage_options"))
+            .merge(
+                data,
+                predicate,
+                source_alias="source",
+                target_alias="target",
+                writer_properties=self._kwargs.get("writer_properties"),
+            )
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
         )
+        if self._delete_unmatched:
+            merger = merger.when_not_matched_by_source_delete()
+        merger.execute()
+
+
+class ArrowDeltaLakeDestination(DeltaLakeDestination):
+    """A destination class for saving Arrow data to a Delta Lake table, without converting it from pandas.
+
+    A `RecordBatchReader` is streamed into the table, so the whole data never needs to be in memory at once. When a
+    schema is given, each batch is cast to it as it is written.
+
+    Args:
+        table_uri (str): The path to the Delta Lake table.
+        **kwargs: Additional keyword arguments to be passed to the save function.
+    """
+
+    def load(self, data: Union["pa.Table", "pa.RecordBatchReader"]) -> None:  # noqa: F821
+        """Loads the given Arrow data into the Delta Lake table.
+
+        Args:
+            data (Union[Table, RecordBatchReader]): The Arrow data to be loaded.
+        """
+        self._write(self._convert(data))
+
+    def _convert(self, data: Any) -> Any:
+        if not self._schema:
+            return data
+
+        import pyarrow as pa  # noqa: PLC0415
+
+        if isinstance(data, pa.RecordBatchReader):
+            return pa.RecordBatchReader.from_batches(self._schema, (batch.cast(self._schema) for batch in data))
+        return data.cast(self._schema)
 
 
 class SparkDeltaLakeDestination:
@@ -62,6 +265,13 @@ class SparkDeltaLakeDestination:
         mode (Literal["error", "append", "overwrite", "ignore"]): The mode for writing data.
         partition_by (Optional[Union[list[str], str]]): Columns to partition the data by.
         replace_where (Optional[str]): SQL condition to replace data that matches the condition.
+        arrow (bool, optional): Whether to enable the Arrow-based transfer from pandas to Spark in the session
+            during the load, instead of transferring the rows one by one. The previous setting of the session is
+            restored after the load. Defaults to True.
+        chunksize (Optional[int], optional): Write the pandas data in chunks of this many rows, one after the other,
+            the first one with `mode` and the others appended, so that only one chunk is converted to Spark at a
+            time. A failed load can leave only some of the chunks written. Defaults to None, which writes the data
+            at once.
         **kwargs: Additional keyword arguments to be passed to the save function.
     """
 
@@ -73,6 +283,8 @@ class SparkDeltaLakeDestination:
         partition_by: Optional[Union[list[str], str]] = None,
         replace_where: Optional[str] = None,
         schema=None,
+        arrow: bool = True,
+        chunksize: Optional[int] = None,
         **kwargs: Any,
     ):
         self._spark = spark
@@ -82,6 +294,8 @@ class SparkDeltaLakeDestination:
         self._replace_where = replace_where or "true"
         self._kwargs = kwargs
         self._schema = schema
+        self._arrow = arrow
+        self._chunksize = chunksize
 
     def load(self, data: pd.DataFrame):
         """Loads the provided data into the Delta Lake table.
@@ -89,13 +303,28 @@ class SparkDeltaLakeDestination:
         Args:
             data (DataFrame): The data to be loaded into the Delta Lake table.
         """
-        df = self._spark.createDataFrame(data, schema=self._schema)
+        with arrow_enabled(self._spark, self._arrow):
+            if not self._chunksize or len(data) <= self._chunksize:
+                key = ("spark", self._spark, repr(self._schema))
+                self._save(
+                    cached(data, key, lambda: self._spark.createDataFrame(data, schema=self._schema)), self._mode
+                )
+                return
+
+            if self._mode == "ignore" and self._spark.catalog.tableExists(self._table):
+                return
+            for start in range(0, len(data), self._chunksize):
+                chunk = self._spark.createDataFrame(data.iloc[start : start + self._chunksize], schema=self._schema)
+                self._save(chunk, self._mode if not start else "append")
+
+    def _save(self, df: Any, mode: str) -> None:
+        options = {"replaceWhere": self._replace_where} if mode == "overwrite" else {}
         df.write.saveAsTable(
             self._table,
-            replaceWhere=self._replace_where,
-            mode=self._mode,
+            mode=mode,
             partitionBy=self._partition_by,
             format="delta",
+            **options,
             **self._kwargs,
         )
 
@@ -1,10 +1,89 @@
+import gzip
+import io
 import json
 import os.path
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Literal, Optional
+from collections.abc import Callable, Generator, Iterable
+from contextlib import ExitStack, contextmanager
+from typing import IO, Any, Literal, Optional, Union
 
 import pandas as pd
 
+from extralo._conversion import cached, is_shared
+from extralo._filelock import file_lock
+
+_COMPRESSED_SUFFIXES = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar")
+# The codecs of the compressed suffixes, like pandas infers them. The tar suffixes come first, since they may end
+# with the suffix of another codec.
+_SUFFIX_CODECS = {
+    ".tar.gz": "tar",
+    ".tar.bz2": "tar",
+    ".tar.xz": "tar",
+    ".tar": "tar",
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".zip": "zip",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+
+def _infer_compression(file: str) -> Optional[str]:
+    name = os.fspath(file).lower()
+    return next((codec for suffix, codec in _SUFFIX_CODECS.items() if name.endswith(suffix)), None)
+
+
+@contextmanager
+def _open_text(
+    file: str,
+    mode: Literal["w", "a"],
+    compression: Optional[Literal["gzip", "zstd"]] = None,
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    encoding: str = "utf-8",
+) -> Generator[IO[str], None, None]:
+    if compression not in {None, "gzip", "zstd"}:
+        raise ValueError(f"Unsupported compression '{compression}'. Use 'gzip' or 'zstd'.")
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401, PLC0415
+        except ImportError as err:
+            raise ImportError(
+                "zstandard is required to use zstd compression. Please install it with `pip install zstandard`."
+            ) from err
+
+    with ExitStack() as stack:
+        stream: IO[bytes] = stack.enter_context(open(file, f"{mode}b", buffering=buffer_size))
+        if compression == "gzip":
+            stream = stack.enter_context(gzip.GzipFile(fileobj=stream, mode=f"{mode}b"))
+        elif compression == "zstd":
+            import zstandard  # noqa: PLC0415
+
+            stream = stack.enter_context(zstandard.ZstdCompressor().stream_writer(stream, closefd=False))
+        yield stack.enter_context(io.TextIOWrapper(stream, encoding=encoding, newline=""))  # type: ignore
+
+
+def _is_plain_file(file: str, kwargs: dict[str, Any]) -> bool:
+    if not isinstance(file, (str, os.PathLike)) or "storage_options" in kwargs:
+        return False
+    compression = kwargs.get("compression", "infer")
+    if compression == "infer":
+        return not os.fspath(file).lower().endswith(_COMPRESSED_SUFFIXES)
+    return compression is None
+
+
+def _write_payload(file: str, kwargs: dict[str, Any], data: pd.DataFrame, serialize: Callable[..., str]) -> bool:
+    # The payload is serialized once for all the destinations that share the data during a load. Compressed or
+    # remote files are left to pandas, returning False.
+    if not is_shared(data) or not _is_plain_file(file, kwargs):
+        return False
+
+    options = {key: value for key, value in kwargs.items() if key not in {"mode", "encoding", "compression"}}
+    payload = cached(data, (serialize.__name__, repr(sorted(options.items()))), lambda: serialize(**options))
+    with open(file, kwargs.get("mode", "w"), encoding=kwargs.get("encoding", "utf-8"), newline="") as handle:
+        handle.write(payload)
+    return True
+
 
 class FileDestination(ABC):
     """Represents a destination that writes data to a file.
@@ -42,7 +121,8 @@ class CSVDestination(FileDestination):
         Args:
             data (DataFrame): The DataFrame to be saved.
         """
-        data.to_csv(self._file, **self._kwargs)
+        if not _write_payload(self._file, self._kwargs, data, data.to_csv):
+            data.to_csv(self._file, **self._kwargs)
 
 
 class XLSXDestination(FileDestination):
@@ -62,7 +142,8 @@ class XLSXDestination(FileDestination):
 class XLSXAppendDestination(FileDestination):
     """A destination class for appending data to a XLSX file.
 
-    This class cannot be used with the parallel ETL.
+    This class cannot be used with the parallel ETL. To write several sheets of the same file from the parallel ETL,
+    use `XLSXWorkbookDestination` instead.
     """
 
     def __init__(
@@ -89,22 +170,177 @@ class XLSXAppendDestination(FileDestination):
         return f"{self.__class__.__name__}(file={self._file}, mode={self._mode})"
 
 
-class CSVAppendDestination(FileDestination):
-    """A destination class for appending data to a CSV file."""
+class XLSXWorkbookDestination:
+    """A group of destinations that write several sheets of the same XLSX file at once.
+
+    Each call to `sheet` returns a destination for one sheet. The frames loaded to the sheet destinations are
+    collected, and the workbook is written exactly once, when the last sheet destination of the group receives its
+    data, or when the ETL flushes its destinations at the end of the load. Only some sheets are loaded when the others
+    are skipped, like the unchanged ones with `fingerprints_file` or the ones loaded before a `resume`: these sheets
+    then replace their own sheets in the existing file, keeping the others. The collection is protected by a lock, so
+    the sheet destinations can be used with the parallel ETL.
+
+    Args:
+        file (str): The path to the file.
+        mode (Literal["w", "a"], optional): Whether to overwrite the file or to add the sheets to an existing file.
+            Defaults to "w".
+        if_sheet_exists (Optional[Literal["error", "new", "replace", "overlay"]], optional): What to do if a sheet
+            already exists when using mode "a". Defaults to None.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        mode: Literal["w", "a"] = "w",
+        if_sheet_exists: Optional[Literal["error", "new", "replace", "overlay"]] = None,
+    ) -> None:
+        self._file = file
+        self._mode: Literal["w", "a"] = mode
+        self._if_sheet_exists: Optional[Literal["error", "new", "replace", "overlay"]] = if_sheet_exists
+        self._sheets: dict[str, dict[str, Any]] = {}
+        self._pending: dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def sheet(self, sheet_name: str, **kwargs: Any) -> "XLSXSheetDestination":
+        """Create a destination for a single sheet of this workbook.
+
+        Args:
+            sheet_name (str): The name of the sheet.
+            **kwargs: Additional keyword arguments to be passed to `DataFrame.to_excel`.
+
+        Returns:
+            XLSXSheetDestination: A destination that writes the data to the given sheet.
+
+        Raises:
+            ValueError: If the sheet was already added to the workbook.
+        """
+        with self._lock:
+            if sheet_name in self._sheets:
+                raise ValueError(f"Sheet '{sheet_name}' was already added to {self}")
+            self._sheets[sheet_name] = kwargs
+        return XLSXSheetDestination(self, sheet_name)
+
+    def _collect(self, sheet_name: str, data: pd.DataFrame) -> None:
+        with self._lock:
+            self._pending[sheet_name] = data
+            if len(self._pending) < len(self._sheets):
+                return
+            self._write()
+
+    def _flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._write()
+
+    def _write(self) -> None:
+        # Called with the lock held. A part of the sheets replaces its sheets in the existing file.
+        pending, self._pending = self._pending, {}
+        mode, if_sheet_exists = self._mode, self._if_sheet_exists
+        if len(pending) < len(self._sheets) and mode == "w" and os.path.isfile(self._file):
+            mode, if_sheet_exists = "a", "replace"
+        with pd.ExcelWriter(self._file, mode=mode, if_sheet_exists=if_sheet_exists) as writer:
+            for name, frame in pending.items():
+                frame.to_excel(writer, sheet_name=name, **self._sheets[name])  # type: ignore
+
+    def _discard(self, sheet_name: str) -> None:
+        with self._lock:
+            self._pending.pop(sheet_name, None)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(file={self._file}, mode={self._mode})"
+
+
+class XLSXSheetDestination:
+    """A destination for a single sheet of a workbook, created by `XLSXWorkbookDestination.sheet`.
+
+    Args:
+        workbook (XLSXWorkbookDestination): The workbook that writes the file.
+        sheet_name (str): The name of the sheet.
+    """
+
+    def __init__(self, workbook: XLSXWorkbookDestination, sheet_name: str) -> None:
+        self._workbook = workbook
+        self._sheet_name = sheet_name
 
     def load(self, data: pd.DataFrame) -> None:
+        """Add the given pandas DataFrame to the workbook.
+
+        The file is written when the last sheet of the workbook is loaded.
+
+        Args:
+            data (DataFrame): The DataFrame to be saved.
+        """
+        self._workbook._collect(self._sheet_name, data)
+
+    def flush(self) -> None:
+        """Write the sheets collected so far, when the sheets of the other destinations were not loaded."""
+        self._workbook._flush()
+
+    def discard(self) -> None:
+        """Drop the data of the sheet if the workbook was not written yet, like after a failed execution."""
+        self._workbook._discard(self._sheet_name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(file={self._workbook._file}, sheet_name={self._sheet_name})"
+
+
+class CSVAppendDestination(FileDestination):
+    """A destination class for appending data to a CSV file.
+
+    The appends are protected by a lock on the file, shared between threads and processes, so several destinations
+    can append to the same file at the same time without racing on the header or interleaving rows.
+
+    Args:
+        file (str): The path to the file.
+        compression (Optional[Union[str, dict[str, Any]]], optional): The compression of the file. The gzip and zstd
+            codecs are streamed, appending a new gzip member or zstd frame; any other codec is handed to pandas. Using
+            zstd requires the `zstandard` package. Defaults to "infer", which uses the codec of the file extension,
+            like pandas.
+        buffer_size (int, optional): The size in bytes of the write buffer. Defaults to 1 MiB.
+        **kwargs: Additional keyword arguments to be passed to `DataFrame.to_csv`.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        compression: Optional[Union[str, dict[str, Any]]] = "infer",
+        buffer_size: int = 1024 * 1024,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file, **kwargs)
+        self._compression = _infer_compression(file) if compression == "infer" else compression
+        self._buffer_size = buffer_size
+
+    def load(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
         """Append the given pandas DataFrame to a CSV file.
 
         If the file already exists, it will be appended, and will be assumed that the headers
         are in the same order.
 
         Args:
-            data (DataFrame): The DataFrame to be saved.
+            data (Union[DataFrame, Iterable[DataFrame]]): The DataFrame to be saved, or an iterable of DataFrames
+                to be appended one after the other.
         """
-        if os.path.isfile(self._file):
-            data.to_csv(self._file, mode="a", header=False, **self._kwargs)
-            return
-        data.to_csv(self._file, mode="w", header=True, **self._kwargs)
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        kwargs = {key: value for key, value in self._kwargs.items() if key != "encoding"}
+
+        with file_lock(self._file):
+            header = not os.path.isfile(self._file) or os.path.getsize(self._file) == 0
+            if self._compression not in {None, "gzip", "zstd"}:
+                for chunk in chunks:
+                    chunk.to_csv(self._file, mode="a", header=header, compression=self._compression, **self._kwargs)
+                    header = False
+                return
+            with _open_text(
+                self._file,
+                "a",
+                compression=self._compression,  # type: ignore
+                buffer_size=self._buffer_size,
+                encoding=self._kwargs.get("encoding", "utf-8"),
+            ) as handle:
+                for chunk in chunks:
+                    chunk.to_csv(handle, header=header, **kwargs)
+                    header = False
 
 
 class JSONDestination(FileDestination):
@@ -118,7 +354,59 @@ class JSONDestination(FileDestination):
         Args:
             data (DataFrame): The DataFrame to be saved.
         """
-        data.to_json(self._file, **self._kwargs)  # type: ignore
+        if not _write_payload(self._file, self._kwargs, data, data.to_json):
+            data.to_json(self._file, **self._kwargs)  # type: ignore
+
+
+class JSONLinesDestination(FileDestination):
+    """A destination class for streaming data from pandas Data Frames to a newline-delimited JSON file.
+
+    The data is serialized and written in chunks of rows, optionally compressed, so the whole JSON document is never
+    built in memory.
+
+    Args:
+        file (str): The path to the file.
+        compression (Optional[Literal["gzip", "zstd"]], optional): Compress the file with gzip or zstd. Using zstd
+            requires the `zstandard` package. Defaults to None.
+        chunksize (int, optional): The number of rows serialized at a time. Defaults to 100_000.
+        buffer_size (int, optional): The size in bytes of the write buffer. Defaults to 1 MiB.
+        encoding (str, optional): The encoding of the file. Defaults to "utf-8".
+        **kwargs: Additional keyword arguments to be passed to `DataFrame.to_json`.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        file: str,
+        compression: Optional[Literal["gzip", "zstd"]] = None,
+        chunksize: int = 100_000,
+        buffer_size: int = 1024 * 1024,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file, **kwargs)
+        self._compression: Optional[Literal["gzip", "zstd"]] = compression
+        self._chunksize = chunksize
+        self._buffer_size = buffer_size
+        self._encoding = encoding
+
+    def load(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        """Save the given pandas DataFrame to a newline-delimited JSON file.
+
+        If the file already exists, it will be overwritten.
+
+        Args:
+            data (Union[DataFrame, Iterable[DataFrame]]): The DataFrame to be saved, or an iterable of DataFrames
+                to be written one after the other.
+        """
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        with _open_text(
+            self._file, "w", compression=self._compression, buffer_size=self._buffer_size, encoding=self._encoding
+        ) as handle:
+            for chunk in chunks:
+                for start in range(0, len(chunk), self._chunksize):
+                    chunk.iloc[start : start + self._chunksize].to_json(
+                        handle, orient="records", lines=True, **self._kwargs
+                    )
 
 
 class JSONObjDestination(FileDestination):
@@ -136,3 +424,51 @@ class JSONObjDestination(FileDestination):
         """
         with open(self._file, "w", encoding=self._encoding) as file:
             json.dump(data, fp=file, **self._kwargs)
+
+
+class JSONObjStreamDestination(FileDestination):
+    """A destination class for streaming an iterable of Python Objects to a JSON file.
+
+    Each record is serialized as it is consumed from the iterable, so the whole document is never built in memory.
+    The records are written as a JSON array, or as newline-delimited JSON when `lines` is True.
+
+    Args:
+        file (str): The path to the file.
+        lines (bool, optional): Whether to write one record per line instead of a JSON array. Defaults to False.
+        compression (Optional[Literal["gzip", "zstd"]], optional): Compress the file with gzip or zstd. Using zstd
+            requires the `zstandard` package. Defaults to None.
+        encoding (str, optional): The encoding of the file. Defaults to "utf-8".
+        **kwargs: Additional keyword arguments to be passed to `json.dumps`.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        lines: bool = False,
+        compression: Optional[Literal["gzip", "zstd"]] = None,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file, **kwargs)
+        self._lines = lines
+        self._compression: Optional[Literal["gzip", "zstd"]] = compression
+        self._encoding = encoding
+
+    def load(self, data: Iterable[Any]) -> None:
+        """Save the given records to a JSON file.
+
+        Args:
+            data (Iterable[Any]): The Python Objects to be saved.
+        """
+        with _open_text(self._file, "w", compression=self._compression, encoding=self._encoding) as handle:
+            if self._lines:
+                for record in data:
+                    handle.write(f"{json.dumps(record, **self._kwargs)}\n")
+                return
+
+            handle.write("[")
+            for position, record in enumerate(data):
+                if position:
+                    handle.write(",\n")
+                handle.write(json.dumps(record, **self._kwargs))
+            handle.write("]")
@@ -0,0 +1,159 @@
+# type: ignore
+import os
+import shutil
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, Optional, Union
+from urllib.parse import quote
+
+import pandas as pd
+
+_HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _swap(source: str, target: str, trash: str) -> None:
+    # Replace the target directory with the source one, moving the old target to the trash.
+    source, target, trash = os.path.normpath(source), os.path.normpath(target), os.path.normpath(trash)
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    os.makedirs(os.path.dirname(trash), exist_ok=True)
+    moved = os.path.exists(target)
+    if moved:
+        os.rename(target, trash)
+    try:
+        os.replace(source, target)
+    except OSError:
+        if moved:
+            os.rename(trash, target)
+        raise
+
+
+class ParquetDestination:
+    """A destination class for saving data to a directory of Parquet files.
+
+    Each load writes new files named `part-<uuid>.parquet`. With `partition_by`, the data is split in Hive-style
+    directories, like `col1=2/part-<uuid>.parquet`, and the files of the different partitions are written in
+    parallel. The index of the DataFrame is not written.
+
+    An iterable of DataFrames is streamed to the files one chunk after the other, so the whole data is never in
+    memory at once.
+
+    Args:
+        path (str): The path to the directory.
+        mode (Literal["overwrite", "append"], optional): With "overwrite", the existing files are replaced. When
+            partitioned, only the partitions present in the data are replaced. Defaults to "overwrite".
+        partition_by (Optional[Union[list[str], str]], optional): Columns to partition the data by. Defaults to None.
+        row_group_size (Optional[int], optional): The maximum number of rows in each row group. Defaults to None,
+            which uses the pyarrow default.
+        compression (str, optional): The compression codec. Defaults to "snappy".
+        use_dictionary (Union[bool, list[str]], optional): Whether to use dictionary encoding, for all columns or
+            only for the given ones. Defaults to True.
+        max_workers (Optional[int], optional): The number of threads used to write the partitions.
+            Defaults to None, which uses the `ThreadPoolExecutor` default.
+        **kwargs: Additional keyword arguments to be passed to `pyarrow.parquet.ParquetWriter`.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        path: str,
+        mode: Literal["overwrite", "append"] = "overwrite",
+        partition_by: Optional[Union[list[str], str]] = None,
+        row_group_size: Optional[int] = None,
+        compression: str = "snappy",
+        use_dictionary: Union[bool, list[str]] = True,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            import pyarrow  # noqa: F401, PLC0415
+        except ImportError as err:
+            raise ImportError(
+                "PyArrow is required to use ParquetDestination. Please install it with `pip install pyarrow`."
+            ) from err
+        self._path = path
+        self._mode = mode
+        self._partition_by = [partition_by] if isinstance(partition_by, str) else partition_by
+        self._row_group_size = row_group_size
+        self._compression = compression
+        self._use_dictionary = use_dictionary
+        self._max_workers = max_workers
+        self._kwargs = kwargs
+
+    def load(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        """Save the given DataFrame to Parquet files.
+
+        With "overwrite", the files are written to a temporary directory next to `path` first, and swapped with the
+        existing directory, or the existing partitions, only once all of them were written. A failed write keeps the
+        old data.
+
+        Args:
+            data (Union[DataFrame, Iterable[DataFrame]]): The DataFrame to be saved, or an iterable of DataFrames to
+                be streamed to the files one after the other.
+        """
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        if self._mode != "overwrite":
+            self._write_chunks(chunks, self._path)
+            return
+
+        staging = f"{os.path.normpath(self._path)}.tmp-{uuid.uuid4().hex}"
+        try:
+            os.makedirs(staging)
+            directories = self._write_chunks(chunks, os.path.join(staging, "new"))
+            for directory in directories:
+                _swap(
+                    os.path.join(staging, "new", directory),
+                    os.path.join(self._path, directory),
+                    os.path.join(staging, "old", directory),
+                )
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _write_chunks(self, chunks: Iterable[pd.DataFrame], path: str) -> list[str]:
+        # Write the chunks under the given path, returning the directories written, relative to the path.
+        if not self._partition_by:
+            os.makedirs(path, exist_ok=True)
+            self._write(chunks, path)
+            return [""]
+
+        written: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for chunk in chunks:
+                partitions = {
+                    os.path.join(*self._partition_dirs(key)): group.drop(columns=self._partition_by)
+                    for key, group in chunk.groupby(self._partition_by, dropna=False, sort=False, observed=True)
+                }
+                written.update(partitions)
+                list(executor.map(lambda item: self._write([item[1]], os.path.join(path, item[0])), partitions.items()))
+        return sorted(written)
+
+    def _partition_dirs(self, key: Any) -> list[str]:
+        values = key if isinstance(key, tuple) else (key,)
+        return [
+            f"{column}={_HIVE_NULL_PARTITION if pd.isna(value) else quote(str(value), safe='')}"
+            for column, value in zip(self._partition_by, values)
+        ]
+
+    def _write(self, chunks: Iterable[pd.DataFrame], directory: str) -> None:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    os.makedirs(directory, exist_ok=True)
+                    writer = pq.ParquetWriter(
+                        os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet"),
+                        table.schema,
+                        compression=self._compression,
+                        use_dictionary=self._use_dictionary,
+                        **self._kwargs,
+                    )
+                writer.write_table(table.cast(writer.schema), row_group_size=self._row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._path}, mode={self._mode})"
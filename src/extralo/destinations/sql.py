@@ -84,3 +84,9 @@ class SQLAppendDestination(SQLDestination):
                 conn.execute(stmt)
 
         super().load(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(table={self._table}, schema={self._schema}, "
+            f"group_column={self._group_column}, group_value={self._group_value})"
+        )
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
 import inspect
+import os
+import shutil
+import tempfile
+import threading
+import time
 import warnings
-from collections.abc import Callable, Sized
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Generator, Hashable, Iterator, Sized
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from functools import partial
-from typing import Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Literal, Optional, TypeVar, Union, get_args, get_type_hints
 
 import loguru
 from loguru import logger
 
+from extralo import _conversion as conversions
+from extralo._cache import SourceCache, source_key
+from extralo._durations import DurationStore, TaskKind, data_size, source_size
 from extralo.destination import Destination
-from extralo.source import Source
+from extralo.source import CommittableSource, ProjectableSource, ResumableSource, Source
 
-T = TypeVar("T", bound=Sized)
+if TYPE_CHECKING:
+    from extralo._checkpoint import Checkpoint
+    from extralo._fingerprint import FingerprintStore
+    from extralo.compaction import DtypeCompaction
+    from extralo.transform_cache import TransformCache
+    from extralo.validation import Schema, SchemaValidation
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 TransformerFunction = Callable[..., dict[str, T]]
 
@@ -61,17 +78,159 @@ def _validate_etl(
         _validate_steps(set(sources_keys), "extract", args, "transform")
 
 
+def _schema_columns(annotation: Any) -> Optional[list[str]]:  # noqa: UP045
+    for arg in get_args(annotation):
+        if hasattr(arg, "to_schema"):
+            schema = arg.to_schema()
+            if any(getattr(column, "regex", False) for column in schema.columns.values()):
+                return None
+            return list(schema.columns)
+    return None
+
+
+def _infer_columns(transform_method: Optional[TransformerFunction[T]]) -> dict[str, list[str]]:  # noqa: UP045
+    if transform_method is None:
+        return {}
+
+    try:
+        annotations = get_type_hints(inspect.unwrap(transform_method))
+    except (NameError, TypeError):
+        annotations = inspect.unwrap(transform_method).__annotations__
+
+    columns: dict[str, list[str]] = {}
+    for name, annotation in annotations.items():
+        if name == "return":
+            continue
+        schema_columns = _schema_columns(annotation)
+        if schema_columns is not None:
+            columns[name] = schema_columns
+    return columns
+
+
+def _records(data: object) -> str:
+    if isinstance(data, Sized):
+        return f"{len(data)} records"
+    return "streamed records"
+
+
+def _replayable(data: T) -> T:
+    # A stream, like a pyarrow `RecordBatchReader` or an iterator of DataFrames, can be consumed only once, so it's
+    # read whole when several destinations need it.
+    read_all = getattr(data, "read_all", None)
+    if read_all is not None:
+        return read_all()
+    if isinstance(data, Iterator):
+        return list(data)  # type: ignore
+    return data
+
+
+def _shallow_copy(data: T) -> T:
+    # A new DataFrame sharing the values of the given one, so its columns can be added or replaced independently.
+    # Other data is returned as it is.
+    try:
+        import pandas as pd  # noqa: PLC0415
+    except ImportError:
+        return data
+    return data.copy(deep=False) if isinstance(data, pd.DataFrame) else data  # type: ignore
+
+
+Router = Callable[[object], Optional[Executor]]  # noqa: UP045
+
+
 def _extract(source: Source[T], logger: loguru.Logger) -> T:
     logger.info(f"Starting extraction for {source}")
     data = source.extract()
-    logger.info(f"Extracted {len(data)} records from {source}")
+    logger.info(f"Extracted {_records(data)} from {source}")
     return data
 
 
-def _load(data: T, destination: Destination[T], logger: loguru.Logger) -> None:
-    logger.info(f"Starting load of {len(data)} records to {destination}")
-    destination.load(data)
-    logger.info(f"Loaded {len(data)} records to {destination}")
+def _load(
+    data: T,
+    destination: Destination[T],
+    logger: loguru.Logger,
+    shared: Optional[conversions.ConversionCache] = None,  # noqa: UP045
+) -> None:
+    logger.info(f"Starting load of {_records(data)} to {destination}")
+    with conversions.using(shared):
+        destination.load(data)
+    logger.info(f"Loaded {_records(data)} to {destination}")
+
+
+def _load_spilled(
+    spilled: _SpilledData,
+    destination: Destination[T],
+    logger: loguru.Logger,
+    shared: Optional[conversions.ConversionCache] = None,  # noqa: UP045
+) -> None:
+    _load(spilled.get(), destination, logger, shared)
+
+
+class _SpilledData:
+    """Data spilled to disk, read back once and shared by all of its destinations."""
+
+    def __init__(self, path: str, size: int) -> None:
+        self._path = path
+        self.size = size
+        self._lock = threading.Lock()
+        self._data: Any = None
+
+    def get(self) -> Any:
+        from extralo._ipc import restore  # noqa: PLC0415
+
+        with self._lock:
+            if self._data is None:
+                self._data = restore(self._path)
+            return self._data
+
+    def release(self) -> None:
+        with self._lock:
+            self._data = None
+
+
+def _free(
+    name: str,
+    data: dict[str, Any],
+    cache: conversions.ConversionCache,
+    shared: dict[str, Any],
+    spilled: dict[str, _SpilledData],
+) -> None:
+    # Drop every reference the load holds to the data of a key whose destinations all finished.
+    data.pop(name, None)
+    if name in shared:
+        cache.release(shared.pop(name))
+    if name in spilled:
+        spilled[name].release()
+
+
+class _SpillQueue:
+    """The spilled keys waiting to be loaded, started only when they fit in the memory budget with the data in memory.
+
+    A key is always started when no other data is in memory, so a key larger than the budget still gets loaded.
+    """
+
+    def __init__(
+        self, budget: int, resident: dict[str, int], spilled: dict[str, _SpilledData], order: list[str]
+    ) -> None:
+        self._budget = budget
+        self._resident = resident
+        self._spilled = spilled
+        self._waiting = [name for name in order if name in spilled]
+
+    def admit(self) -> list[str]:
+        """Start as many waiting keys as fit in the budget, in order, returning their names."""
+        started = []
+        while self._waiting:
+            size = self._spilled[self._waiting[0]].size
+            if self._resident and sum(self._resident.values()) + size > self._budget:
+                break
+            name = self._waiting.pop(0)
+            self._resident[name] = size
+            started.append(name)
+        return started
+
+    def done(self, name: str) -> None:
+        """Release the memory of a key whose destinations all finished."""
+        self._resident.pop(name, None)
 
 
 class ETL(Generic[T]):
@@ -100,12 +259,55 @@ class ETL(Generic[T]):
     It's strongly recommended to use Pandera decorators to validate the data in the transform callable.
 
     Args:
-        sources (dict[str, Source]): A dictionary with the sources to extract data from.
+        sources (dict[str, Source]): A dictionary with the sources to extract data from. Equivalent sources, the
+            same object or sources with equal `cache_key`, are extracted only once. The keys after the first get a
+            shallow copy of the DataFrame, so adding or replacing columns in one key doesn't change the others, but
+            the values are shared: the transformer must not modify them in place, like with `df.loc[...] = ...`
+            when pandas' copy-on-write is disabled. Other data, like pyarrow Tables, is given as it is to every key.
         destinations (dict[str, list[Destination]]): A dictionary with the destinations to load data to.
             Each value must be a list of destinations, and the data with that key will be loaded to all the
             destionations provided in the list.
         transformer (Callable[..., dict[str, DataFrame]], optional): A transformer to transform the data.
             No transformation is done by default.
+        name (str, optional): The name of the ETL, used in the logs.
+        columns (Union[dict[str, list[str]], Literal["infer"]], optional): The columns required for each key of the
+            sources. The projection is pushed down to the sources that support it (the ones with a `with_columns`
+            method), so that only these columns are read. With "infer", the columns are taken from the pandera
+            schemas used to annotate the arguments of the transformer. Defaults to None, which reads all columns.
+        compaction (Union[DtypeCompaction, dict[str, DtypeCompaction]], optional): Rules to compact the column types
+            of the extracted DataFrames before the transform step, for every key or for the given keys.
+            Defaults to None, which keeps the types as extracted.
+        memory_budget (int, optional): The memory, in bytes, that the transformed data may use while it is loaded.
+            When the budget is exceeded, the largest DataFrames and pyarrow Tables are spilled to Arrow IPC files
+            and memory-mapped back when their destinations run. Requires pyarrow. Defaults to None, which keeps all
+            the data in memory.
+        spill_dir (str, optional): The directory where the spilled data is written. Defaults to None, which uses the
+            system temporary directory.
+        checkpoint_dir (str, optional): A directory where the extracted and the transformed data are persisted as
+            Arrow IPC files, along with the destinations that already succeeded, so that a failed execution can be
+            continued with `resume`. Streams, like pyarrow `RecordBatchReader`s, are read whole to be persisted.
+            The checkpoint is removed when the execution succeeds. Requires pyarrow. Defaults to None, which doesn't
+            persist anything.
+        durations_file (str, optional): A JSON file where the durations of the extractions and loads are recorded,
+            so that the next runs start the longest ones first. New tasks are estimated from the size of their files
+            or data. The file can be shared by several ETLs, which are told apart by their `name`, so it's required.
+            Defaults to None, which starts the tasks in the order of the dictionaries.
+        fingerprints_file (str, optional): A JSON file where a fingerprint of the data loaded to each destination is
+            kept. When a DataFrame has the same fingerprint as the last one loaded to a destination, the load to that
+            destination is skipped. Only use it when the destinations are not changed by anything else. The file can
+            be shared by several ETLs, which are told apart by their `name`, so it's required. The destinations are
+            told apart by their repr, like the file or the table they write to. Defaults to None, which always loads
+            the data.
+        transform_cache (TransformCache, optional): A cache of the outputs of the transformer. When the transformer
+            and its inputs are the same as in an earlier run, the outputs are read from the cache instead of running
+            the transformer again. Defaults to None, which always runs the transformer.
+        before (dict[str, Schema], optional): The schemas that the extracted data must match, by key, like pandera
+            `DataFrameSchema` or `DataFrameModel`. The data is validated as extracted, before the compaction, so the
+            schemas don't depend on the compacted types. Defaults to None.
+        after (dict[str, Schema], optional): The schemas that the transformed data must match, by key. The data is
+            validated before the load step. Defaults to None.
+        validation (SchemaValidation, optional): How the data is validated against the schemas, in chunks or only a
+            sample of the rows. Defaults to None, which validates all rows, in chunks of 1_000_000 rows.
     """
 
     def __init__(  # noqa: PLR0913, PLR0917
@@ -114,8 +316,25 @@ class ETL(Generic[T]):
         destinations: dict[str, list[Destination[T]]],
         transformer: Optional[TransformerFunction[T]] = None,  # noqa: UP045
         name: Optional[str] = None,  # noqa: UP045
+        columns: Optional[Union[dict[str, list[str]], Literal["infer"]]] = None,  # noqa: UP007, UP045
+        compaction: Optional[Union[DtypeCompaction, dict[str, DtypeCompaction]]] = None,  # noqa: UP007, UP045
+        memory_budget: Optional[int] = None,  # noqa: UP045
+        spill_dir: Optional[str] = None,  # noqa: UP045
+        checkpoint_dir: Optional[str] = None,  # noqa: UP045
+        durations_file: Optional[str] = None,  # noqa: UP045
+        fingerprints_file: Optional[str] = None,  # noqa: UP045
+        transform_cache: Optional[TransformCache] = None,  # noqa: UP045
+        before: Optional[dict[str, Schema]] = None,  # noqa: UP045
+        after: Optional[dict[str, Schema]] = None,  # noqa: UP045
+        validation: Optional[SchemaValidation] = None,  # noqa: UP045
     ) -> None:
         self._logger = logger.bind(etl_name=name, status="pending")
+        self._status_loggers = {
+            status: logger.bind(etl_name=name, status=status) for status in ("running", "failed", "success")
+        }
+        self._executor: Optional[Executor] = None  # noqa: UP045
+        self._router: Optional[Router] = None  # noqa: UP045
+        self._source_cache: Optional[SourceCache] = None  # noqa: UP045
 
         with warnings.catch_warnings(record=True) as warns:
             warnings.simplefilter("always")
@@ -127,53 +346,243 @@ class ETL(Generic[T]):
         for warn in warns:
             self._logger.warning(warn.message)
 
-        self._sources = sources
+        if columns == "infer":
+            columns = _infer_columns(transformer)
+        self._sources = self._project_sources(sources, columns or {})
         self._destinations = destinations
         self._transformer = transformer
         self._name = name
+        self._compaction = compaction
+        if memory_budget is not None or checkpoint_dir is not None:
+            try:
+                import pyarrow  # noqa: F401, PLC0415
+            except ImportError as err:
+                raise ImportError(
+                    "PyArrow is required to use a memory budget or a checkpoint. "
+                    "Please install it with `pip install pyarrow`."
+                ) from err
+        self._memory_budget = memory_budget
+        self._spill_dir = spill_dir
+        self._checkpoint: Optional[Checkpoint] = None  # noqa: UP045
+        if checkpoint_dir is not None:
+            from extralo._checkpoint import Checkpoint  # noqa: PLC0415
+
+            self._checkpoint = Checkpoint(checkpoint_dir)
+        if durations_file is not None and name is None:
+            raise ValueError("A name is required to record durations, since they are kept by the name of the ETL.")
+        self._durations = DurationStore(durations_file) if durations_file is not None else None
+        self._fingerprints: Optional[FingerprintStore] = None  # noqa: UP045
+        if fingerprints_file is not None:
+            if name is None:
+                raise ValueError(
+                    "A name is required to record fingerprints, since they are kept by the name of the ETL."
+                )
+            from extralo._fingerprint import FingerprintStore  # noqa: PLC0415
+
+            self._fingerprints = FingerprintStore(fingerprints_file)
+        self._transform_cache = transform_cache
+        unknown = (before or {}).keys() - sources.keys()
+        if unknown:
+            raise KeyError(f"Before schemas were given for {unknown}, but there are no sources with these keys")
+        self._before = before or {}
+        self._after = after or {}
+        self._validation = validation
+
+    def _project_sources(self, sources: dict[str, Source[T]], columns: dict[str, list[str]]) -> dict[str, Source[T]]:
+        projected = dict(sources)
+        for name, source_columns in columns.items():
+            if name not in projected:
+                raise KeyError(f"Columns were given for '{name}', but there is no source with this key")
+            source = projected[name]
+            if not isinstance(source, ProjectableSource):
+                self._logger.warning(f"{source} does not support column projection, all columns will be read.")
+                continue
+            projected[name] = source.with_columns(source_columns)
+        return projected
 
     def execute(self) -> None:
         """Execute the ETL process.
 
         Extract the data from the sources, validate it against the before schemas, transform it, validate it against
         the after schemas and load it to the destinations.
+        When everything succeeds, the `CommittableSource`s, like `DirectorySource`, are committed.
         """
         self._logger.info(f"Starting ETL process for {self._name}.", status="running")
-        self._logger = self._logger.patch(lambda record: record["extra"].update(status="running"))
-        try:
-            data = self.extract()
+        if self._checkpoint is not None:
+            self._checkpoint.clear()
+        self._run("extract")
 
-            with warnings.catch_warnings(record=True) as warns:
-                warnings.simplefilter("always")
-                data = self.transform(data)
-            for warn in warns:
-                self._logger.warning(warn.message)
+    def resume(self) -> None:
+        """Resume a failed execution from the checkpoint, running only the steps that did not finish.
 
-            _validate_steps(set(data.keys()), "transform", set(self._destinations.keys()), "load")
-            self.load(data)
-        except Exception as e:
-            self._logger.patch(lambda record: record["extra"].update(status="failed")).error(
-                f"Failed to execute ETL process for {self._name}: \n {e}"
+        If the failed execution got to the load step, the transformed data is read back from the checkpoint and loaded
+        only to the destinations that did not succeed. If it failed before, it's resumed from the extracted data, or
+        from the start when nothing was persisted. The `ResumableSource`s, like `DirectorySource`, get back what
+        their extraction found, so they commit it when the execution succeeds.
+
+        Raises:
+            ValueError: If the ETL was created without a `checkpoint_dir`.
+        """
+        if self._checkpoint is None:
+            raise ValueError("A checkpoint_dir is required to resume the ETL process.")
+        stage = self._checkpoint.stage()
+        if stage != "extract":
+            for name, pending in self._checkpoint.sources().items():
+                source = self._sources.get(name)
+                if isinstance(source, ResumableSource):
+                    source.restore_pending(pending)
+        self._logger.info(f"Resuming ETL process for {self._name} from the {stage} step.", status="running")
+        self._run(stage)
+
+    def _run(self, stage: Literal["extract", "transform", "load"]) -> None:
+        self._logger = self._status_loggers["running"]
+        try:
+            data = (
+                self._checkpoint.restore("transformed")  # type: ignore
+                if stage == "load"
+                else self._transformed(self._extracted(stage))
             )
+            self._load(data)
+            self._commit_sources()
+        except Exception as e:
+            self._status_loggers["failed"].error(f"Failed to execute ETL process for {self._name}: \n {e}")
+            self._discard_destinations()
             raise e
         else:
-            self._logger.patch(lambda record: record["extra"].update(status="success")).success(
-                f"ETL process for {self._name} executed successfully."
+            self._status_loggers["success"].success(f"ETL process for {self._name} executed successfully.")
+            if self._checkpoint is not None:
+                self._checkpoint.clear()
+
+    def _extracted(self, stage: Literal["extract", "transform"]) -> dict[str, T]:
+        if stage == "transform":
+            return self._checkpoint.restore("extracted")  # type: ignore
+        data = self.compact(self.validate(self.extract(), self._before))
+        if self._checkpoint is not None:
+            # Saved before the data, so a checkpoint with extracted data always knows what to commit.
+            self._checkpoint.save_sources(
+                {
+                    name: source.pending()
+                    for name, source in self._sources.items()
+                    if isinstance(source, ResumableSource)
+                }
             )
+            # A stream can be read only once, so it's read whole to be persisted and still loaded afterwards.
+            data = {name: _replayable(value) for name, value in data.items()}
+            self._checkpoint.save("extracted", data)
+        return data
+
+    def _transformed(self, data: dict[str, T]) -> dict[str, T]:
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            data = self.transform(data)
+        for warn in warns:
+            self._logger.warning(warn.message)
+
+        _validate_steps(set(data.keys()), "transform", set(self._destinations.keys()), "load")
+        data = self.validate(data, self._after)
+        if self._checkpoint is not None:
+            data = {name: _replayable(value) for name, value in data.items()}
+            self._checkpoint.save("transformed", data)
+        return data
 
     def extract(self) -> dict[str, T]:
         """Extract the data from the provided sources and load it into a dictionary with same keys as the sources.
 
         The extraction is done in parallel, using threads.
+        Equivalent sources, the same object or sources with equal `cache_key`, are extracted only once. The keys after
+        the first get a shallow copy of the DataFrame, which shares its values with the others.
         This method use the `etl` logger to log the extraction process, which can be customized by the user.
 
         Returns:
             dict[str, DataFrame]: A dictionary with the data extracted from the sources.
         """
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            extracted_data = executor.map(lambda *args: _extract(*args, logger=self._logger), self._sources.values())
-        names = self._sources.keys()
-        return dict(zip(names, extracted_data))
+        source_cache = self._source_cache
+        if source_cache is None:
+            source_cache = SourceCache()
+            for key in self._source_keys():
+                source_cache.register(key)
+        sizes = {name: self._source_size(name, source) for name, source in self._sources.items()}
+        ordered = sorted(
+            self._sources.items(), key=lambda item: -self._estimate("extract", self._task_key(item[0]), sizes[item[0]])
+        )
+        try:
+            with self._io_executor() as executor:
+                futures = {
+                    name: self._pool(executor, source).submit(
+                        self._timed,
+                        "extract",
+                        self._task_key(name),
+                        sizes[name],
+                        self._extract_source,
+                        source_cache,
+                        source,
+                    )
+                    for name, source in ordered
+                }
+                extracted: dict[str, T] = {}
+                for name in self._sources:
+                    value = futures[name].result()
+                    duplicate = any(value is other for other in extracted.values())
+                    extracted[name] = _shallow_copy(value) if duplicate else value
+                return extracted
+        finally:
+            self._flush_stores()
+
+    def compact(self, data: dict[str, T]) -> dict[str, T]:
+        """Compact the column types of the extracted DataFrames, according to the compaction rules provided.
+
+        The memory saved for each key is logged. Data that is not a pandas DataFrame is kept as it is.
+
+        Args:
+            data (dict[str, DataFrame]): The data to be compacted.
+
+        Returns:
+            dict[str, DataFrame]: A dictionary with the compacted data.
+        """
+        if self._compaction is None:
+            return data
+
+        import pandas as pd  # noqa: PLC0415
+
+        from extralo.compaction import DtypeCompaction, memory_usage  # noqa: PLC0415
+
+        rules = (
+            dict.fromkeys(data, self._compaction) if isinstance(self._compaction, DtypeCompaction) else self._compaction
+        )
+        compacted = dict(data)
+        for name, rule in rules.items():
+            frame = data[name]
+            if not isinstance(frame, pd.DataFrame):
+                continue
+            before = memory_usage(frame)
+            compacted[name] = rule.compact(frame)  # type: ignore
+            after = memory_usage(compacted[name])  # type: ignore
+            self._logger.info(
+                f"Compacted '{name}' from {before / 2**20:.2f} MiB to {after / 2**20:.2f} MiB, "
+                f"saving {(before - after) / 2**20:.2f} MiB"
+            )
+        return compacted
+
+    def validate(self, data: dict[str, T], schemas: dict[str, Schema]) -> dict[str, T]:
+        """Validate the data against the given schemas, by key.
+
+        The keys are validated concurrently, and large DataFrames in chunks of rows, according to the `validation`
+        options of the ETL.
+
+        Args:
+            data (dict[str, DataFrame]): The data to be validated.
+            schemas (dict[str, Schema]): The schema of each key. Keys without a schema are not validated.
+
+        Returns:
+            dict[str, DataFrame]: The validated data, with the types coerced by the schemas.
+        """
+        if not schemas:
+            return data
+
+        from extralo.validation import SchemaValidation  # noqa: PLC0415
+
+        validation = self._validation if self._validation is not None else SchemaValidation()
+        return validation.validate(data, schemas, self._logger)  # type: ignore
 
     def transform(self, data: dict[str, T]) -> dict[str, T]:
         """Transform the data extracted from the source according to the `Transformer` class provided.
@@ -192,9 +601,18 @@ class ETL(Generic[T]):
             self._logger.info("Skipping transform step since no Transformer was specified.")
             return data
 
+        key = self._transform_cache.key(self._transformer, data) if self._transform_cache is not None else None
+        if key is not None:
+            cached_data = self._transform_cache.load(key)  # type: ignore
+            if cached_data is not None:
+                self._logger.info(f"Reused the data transformed with {self._transformer} from {self._transform_cache}")
+                return cached_data
+
         data = self._transformer(**data)
         self._logger.info(f"Transformed data with {self._transformer}")
 
+        if key is not None:
+            self._transform_cache.save(key, data)  # type: ignore
         return data
 
     def load(self, data: dict[str, T]) -> None:
@@ -207,21 +625,267 @@ class ETL(Generic[T]):
 
         Raises:
             Exception: If the data could not be loaded to the destination.
+        """  # noqa: DOC502
+        self._load(dict(data))
+
+    def _load(self, data: dict[str, T]) -> None:
+        # Each key is removed from `data` as soon as all of its destinations finish, so it can be freed early. The
+        # spilled keys are read back only when they fit in the memory budget, after the keys in memory were freed.
+        destinations, digests = self._pending_destinations(data)
+        sizes = {name: self._size(data_size, data[name]) for name in destinations}
+        tasks = sorted(
+            ((name, index, destination) for name, indexed in destinations.items() for index, destination in indexed),
+            key=lambda task: -self._estimate("load", self._task_key(task[0], task[1]), sizes[task[0]]),
+        )
+        with self._spill(data, destinations) as (spilled, resident), self._io_executor() as executor:
+            pending = {name: len(indexed) for name, indexed in destinations.items()}
+            queue = _SpillQueue(
+                self._memory_budget or 0, resident, spilled, list(dict.fromkeys(task[0] for task in tasks))
+            )
+            # The data sent to several destinations shares its conversions between them, like the Arrow table, in a
+            # cache dropped with the load.
+            cache = conversions.ConversionCache()
+            shared = {name: data[name] for name in destinations if name not in spilled and pending[name] > 1}
+            for value in shared.values():
+                cache.register(value)
+
+            futures: dict[Future[None], tuple[str, int]] = {}
+            submit = partial(self._submit_load, executor, cache, data, spilled, sizes)
+            for task in tasks:
+                if task[0] not in spilled:
+                    futures[submit(task)] = task[:2]
+            try:
+                errors: list[BaseException] = []
+                while True:
+                    for name in queue.admit():
+                        futures.update((submit(task), task[:2]) for task in tasks if task[0] == name)
+                    if not futures:
+                        break
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, index = futures.pop(future)
+                        if future.exception() is None:
+                            self._mark_loaded(name, index, digests.get(name))
+                        else:
+                            errors.append(future.exception())
+                        # Failed loads also free their data, so the spilled keys waiting for memory can still start.
+                        pending[name] -= 1
+                        if not pending[name]:
+                            _free(name, data, cache, shared, spilled)
+                            queue.done(name)
+            finally:
+                shared.clear()
+                self._flush_stores()
+            self._flush_destinations()
+            if errors:
+                raise Exception(f"Failed to load data: {errors[0]}") from errors[0]
+
+    def _submit_load(  # noqa: PLR0913, PLR0917
+        self,
+        executor: Executor,
+        cache: conversions.ConversionCache,
+        data: dict[str, T],
+        spilled: dict[str, _SpilledData],
+        sizes: dict[str, Optional[int]],  # noqa: UP045
+        task: tuple[str, int, Destination[T]],
+    ) -> Future[None]:
+        name, index, destination = task
+        load = partial(_load_spilled, spilled[name]) if name in spilled else partial(_load, data[name])
+        return self._pool(executor, destination).submit(
+            self._timed,
+            "load",
+            self._task_key(name, index),
+            sizes[name],
+            load,
+            destination,
+            logger=self._logger,
+            shared=cache,
+        )
+
+    def _flush_destinations(self) -> None:
+        # The destinations that collect data before writing it, like the sheets of a workbook, write what they got
+        # at the end of the load, even when some loads were skipped or failed, since those that succeeded are
+        # recorded as loaded.
+        for destinations in self._destinations.values():
+            for destination in destinations:
+                flush = getattr(destination, "flush", None)
+                if flush is not None:
+                    flush()
+
+    def _discard_destinations(self) -> None:
+        # The destinations that collect data before writing it, like the sheets of a workbook, must not keep the data
+        # of a failed execution for the next one.
+        for destinations in self._destinations.values():
+            for destination in destinations:
+                discard = getattr(destination, "discard", None)
+                if discard is not None:
+                    discard()
+
+    def _commit_sources(self) -> None:
+        for source in self._sources.values():
+            if isinstance(source, CommittableSource):
+                source.commit()
+
+    def _extract_source(self, source_cache: SourceCache, source: Source[T]) -> T:
+        data = source_cache.get(source_key(source), lambda: _extract(source, logger=self._logger))
+        # The data of a cache shared with other ETLs is copied, so their transformers don't change each other's data.
+        return _shallow_copy(data) if source_cache is self._source_cache else data
+
+    def _task_key(self, name: str, index: Optional[int] = None) -> str:  # noqa: UP045
+        # The same across runs: the name of the ETL and the key, and the position of the destination for the loads.
+        return f"{self._name}:{name}" if index is None else f"{self._name}:{name}:{index}"
+
+    def _fingerprint_key(self, name: str, index: int) -> str:
+        # The identity of the destination is part of the key, so replacing a destination, or pointing it to another
+        # file or table, doesn't skip its first load.
+        from extralo._fingerprint import destination_key  # noqa: PLC0415
+
+        return f"{self._task_key(name, index)}:{destination_key(self._destinations[name][index])}"
+
+    def _source_size(self, name: str, source: Source[T]) -> Optional[int]:  # noqa: UP045
+        # The size may walk a whole directory, so it's computed only for the sources that have no duration yet.
+        if self._durations is None or self._durations.recorded("extract", self._task_key(name)):
+            return None
+        return source_size(source)
+
+    def _size(self, size: Callable[[Any], Optional[int]], step: Any) -> Optional[int]:  # noqa: UP045
+        return size(step) if self._durations is not None else None
+
+    def _estimate(self, kind: TaskKind, key: str, size: Optional[int]) -> float:  # noqa: UP045
+        if self._durations is None:
+            return 0.0
+        return self._durations.estimate(kind, key, size)
+
+    def _timed(
+        self,
+        kind: TaskKind,
+        key: str,
+        size: Optional[int],  # noqa: UP045
+        function: Callable[..., R],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R:
+        if self._durations is None:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        self._durations.record(kind, key, time.perf_counter() - start, size)
+        return result
+
+    def _flush_stores(self) -> None:
+        if self._durations is not None:
+            self._durations.flush()
+        if self._fingerprints is not None:
+            self._fingerprints.flush()
+
+    def _source_keys(self) -> list[Hashable]:
+        return [source_key(source) for source in self._sources.values()]
+
+    def _bind(
+        self,
+        executor: Optional[Executor],  # noqa: UP045
+        router: Optional[Router],  # noqa: UP045
+        source_cache: Optional[SourceCache] = None,  # noqa: UP045
+    ) -> None:
+        """Run the extractions and loads in the given executor, or in the executor the router returns for each step.
+
+        The sources are extracted through the source cache, when given, so the ones shared with other ETLs are
+        extracted only once.
         """
-        futures: list[Future[None]] = []
+        self._executor = executor
+        self._router = router
+        self._source_cache = source_cache
+
+    @contextmanager
+    def _io_executor(self) -> Generator[Executor, None, None]:
+        if self._executor is not None:
+            yield self._executor
+            return
         with ThreadPoolExecutor(max_workers=5) as executor:
-            for name, destinations in self._destinations.items():
-                data_to_load = data[name]
-                futures.extend(
-                    executor.submit(partial(_load, data_to_load, destination, logger=self._logger))
-                    for destination in destinations
-                )
+            yield executor
+
+    def _dedicated(self, step: object) -> Optional[Executor]:  # noqa: UP045
+        return self._router(step) if self._router is not None else None
+
+    def _pool(self, executor: Executor, step: object) -> Executor:
+        return self._dedicated(step) or executor
+
+    def _in_pool(self, step: object, function: Callable[..., R], *args: Any) -> R:
+        # Run in the executor dedicated to the step, waiting for the result, or in the current thread if none.
+        dedicated = self._dedicated(step)
+        return function(*args) if dedicated is None else dedicated.submit(function, *args).result()
+
+    def _pending_destinations(
+        self, data: dict[str, T]
+    ) -> tuple[dict[str, list[tuple[int, Destination[T]]]], dict[str, Optional[str]]]:  # noqa: UP045
+        # The destinations of each key that still need the data, with their indexes, and the fingerprints of the data.
+        # The destinations that already succeeded, or that got the same data in the last run, are left out, and the
+        # keys without destinations left are dropped from the data. Streams sent to several destinations are read whole.
+        digests: dict[str, Optional[str]] = {}  # noqa: UP045
+        if self._fingerprints is not None:
+            from extralo._fingerprint import fingerprint  # noqa: PLC0415
+
+            digests = {name: fingerprint(data[name]) for name in self._destinations}
+        destinations = {
+            name: [
+                (index, destination)
+                for index, destination in enumerate(destinations)
+                if not self._is_loaded(name, index, destination, digests.get(name))
+            ]
+            for name, destinations in self._destinations.items()
+        }
+        for name, indexed in destinations.items():
+            if not indexed:
+                data.pop(name, None)
+            elif len(indexed) > 1:
+                data[name] = _replayable(data[name])
+        return {name: indexed for name, indexed in destinations.items() if indexed}, digests
+
+    def _is_loaded(self, name: str, index: int, destination: Destination[T], digest: Optional[str]) -> bool:  # noqa: UP045
+        if self._checkpoint is not None and self._checkpoint.is_loaded(name, index):
+            return True
+        if self._fingerprints is not None and self._fingerprints.unchanged(self._fingerprint_key(name, index), digest):
+            self._logger.info(f"Skipping load to {destination}, since the data of '{name}' did not change.")
+            return True
+        return False
+
+    def _mark_loaded(self, name: str, index: int, digest: Optional[str]) -> None:  # noqa: UP045
+        if self._checkpoint is not None:
+            self._checkpoint.mark_loaded(name, index)
+        if self._fingerprints is not None:
+            self._fingerprints.record(self._fingerprint_key(name, index), digest)
+
+    @contextmanager
+    def _spill(
+        self, data: dict[str, T], destinations: dict[str, list[tuple[int, Destination[T]]]]
+    ) -> Generator[tuple[dict[str, _SpilledData], dict[str, int]], None, None]:
+        """Spill the largest data to disk until the rest fits in the memory budget.
+
+        Yields:
+            The spilled data, and the memory used by each key left in memory.
+        """
+        if self._memory_budget is None:
+            yield {}, {}
+            return
 
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:  # noqa: PERF203
-                    raise Exception(f"Failed to load data: {e}") from e
+        from extralo._ipc import nbytes, persist  # noqa: PLC0415
+
+        sizes = {name: nbytes(data[name]) for name in destinations}
+        sizes = {name: size for name, size in sizes.items() if size is not None}
+        total = sum(sizes.values())
+        directory = tempfile.mkdtemp(prefix="extralo-spill-", dir=self._spill_dir)
+        try:
+            spilled: dict[str, _SpilledData] = {}
+            for name in sorted(sizes, key=lambda name: sizes[name], reverse=True):
+                if total <= self._memory_budget:
+                    break
+                path = persist(data.pop(name), os.path.join(directory, str(len(spilled))))
+                spilled[name] = _SpilledData(path, sizes[name])
+                total -= sizes[name]
+                self._logger.info(f"Spilled '{name}' ({sizes[name] / 2**20:.2f} MiB) to {path}")
+            yield spilled, {name: size for name, size in sizes.items() if name not in spilled}
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
 
 
 class ETLSequentialLoad(ETL[T]):
@@ -235,7 +899,36 @@ class ETLSequentialLoad(ETL[T]):
         Args:
             data (dict[str, DataFrame]): The data to be loaded. The keys must match the keys of the destinations.
         """
-        for name, destinations in self._destinations.items():
-            data_to_load = data[name]
-            for destination in destinations:
-                _load(data_to_load, destination, self._logger)
+        self._load(dict(data))
+
+    def _load(self, data: dict[str, T]) -> None:
+        destinations, digests = self._pending_destinations(data)
+        cache = conversions.ConversionCache()
+        with self._spill(data, destinations) as (spilled, _):
+            try:
+                self._load_sequentially(data, destinations, digests, spilled, cache)
+            finally:
+                self._flush_destinations()
+
+    def _load_sequentially(  # noqa: PLR0913, PLR0917
+        self,
+        data: dict[str, T],
+        destinations: dict[str, list[tuple[int, Destination[T]]]],
+        digests: dict[str, Optional[str]],  # noqa: UP045
+        spilled: dict[str, _SpilledData],
+        cache: conversions.ConversionCache,
+    ) -> None:
+        # The spilled data is read back last, one key at a time, when the data in memory was already freed.
+        for name, indexed in sorted(destinations.items(), key=lambda item: item[0] in spilled):
+            data_to_load = spilled[name].get() if name in spilled else data.pop(name)
+            cache.register(data_to_load)
+            try:
+                for index, destination in indexed:
+                    self._in_pool(destination, _load, data_to_load, destination, self._logger, cache)
+                    self._mark_loaded(name, index, digests.get(name))
+            finally:
+                cache.release(data_to_load)
+                self._flush_stores()
+            del data_to_load
+            if name in spilled:
+                spilled[name].release()
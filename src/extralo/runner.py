@@ -0,0 +1,254 @@
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, as_completed, wait
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Optional
+
+from loguru import logger
+
+from extralo._cache import SourceCache
+from extralo.etl import ETL
+
+
+class RunReport:
+    """The outcome of running a collection of ETLs with an `ETLRunner`.
+
+    Attributes:
+        succeeded (list[ETL]): The ETLs that were executed successfully.
+        failed (list[tuple[ETL, Exception]]): The ETLs that failed, with the exception raised by each one.
+        elapsed (float): The time taken to run all the ETLs, in seconds.
+        skipped (list[ETL]): The ETLs that were not executed because an ETL they depend on failed.
+    """
+
+    def __init__(
+        self,
+        succeeded: list[ETL[Any]],
+        failed: list[tuple[ETL[Any], Exception]],
+        elapsed: float,
+        skipped: Optional[list[ETL[Any]]] = None,
+    ) -> None:
+        self.succeeded = succeeded
+        self.failed = failed
+        self.elapsed = elapsed
+        self.skipped = skipped or []
+
+    @property
+    def total(self) -> int:
+        """The number of ETLs that were run, not counting the skipped ones."""
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def throughput(self) -> float:
+        """The number of ETLs finished per second."""
+        return self.total / self.elapsed if self.elapsed else float("inf")
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(succeeded={len(self.succeeded)}, failed={len(self.failed)}, "
+            f"skipped={len(self.skipped)}, elapsed={self.elapsed:.2f}s, throughput={self.throughput:.2f}/s)"
+        )
+
+
+class ETLRunner:
+    """Run a large collection of ETLs on long-lived thread pools shared by all of them.
+
+    The ETLs are executed concurrently, at most `max_workers` at a time, and their extractions and loads share a
+    single pool of `io_workers` threads, instead of creating new pools for each ETL. Sources and destinations that
+    use the same SQLAlchemy engine (the ones with an `_engine` attribute) can be limited to a number of concurrent
+    operations, so that many ETLs don't exhaust the connections of a database. Each limited engine gets its own pool
+    with that many threads, so the operations waiting for an engine don't hold the threads shared by the others.
+
+    An `AsyncETL` is executed in an event loop of its own, in the thread running it.
+
+    The runner should be closed after use, or used as a context manager.
+
+    Args:
+        max_workers (int, optional): The maximum number of ETLs executed at the same time. Defaults to 8.
+        io_workers (int, optional): The number of threads shared by the extractions and loads of all ETLs.
+            Defaults to 16.
+        engine_limits (Optional[dict[Any, int]], optional): The maximum number of concurrent operations for each
+            engine. Defaults to None.
+        default_engine_limit (Optional[int], optional): The maximum number of concurrent operations for the engines
+            not in `engine_limits`. Defaults to None, which doesn't limit them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        io_workers: int = 16,
+        engine_limits: Optional[dict[Any, int]] = None,
+        default_engine_limit: Optional[int] = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._pipelines = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extralo-etl")
+        self._io = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="extralo-io")
+        self._engine_limits = engine_limits or {}
+        self._default_engine_limit = default_engine_limit
+        self._engines: dict[Any, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def run(self, etls: Iterable[ETL[Any]]) -> RunReport:
+        """Execute the given ETLs, without stopping when some of them fail.
+
+        Args:
+            etls (Iterable[ETL]): The ETLs to execute.
+
+        Returns:
+            RunReport: The ETLs that succeeded and failed, and the time taken.
+        """
+        start = time.perf_counter()
+        futures = {self._pipelines.submit(self._execute, etl): etl for etl in etls}
+        succeeded: list[ETL[Any]] = []
+        failed: list[tuple[ETL[Any], Exception]] = []
+        for future in as_completed(futures):
+            etl = futures.pop(future)
+            error = future.exception()
+            if error is None:
+                succeeded.append(etl)
+            else:
+                failed.append((etl, error))  # type: ignore
+        report = RunReport(succeeded, failed, time.perf_counter() - start)
+        logger.info(f"Finished running {report.total} ETLs: {report}")
+        return report
+
+    def _execute(self, etl: ETL[Any], source_cache: Optional[SourceCache] = None) -> None:
+        etl._bind(self._io, self._route, source_cache)  # noqa: SLF001
+        try:
+            if inspect.iscoroutinefunction(etl.execute):
+                asyncio.run(etl.execute())
+            else:
+                etl.execute()
+        finally:
+            etl._bind(None, None)  # noqa: SLF001
+
+    def _route(self, step: object) -> Optional[Executor]:
+        engine = getattr(step, "_engine", None)
+        if engine is None:
+            return None
+        limit = self._engine_limits.get(engine, self._default_engine_limit)
+        if limit is None:
+            return None
+        with self._lock:
+            if engine not in self._engines:
+                self._engines[engine] = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="extralo-engine")
+            return self._engines[engine]
+
+    def close(self) -> None:
+        """Shut down the thread pools, waiting for the running ETLs to finish."""
+        self._pipelines.shutdown(wait=True)
+        self._io.shutdown(wait=True)
+        for executor in self._engines.values():
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ETLRunner":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_workers={self._max_workers})"
+
+
+def _dependency_graph(etls: dict[str, ETL[Any]], dependencies: dict[str, list[str]]) -> "TopologicalSorter[str]":
+    for name, names in dependencies.items():
+        unknown = {name, *names} - etls.keys()
+        if unknown:
+            raise KeyError(f"Dependencies refer to unknown ETLs: {unknown}")
+    graph = TopologicalSorter({name: dependencies.get(name, []) for name in etls})
+    try:
+        graph.prepare()
+    except CycleError as err:
+        raise ValueError(f"The dependencies between the ETLs have a cycle: {err.args[1]}") from err
+    return graph
+
+
+class ETLScheduler(ETLRunner):
+    """Run a collection of ETLs that depend on each other, on thread pools shared by all of them.
+
+    Each ETL starts as soon as all the ETLs it depends on succeeded, so the independent ones run concurrently. The
+    ETLs that depend on a failed one are skipped.
+
+    The sources that read the same data (the same object, or sources with equal `cache_key`, like two `SQLSource`
+    with the same engine, query and parameters) are extracted only once per run, and the same data is handed to
+    every ETL that uses it. The data is dropped as soon as all of these ETLs got it. Each ETL gets a shallow copy of the
+    DataFrame, so adding or replacing columns in one ETL doesn't change the others, but the values are shared: the
+    transformers must not modify them in place. The data extracted before an ETL finished is never shared with the ETLs
+    that depend on it, since it may not have what that ETL loaded: the shared data is forgotten whenever an ETL that
+    others depend on finishes.
+
+    Args:
+        max_workers (int, optional): The maximum number of ETLs executed at the same time. Defaults to 8.
+        io_workers (int, optional): The number of threads shared by the extractions and loads of all ETLs.
+            Defaults to 16.
+        engine_limits (Optional[dict[Any, int]], optional): The maximum number of concurrent operations for each
+            engine. Defaults to None.
+        default_engine_limit (Optional[int], optional): The maximum number of concurrent operations for the engines
+            not in `engine_limits`. Defaults to None, which doesn't limit them.
+    """
+
+    def run(  # type: ignore[override]
+        self,
+        etls: dict[str, ETL[Any]],
+        dependencies: Optional[dict[str, list[str]]] = None,
+    ) -> RunReport:
+        """Execute the given ETLs, respecting their dependencies.
+
+        Args:
+            etls (dict[str, ETL]): The ETLs to execute, by name.
+            dependencies (Optional[dict[str, list[str]]], optional): The names of the ETLs that each ETL depends on.
+                Defaults to None, which runs all ETLs independently.
+
+        Returns:
+            RunReport: The ETLs that succeeded, failed and were skipped, and the time taken.
+
+        Raises:
+            KeyError: If a dependency refers to an unknown ETL.
+            ValueError: If the dependencies have a cycle.
+        """  # noqa: DOC502
+        dependencies = dependencies or {}
+        graph = _dependency_graph(etls, dependencies)
+
+        upstream = {name for names in dependencies.values() for name in names}
+        source_cache = SourceCache()
+        for etl in etls.values():
+            for key in etl._source_keys():  # noqa: SLF001
+                source_cache.register(key)
+
+        start = time.perf_counter()
+        futures: dict[Future[None], str] = {}
+        succeeded: list[ETL[Any]] = []
+        failed: list[tuple[ETL[Any], Exception]] = []
+        skipped: list[ETL[Any]] = []
+        blocked: set[str] = set()
+        while graph.is_active():
+            for name in graph.get_ready():
+                if blocked.intersection(dependencies.get(name, [])):
+                    logger.warning(f"Skipping ETL '{name}' because an ETL it depends on failed.")
+                    skipped.append(etls[name])
+                    blocked.add(name)
+                    graph.done(name)
+                else:
+                    futures[self._pipelines.submit(self._execute, etls[name], source_cache)] = name
+            if not futures:
+                continue
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures.pop(future)
+                error = future.exception()
+                if error is None:
+                    succeeded.append(etls[name])
+                else:
+                    failed.append((etls[name], error))  # type: ignore
+                    blocked.add(name)
+                if name in upstream:
+                    source_cache.invalidate()
+                graph.done(name)
+
+        report = RunReport(succeeded, failed, time.perf_counter() - start, skipped)
+        logger.info(f"Finished running {report.total} ETLs: {report}")
+        return report
@@ -1,4 +1,5 @@
-from typing import Generic, Protocol, TypeVar
+from collections.abc import Hashable
+from typing import Any, Generic, Optional, Protocol, TypeVar, runtime_checkable
 
 T_co = TypeVar("T_co", covariant=True)
 
@@ -13,3 +14,87 @@ class Source(Generic[T_co], Protocol):
             T_co: The extracted data.
         """
         raise NotImplementedError
+
+
+@runtime_checkable
+class ProjectableSource(Source[T_co], Protocol):
+    """Protocol for a source that can read only some of the columns of the data.
+
+    The ETL pushes the columns it needs down to the sources that match this protocol.
+    """
+
+    def with_columns(self, columns: list[str]) -> "ProjectableSource[T_co]":
+        """Create a copy of the source that reads only the given columns.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            ProjectableSource[T_co]: The source that reads only the given columns.
+        """
+        raise NotImplementedError
+
+
+@runtime_checkable
+class CacheableSource(Source[T_co], Protocol):
+    """Protocol for a source that can tell when another source reads the same data.
+
+    Sources with equal keys are extracted only once when they are used in the same run.
+    """
+
+    def cache_key(self) -> Optional[Hashable]:
+        """A key that is equal for the sources that read the same data.
+
+        Returns:
+            Optional[Hashable]: The key, or None when the source can't be compared with others.
+        """
+        raise NotImplementedError
+
+
+@runtime_checkable
+class CommittableSource(Source[T_co], Protocol):
+    """Protocol for a source that records what it extracted only when the ETL succeeds.
+
+    The ETL calls `commit` after all the data was loaded, so a failed execution extracts the same data again.
+    """
+
+    def commit(self) -> None:
+        """Record the data extracted by the last extraction as processed."""
+        raise NotImplementedError
+
+
+@runtime_checkable
+class ResumableSource(CommittableSource[T_co], Protocol):
+    """Protocol for a committable source whose pending data can be kept in a checkpoint.
+
+    The ETL persists what `pending` returns after the extraction, and gives it back with `restore_pending` when a failed
+    execution is resumed, so the source commits what its extraction found.
+    """
+
+    def pending(self) -> Any:
+        """The data to be recorded by `commit`, found by the last extraction.
+
+        Returns:
+            Any: The pending data, which must be picklable.
+        """
+        raise NotImplementedError
+
+    def restore_pending(self, pending: Any) -> None:
+        """Set the data to be recorded by `commit`, like the one found by an earlier extraction.
+
+        Args:
+            pending (Any): The data returned by `pending`.
+        """
+        raise NotImplementedError
+
+
+class AsyncSource(Generic[T_co], Protocol):
+    """Generic protocol for a source that extracts data from somewhere without blocking the event loop."""
+
+    async def extract(self) -> T_co:
+        """Extracts data from a source and returns it.
+
+        Returns:
+            T_co: The extracted data.
+        """
+        raise NotImplementedError
@@ -1,5 +1,19 @@
-from .delta_lake import DeltaLakeSource, SparkDeltaLakeSource
-from .file import CSVSource, JSONSource, SASSource, XLSXSource
+from .delta_lake import ArrowDeltaLakeSource, DeltaLakeSource, SparkDeltaLakeSource
+from .directory import DirectorySource
+from .file import CSVSource, JSONSource, SASSource, XLSXSheetSource, XLSXSource
+from .parquet import ParquetSource
 from .sql import SQLSource
 
-__all__ = ["CSVSource", "SQLSource", "SASSource", "XLSXSource", "DeltaLakeSource", "SparkDeltaLakeSource", "JSONSource"]
+__all__ = [
+    "CSVSource",
+    "SQLSource",
+    "SASSource",
+    "XLSXSource",
+    "XLSXSheetSource",
+    "DeltaLakeSource",
+    "ArrowDeltaLakeSource",
+    "SparkDeltaLakeSource",
+    "JSONSource",
+    "ParquetSource",
+    "DirectorySource",
+]
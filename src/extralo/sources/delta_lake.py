@@ -1,22 +1,45 @@
 # type: ignore
-from typing import Any, Optional
+import copy
+from collections.abc import Hashable, Iterator
+from itertools import islice
+from typing import Any, Optional, Union
 
 import pandas as pd
 
+from extralo._spark import arrow_enabled
+
+
+def _to_dnf(filters: list) -> list[list[tuple]]:
+    if filters and isinstance(filters[0], list):
+        return filters
+    return [filters]
+
 
 class DeltaLakeSource:
     """A source class for extracting data from Delta Lake tables.
 
+    The data is read with a pyarrow dataset scanner. The partitions and the DNF-style filters are used to skip the
+    files that cannot match them, using the partition values and the file statistics from the Delta log, and the
+    filters are then applied to the remaining rows.
+
     Args:
         table_uri (str): The URI of the Delta Lake table.
         partitions (Optional[list[tuple[str]]], optional): List of partition columns to filter the data.
             Defaults to None.
+        columns (Optional[list[str]], optional): The columns to read. Defaults to None, which reads all columns.
+        filters (Optional[Union[list[tuple], list[list[tuple]], Expression]], optional): The rows to read, as
+            DNF-style filters, like `[("col1", ">", 2)]`, or as a pyarrow dataset expression. Only DNF-style filters
+            are used to skip files. Defaults to None.
+        **kwargs: Additional keyword arguments to be passed to `DeltaTable.to_pyarrow_dataset`. The `types_mapper`
+            argument is passed to `Table.to_pandas` instead, and the `storage_options` to `DeltaTable`.
     """
 
     def __init__(
         self,
         table_uri: str,
         partitions: Optional[list[tuple[str]]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[Union[list[tuple], list[list[tuple]], Any]] = None,
         **kwargs: Any,
     ) -> None:
         try:
@@ -27,6 +50,8 @@ class DeltaLakeSource:
             ) from err
         self._table_uri = table_uri
         self._partitions = partitions
+        self._columns = columns
+        self._filters = filters
         self._kwargs = kwargs
 
     def extract(self) -> pd.DataFrame:
@@ -35,25 +60,141 @@ class DeltaLakeSource:
         Returns:
             DataFrame: The extracted data as a pandas DataFrame.
         """
-        import deltalake as dl  # noqa: PLC0415
+        return self._scanner().to_table().to_pandas(types_mapper=self._kwargs.get("types_mapper"))
+
+    def iter_batches(self, batch_size: int = 131_072) -> Iterator[pd.DataFrame]:
+        """Iterate over the Delta Lake table in record batches, without reading the whole table in memory.
+
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch. Defaults to 131_072.
+
+        Yields:
+            DataFrame: The data, at most `batch_size` rows at a time.
+        """
+        for batch in self._scanner(batch_size=batch_size).to_batches():
+            yield batch.to_pandas(types_mapper=self._kwargs.get("types_mapper"))
+
+    def with_columns(self, columns: list[str]) -> "DeltaLakeSource":
+        """Create a copy of the source that reads only the given columns.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            DeltaLakeSource: The source that reads only the given columns.
+        """
+        source = copy.copy(self)
+        source._columns = columns
+        return source
 
-        return dl.DeltaTable(self._table_uri).to_pandas(partitions=self._partitions, **self._kwargs)
+    def cache_key(self) -> Hashable:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Hashable: The table URI, the partitions, the columns, the filters and the arguments of the source.
+        """
+        columns = None if self._columns is None else tuple(self._columns)
+        return (
+            self.__class__.__name__,
+            self._table_uri,
+            repr(self._partitions),
+            columns,
+            repr(self._filters),
+            repr(sorted(self._kwargs.items())),
+        )
+
+    def _pruning_predicate(self) -> Optional[list[list[tuple]]]:
+        conjunctions = _to_dnf(self._filters) if isinstance(self._filters, list) else [[]]
+        predicate = [[*(self._partitions or []), *conjunction] for conjunction in conjunctions]
+        if not all(predicate):
+            return None
+        return predicate
+
+    def _scanner(self, **kwargs: Any) -> Any:
+        import deltalake as dl  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        dataset_kwargs = {
+            key: value for key, value in self._kwargs.items() if key not in {"types_mapper", "storage_options"}
+        }
+        dataset = dl.DeltaTable(
+            self._table_uri, storage_options=self._kwargs.get("storage_options")
+        ).to_pyarrow_dataset(file_pruning_predicate=self._pruning_predicate(), **dataset_kwargs)
+        filters = self._filters
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters) if filters else None
+        return dataset.scanner(columns=self._columns, filter=filters, **kwargs)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(table_uri={self._table_uri})"
 
 
+class ArrowDeltaLakeSource(DeltaLakeSource):
+    """A source class for extracting data from Delta Lake tables as Arrow data, without converting it to pandas.
+
+    Args:
+        table_uri (str): The URI of the Delta Lake table.
+        partitions (Optional[list[tuple[str]]], optional): List of partition columns to filter the data.
+            Defaults to None.
+        columns (Optional[list[str]], optional): The columns to read. Defaults to None, which reads all columns.
+        filters (Optional[Union[list[tuple], list[list[tuple]], Expression]], optional): The rows to read, as
+            DNF-style filters or as a pyarrow dataset expression. Defaults to None.
+        stream (bool, optional): Whether to return a `RecordBatchReader` instead of a `Table`, so the data is read
+            batch by batch when consumed. Defaults to False.
+        **kwargs: Additional keyword arguments to be passed to `DeltaTable.to_pyarrow_dataset`.
+    """
+
+    def __init__(
+        self,
+        table_uri: str,
+        partitions: Optional[list[tuple[str]]] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[Union[list[tuple], list[list[tuple]], Any]] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(table_uri, partitions=partitions, columns=columns, filters=filters, **kwargs)
+        self._stream = stream
+
+    def extract(self) -> Union["pa.Table", "pa.RecordBatchReader"]:  # noqa: F821
+        """Extracts data from a Delta Lake table and returns it as Arrow data.
+
+        Returns:
+            Union[Table, RecordBatchReader]: The extracted data as a pyarrow Table, or as a RecordBatchReader when
+                `stream` is True.
+        """
+        scanner = self._scanner()
+        if self._stream:
+            return scanner.to_reader()
+        return scanner.to_table()
+
+    def cache_key(self) -> Hashable:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Hashable: The table URI, the partitions, the columns, the filters and the arguments of the source.
+        """
+        return (*super().cache_key(), self._stream)
+
+
 class SparkDeltaLakeSource:
     """A source class for extracting data from a Delta Lake using Spark.
 
     Args:
         spark (SparkSession): The Spark session to use for executing the query.
         query (str): The SQL query to execute on the Delta Lake.
+        columns (Optional[list[str]], optional): The columns to select from the result of the query.
+            Defaults to None, which selects all columns.
+        arrow (bool, optional): Whether to enable the Arrow-based transfer from Spark to pandas in the session
+            during the extraction, instead of transferring the rows one by one. The previous setting of the session
+            is restored after the extraction. Defaults to True.
     """
 
-    def __init__(self, spark, query):
+    def __init__(self, spark, query, columns: Optional[list[str]] = None, arrow: bool = True):
         self._spark = spark
         self._query = query
+        self._columns = columns
+        self._arrow = arrow
 
     def extract(self) -> pd.DataFrame:
         """Executes the SQL query on the Delta Lake and returns the result as a pandas DataFrame.
@@ -61,7 +202,50 @@ class SparkDeltaLakeSource:
         Returns:
             DataFrame: The result of the SQL query as a Pandas DataFrame.
         """
-        return self._spark.sql(self._query).toPandas()
+        with arrow_enabled(self._spark, self._arrow):
+            return self._dataframe().toPandas()
+
+    def iter_batches(self, batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Iterate over the result of the SQL query in batches, bringing one partition at a time to the driver.
+
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch. Defaults to 100_000.
+
+        Yields:
+            DataFrame: The result of the SQL query, at most `batch_size` rows at a time.
+        """
+        data = self._dataframe()
+        rows = data.toLocalIterator(prefetchPartitions=True)
+        while batch := list(islice(rows, batch_size)):
+            yield pd.DataFrame.from_records(batch, columns=data.columns)
+
+    def _dataframe(self) -> Any:
+        data = self._spark.sql(self._query)
+        if self._columns is not None:
+            data = data.select(*self._columns)
+        return data
+
+    def cache_key(self) -> Hashable:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Hashable: The Spark session, the query and the columns of the source.
+        """
+        columns = None if self._columns is None else tuple(self._columns)
+        return (self.__class__.__name__, self._spark, self._query, columns, self._arrow)
+
+    def with_columns(self, columns: list[str]) -> "SparkDeltaLakeSource":
+        """Create a copy of the source that selects only the given columns, letting Spark prune the rest.
+
+        Args:
+            columns (list[str]): The columns to select.
+
+        Returns:
+            SparkDeltaLakeSource: The source that selects only the given columns.
+        """
+        source = copy.copy(self)
+        source._columns = columns
+        return source
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(query={self._query})"
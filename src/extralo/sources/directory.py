@@ -0,0 +1,215 @@
+# type: ignore
+import copy
+import fnmatch
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from extralo._store import JSONStore
+from extralo.sources.file import CSVSource
+
+
+def _checksum(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(2**20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DirectorySource:
+    """A source class for extracting only the files of a directory that were not processed yet.
+
+    A manifest of the processed files, with their size, modification time and optionally a checksum, is kept in a JSON
+    file. Each extraction lists the directory with `os.scandir`, reads the files that are not in the manifest, or
+    that changed since, in parallel, and concatenates them. The manifest is only updated by `commit`, which the ETL
+    calls after the execution succeeds, so the files of a failed execution are read again by the next one. The files
+    found by an extraction are kept by the checkpoint of the ETL, so resuming a failed execution commits them too.
+
+    Listing very large directories is kept cheap with two options:
+
+    - `sorted_names`: for files whose names increase with time, like `2024-05-05T10-00.csv`, the names that sort
+      before the last processed file are skipped without reading their metadata, as are whole subdirectories.
+    - `lookback`: the files (and, when `recursive`, the subdirectories) modified more than `lookback` seconds before
+      the newest processed file are skipped, and dropped from the manifest so it doesn't grow forever.
+
+    Args:
+        directory (str): The path to the directory.
+        manifest_file (str): The JSON file where the processed files are recorded.
+        source_class (Callable[..., Source], optional): The source used to read each file, called with the path of
+            the file and the keyword arguments. Defaults to `CSVSource`.
+        pattern (str, optional): A glob pattern that the names of the files must match. Defaults to "*".
+        recursive (bool, optional): Whether to read the files in the subdirectories too. Defaults to False.
+        checksum (bool, optional): Whether to compare the contents of the files whose size or modification time
+            changed, so that files touched without changes are not read again. Defaults to False.
+        sorted_names (bool, optional): Whether the names of new files always sort after the processed ones.
+            Defaults to False.
+        lookback (Optional[float], optional): How old, in seconds, a file may be compared to the newest processed
+            file and still be considered. Defaults to None, which considers all files.
+        path_column (Optional[str], optional): A column where the path of the file of each row is written.
+            Defaults to None.
+        max_workers (Optional[int], optional): The number of threads used to read the files. Defaults to None,
+            which uses the `ThreadPoolExecutor` default.
+        **kwargs: Additional keyword arguments to be passed to `source_class`.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        directory: str,
+        manifest_file: str,
+        source_class: Callable[..., Any] = CSVSource,
+        pattern: str = "*",
+        recursive: bool = False,
+        checksum: bool = False,
+        sorted_names: bool = False,
+        lookback: Optional[float] = None,
+        path_column: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._directory = directory
+        self._manifest = JSONStore(manifest_file)
+        self._source_class = source_class
+        self._pattern = pattern
+        self._recursive = recursive
+        self._checksum = checksum
+        self._sorted_names = sorted_names
+        self._lookback = lookback
+        self._path_column = path_column
+        self._max_workers = max_workers
+        self._kwargs = kwargs
+        self._columns: Optional[list[str]] = None
+        self._pending: dict[str, list[Any]] = {}
+        self._lock = threading.Lock()
+
+    def extract(self) -> pd.DataFrame:
+        """Extracts the files that were not processed yet and concatenates them.
+
+        Returns:
+            DataFrame: The data of the new files, or an empty DataFrame when there are none.
+        """
+        manifest = self._manifest.read()
+        processed = manifest.get("files", {})
+        cutoff = self._cutoff(manifest)
+        last = manifest.get("last") if self._sorted_names else None
+
+        pending: dict[str, list[Any]] = {}
+        new: list[str] = []
+        for path, stat in self._scan(self._directory, "", cutoff, last):
+            entry = [stat.st_size, stat.st_mtime_ns, None]
+            known = processed.get(path)
+            if known is not None and known[:2] == entry[:2]:
+                continue
+            pending[path] = entry
+            if self._checksum:
+                entry[2] = _checksum(os.path.join(self._directory, path))
+                if known is not None and known[2] == entry[2]:
+                    continue
+            new.append(path)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            frames = list(executor.map(self._read, sorted(new)))
+        with self._lock:
+            self._pending = pending
+        if not frames:
+            return pd.DataFrame(columns=self._columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def commit(self) -> None:
+        """Record the files found by the last extraction as processed, so that they are not read again."""
+        with self._lock:
+            pending = self._pending
+        if pending:
+            self._manifest.update(partial(self._record, pending))
+        with self._lock:
+            if self._pending is pending:
+                self._pending = {}
+
+    def pending(self) -> dict[str, list[Any]]:
+        """The manifest entries of the files found by the last extraction, to be recorded by `commit`.
+
+        Returns:
+            dict[str, list]: The size, modification time and checksum of each file, by path.
+        """
+        with self._lock:
+            return dict(self._pending)
+
+    def restore_pending(self, pending: dict[str, list[Any]]) -> None:
+        """Set the manifest entries to be recorded by `commit`, like the ones found by an earlier extraction.
+
+        Args:
+            pending (dict[str, list]): The entries returned by `pending`.
+        """
+        with self._lock:
+            self._pending = dict(pending)
+
+    def _record(self, pending: dict[str, list[Any]], manifest: dict[str, Any]) -> None:
+        files = manifest.setdefault("files", {})
+        files.update(pending)
+        manifest["newest"] = max(entry[1] for entry in files.values())
+        manifest["last"] = max(files)
+        cutoff = self._cutoff(manifest)
+        if cutoff is not None:
+            manifest["files"] = {path: entry for path, entry in files.items() if entry[1] >= cutoff}
+
+    def with_columns(self, columns: list[str]) -> "DirectorySource":
+        """Create a copy of the source that reads only the given columns, when the file source supports it.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            DirectorySource: The source that reads only the given columns.
+        """
+        source = copy.copy(self)
+        source._pending = {}
+        source._lock = threading.Lock()
+        source._columns = columns
+        return source
+
+    def _cutoff(self, manifest: dict[str, Any]) -> Optional[int]:
+        if self._lookback is None or manifest.get("newest") is None:
+            return None
+        return manifest["newest"] - int(self._lookback * 1e9)
+
+    def _scan(
+        self, directory: str, prefix: str, cutoff: Optional[int], last: Optional[str]
+    ) -> Iterator[tuple[str, os.stat_result]]:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = f"{prefix}{entry.name}"
+                if entry.is_dir():
+                    if not self._recursive or (
+                        last is not None and f"{path}/" < last and not last.startswith(f"{path}/")
+                    ):
+                        continue
+                    if cutoff is not None and entry.stat().st_mtime_ns < cutoff:
+                        continue
+                    yield from self._scan(entry.path, f"{path}/", cutoff, last)
+                    continue
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, self._pattern):
+                    continue
+                if last is not None and path <= last:
+                    continue
+                stat = entry.stat()
+                if cutoff is not None and stat.st_mtime_ns < cutoff:
+                    continue
+                yield path, stat
+
+    def _read(self, path: str) -> pd.DataFrame:
+        source = self._source_class(os.path.join(self._directory, path), **self._kwargs)
+        if self._columns is not None and hasattr(source, "with_columns"):
+            source = source.with_columns(self._columns)
+        data = source.extract()
+        if self._path_column is not None:
+            data[self._path_column] = path
+        return data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(directory={self._directory}, pattern={self._pattern})"
@@ -1,11 +1,19 @@
 # type: ignore
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from collections import Counter
+from collections.abc import Hashable, Iterator
+from functools import partial
+from itertools import islice
+from typing import Any, Generic, Optional, TypeVar, Union
 
 import pandas as pd
 
 T = TypeVar("T")
 
+_READ_ONLY_XLSX_KWARGS = {"sheet_name", "header", "skiprows", "usecols"}
+
 
 class FileSource(ABC, Generic[T]):
     """Represents a file source.
@@ -28,6 +36,16 @@ class FileSource(ABC, Generic[T]):
         """
         raise NotImplementedError
 
+    def cache_key(self) -> Optional[Hashable]:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Optional[Hashable]: The key, or None when the file is not a path.
+        """
+        if not isinstance(self._file, (str, os.PathLike)):
+            return None
+        return (self.__class__.__name__, os.fspath(self._file), repr(sorted(self._kwargs.items())))
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(file={self._file})"
 
@@ -47,42 +65,321 @@ class CSVSource(FileSource[pd.DataFrame]):
         data: pd.DataFrame = pd.read_csv(self._file, **self._kwargs)
         return data
 
+    def with_columns(self, columns: list[str]) -> "CSVSource":
+        """Create a copy of the source that reads only the given columns, using `usecols`.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            CSVSource: The source that reads only the given columns.
+        """
+        return self.__class__(self._file, **{**self._kwargs, "usecols": columns})
+
 
 class XLSXSource(FileSource[pd.DataFrame]):
     """A class representing a XLSX data source.
 
     This class inherits from the FileSource class and provides a method to extract data from a XLSX file.
+
+    A single workbook can feed several ETL keys: each call to `sheet` returns a source for one sheet, and the workbook
+    is parsed only once for all of them, no matter how many sheets were requested.
+
+    With `read_only=True`, rows are streamed with openpyxl read-only mode instead of loading the whole workbook object
+    model in memory. In this mode only the `sheet_name`, `header`, `skiprows` and `usecols` keyword arguments are
+    supported, and `usecols` must be a list of column names.
+
+    Args:
+        file (str): The path to the file.
+        read_only (bool, optional): Whether to stream the rows using openpyxl read-only mode. Defaults to False.
+        **kwargs: Additional keyword arguments to be passed to `pd.read_excel`.
+
+    Raises:
+        ValueError: If `read_only` is True and unsupported keyword arguments are given.
     """
 
+    def __init__(self, file: str, read_only: bool = False, **kwargs: Any) -> None:
+        super().__init__(file, **kwargs)
+        if read_only:
+            unsupported = set(kwargs) - _READ_ONLY_XLSX_KWARGS
+            if unsupported:
+                raise ValueError(f"Arguments {unsupported} are not supported by XLSXSource with read_only=True")
+        self._read_only = read_only
+        self._sheets: list[Union[str, int]] = []
+        self._workbook: Optional[dict[Union[str, int], pd.DataFrame]] = None
+        self._remaining: Counter[Union[str, int]] = Counter()
+        self._parsed: Optional[tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def cache_key(self) -> Optional[Hashable]:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Optional[Hashable]: The key, or None when the file is not a path.
+        """
+        key = super().cache_key()
+        return None if key is None else (*key, self._read_only)
+
+    def with_columns(self, columns: list[str]) -> "XLSXSource":
+        """Create a copy of the source that reads only the given columns, using `usecols`.
+
+        The columns are selected by name, so when the header is not the first row, or there is no header, the source
+        itself is returned and all columns are read.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            XLSXSource: The source that reads only the given columns.
+        """
+        if self._kwargs.get("header", 0) != 0:
+            return self
+        return self.__class__(self._file, read_only=self._read_only, **{**self._kwargs, "usecols": columns})
+
+    def sheet(self, sheet_name: Union[str, int]) -> "XLSXSheetSource":
+        """Create a source for a single sheet of this workbook.
+
+        All the sheet sources created from the same `XLSXSource` share a single parse of the workbook.
+
+        Args:
+            sheet_name (Union[str, int]): The name or the zero-based position of the sheet.
+
+        Returns:
+            XLSXSheetSource: A source that extracts only the given sheet.
+        """
+        with self._lock:
+            self._sheets.append(sheet_name)
+        return XLSXSheetSource(self, sheet_name)
+
     def extract(self) -> pd.DataFrame:
         """Extracts data from an Excel file.
 
         Returns:
             DataFrame: The extracted data.
         """
+        if self._read_only:
+            sheet_name = self._kwargs.get("sheet_name", 0)
+            return self._read_only_sheets([sheet_name])[sheet_name]
         data: pd.DataFrame = pd.read_excel(self._file, **self._kwargs)
         return data
 
+    def iter_batches(self, batch_size: int = 10_000) -> Iterator[pd.DataFrame]:
+        """Iterate over the rows of the sheet in batches, using openpyxl read-only mode.
+
+        Only one sheet is read, given by the `sheet_name` keyword argument (the first sheet by default).
+
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch. Defaults to 10_000.
+
+        Yields:
+            DataFrame: The rows of the sheet, at most `batch_size` at a time.
+        """
+        import openpyxl  # noqa: PLC0415
+
+        workbook = openpyxl.load_workbook(self._file, read_only=True, data_only=True)
+        try:
+            yield from self._iter_sheet(workbook, self._kwargs.get("sheet_name", 0), batch_size)
+        finally:
+            workbook.close()
+
+    def _extract_sheet(self, sheet_name: Union[str, int]) -> pd.DataFrame:
+        # The parse is kept until every sheet source extracted its sheet, unless the file changes in the meantime,
+        # like when some sheet sources are not extracted in a run.
+        signature = self._signature()
+        with self._lock:
+            if self._workbook is None or signature != self._parsed:
+                sheets = list(dict.fromkeys(self._sheets))
+                self._workbook = self._read_sheets(sheets)
+                self._parsed = signature
+                self._remaining = Counter(self._sheets)
+            data = self._workbook[sheet_name]
+            self._remaining[sheet_name] -= 1
+            if all(count <= 0 for count in self._remaining.values()):
+                self._workbook = None
+        return data
+
+    def _signature(self) -> Optional[tuple[int, int]]:
+        if not isinstance(self._file, (str, os.PathLike)):
+            return None
+        stat = os.stat(self._file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _read_sheets(self, sheets: list[Union[str, int]]) -> dict[Union[str, int], pd.DataFrame]:
+        if self._read_only:
+            return self._read_only_sheets(sheets)
+        kwargs = {key: value for key, value in self._kwargs.items() if key != "sheet_name"}
+        return pd.read_excel(self._file, sheet_name=sheets, **kwargs)
+
+    def _read_only_sheets(self, sheets: list[Union[str, int]]) -> dict[Union[str, int], pd.DataFrame]:
+        import openpyxl  # noqa: PLC0415
+
+        workbook = openpyxl.load_workbook(self._file, read_only=True, data_only=True)
+        try:
+            return {sheet: pd.concat(list(self._iter_sheet(workbook, sheet))) for sheet in sheets}
+        finally:
+            workbook.close()
+
+    def _iter_sheet(
+        self, workbook: Any, sheet_name: Union[str, int], batch_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        worksheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = worksheet.iter_rows(values_only=True)
+        for _ in range(self._kwargs.get("skiprows") or 0):
+            next(rows, None)
+
+        columns: Optional[list[Any]] = None
+        header = self._kwargs.get("header", 0)
+        if header is not None:
+            for _ in range(header):
+                next(rows, None)
+            columns = list(next(rows, ()))
+
+        start = 0
+        yielded = False
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch and yielded:
+                return
+            data = pd.DataFrame.from_records(batch, columns=columns)
+            if self._kwargs.get("usecols") is not None:
+                data = data[self._kwargs["usecols"]]
+            data.index = pd.RangeIndex(start, start + len(data))
+            start += len(data)
+            yielded = True
+            yield data
+            if batch_size is None or len(batch) < batch_size:
+                return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(file={self._file}, read_only={self._read_only})"
+
+
+class XLSXSheetSource:
+    """A source for a single sheet of a workbook, created by `XLSXSource.sheet`.
+
+    Args:
+        workbook (XLSXSource): The workbook source that parses the file.
+        sheet_name (Union[str, int]): The name or the zero-based position of the sheet.
+    """
+
+    def __init__(self, workbook: "XLSXSource", sheet_name: Union[str, int]) -> None:
+        self._workbook = workbook
+        self._sheet_name = sheet_name
+
+    def extract(self) -> pd.DataFrame:
+        """Extracts the sheet from the workbook, parsing the workbook only once for all of its sheet sources.
+
+        Returns:
+            DataFrame: The extracted sheet.
+        """
+        return self._workbook._extract_sheet(self._sheet_name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(file={self._workbook._file}, sheet_name={self._sheet_name})"
+
+
+def _decode_sas_chunk(
+    data: pd.DataFrame, encoding: Optional[str], date_columns: list[str], datetime_columns: list[str]
+) -> pd.DataFrame:
+    if encoding is not None:
+        for column in data.select_dtypes(include="object").columns:
+            values = data[column].dropna()
+            if len(values) and isinstance(values.iloc[0], bytes):
+                data[column] = data[column].str.decode(encoding)
+    for column in date_columns:
+        data[column] = pd.to_datetime(data[column], unit="D", origin="1960-01-01")
+    for column in datetime_columns:
+        data[column] = pd.to_datetime(data[column], unit="s", origin="1960-01-01")
+    return data
+
 
 class SASSource(FileSource[pd.DataFrame]):
     """A class representing a SAS data source.
 
     This class inherits from the FileSource class and provides a method to extract data from a SAS file.
+
+    Large files can be read in chunks with `iter_batches`, or with the `chunksize` keyword argument. The raw chunks
+    are read with the byte strings undecoded, which are then decoded column by column in a vectorized pass, together
+    with the conversion of the given date columns. The batches can be streamed straight into a columnar file, for
+    instance with `ParquetDestination(path).load(source.iter_batches())`.
+
+    Args:
+        file (str): The path to the file.
+        encoding (Optional[str], optional): The encoding of the text columns, or "infer" to use the encoding of the
+            file. Defaults to None, which keeps the text columns as bytes.
+        date_columns (Optional[list[str]], optional): Numeric columns holding SAS dates (days since 1960-01-01) to
+            convert to datetime. Defaults to None.
+        datetime_columns (Optional[list[str]], optional): Numeric columns holding SAS datetimes (seconds since
+            1960-01-01) to convert to datetime. Defaults to None.
+        **kwargs: Additional keyword arguments to be passed to `pd.read_sas`.
     """
 
+    def __init__(
+        self,
+        file: str,
+        encoding: Optional[str] = None,
+        date_columns: Optional[list[str]] = None,
+        datetime_columns: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file, **kwargs)
+        self._encoding = encoding
+        self._date_columns = date_columns or []
+        self._datetime_columns = datetime_columns or []
+
+    def cache_key(self) -> Optional[Hashable]:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Optional[Hashable]: The key, or None when the file is not a path.
+        """
+        key = super().cache_key()
+        if key is None:
+            return None
+        return (*key, self._encoding, tuple(self._date_columns), tuple(self._datetime_columns))
+
     def extract(self) -> pd.DataFrame:
         """Extracts data from a SAS file.
 
         Returns:
             DataFrame: The extracted data.
         """
-        return pd.read_sas(self._file, **self._kwargs)
+        kwargs = {key: value for key, value in self._kwargs.items() if key != "chunksize"}
+        if self._kwargs.get("chunksize") is not None:
+            return pd.concat(list(self.iter_batches(self._kwargs.get("chunksize") or 100_000)), ignore_index=True)
+        data = pd.read_sas(self._file, encoding=self._encoding, **kwargs)
+        return _decode_sas_chunk(data, None, self._date_columns, self._datetime_columns)
+
+    def iter_batches(self, batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Iterate over a SAS file in chunks of rows, without reading the whole file in memory.
+
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch. Defaults to 100_000.
+
+        Yields:
+            DataFrame: The data, at most `batch_size` rows at a time.
+        """
+        kwargs = {**self._kwargs, "chunksize": batch_size}
+        with pd.read_sas(self._file, **kwargs) as reader:
+            encoding = self._encoding
+            if encoding == "infer":
+                encoding = getattr(reader, "inferred_encoding", None) or "latin-1"
+            decode = partial(
+                _decode_sas_chunk,
+                encoding=encoding,
+                date_columns=self._date_columns,
+                datetime_columns=self._datetime_columns,
+            )
+            yield from map(decode, reader)
 
 
 class JSONSource(FileSource[pd.DataFrame]):
     """A class representing a JSON data source.
 
     This class inherits from the FileSource class and provides a method to extract data from a JSON file.
+
+    Newline-delimited JSON files are read with `lines=True`. Passing `chunksize` as well makes the file be parsed in
+    batches of lines, and `iter_batches` yields these batches without reading the whole file in memory.
     """
 
     def extract(self) -> pd.DataFrame:
@@ -91,4 +388,21 @@ class JSONSource(FileSource[pd.DataFrame]):
         Returns:
             DataFrame: The extracted data.
         """
+        if self._kwargs.get("chunksize") is not None:
+            return pd.concat(list(self.iter_batches(self._kwargs["chunksize"])), ignore_index=True)
         return pd.read_json(self._file, **self._kwargs)
+
+    def iter_batches(self, batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Iterate over a newline-delimited JSON file in batches of lines.
+
+        Each batch is parsed into typed columns, using the `dtype` keyword argument when given.
+
+        Args:
+            batch_size (int, optional): The maximum number of lines in each batch. Defaults to 100_000.
+
+        Yields:
+            DataFrame: The data, at most `batch_size` rows at a time.
+        """
+        kwargs = {**self._kwargs, "lines": True, "chunksize": batch_size}
+        with pd.read_json(self._file, **kwargs) as reader:
+            yield from reader
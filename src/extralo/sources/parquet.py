@@ -0,0 +1,96 @@
+# type: ignore
+from collections.abc import Hashable, Iterator
+from typing import Any, Optional, Union
+
+import pandas as pd
+
+
+class ParquetSource:
+    """A source class for extracting data from Parquet files.
+
+    The path can be a single file or a directory with several files, including Hive-style partitioned directories.
+    The filters are pushed down to the Parquet reader: partitions and row groups whose statistics cannot match the
+    filters are skipped without being read.
+
+    Args:
+        path (str): The path to the Parquet file or directory.
+        columns (Optional[list[str]], optional): The columns to read. Defaults to None, which reads all columns.
+        filters (Optional[Union[list[tuple], list[list[tuple]], Expression]], optional): The rows to read, as
+            DNF-style filters, like `[("col1", "=", 2)]`, or as a pyarrow dataset expression. Defaults to None.
+        **kwargs: Additional keyword arguments to be passed to `Table.to_pandas`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[list[str]] = None,
+        filters: Optional[Union[list[tuple], list[list[tuple]], Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            import pyarrow  # noqa: F401, PLC0415
+        except ImportError as err:
+            raise ImportError(
+                "PyArrow is required to use ParquetSource. Please install it with `pip install pyarrow`."
+            ) from err
+        self._path = path
+        self._columns = columns
+        self._filters = filters
+        self._kwargs = kwargs
+
+    def extract(self) -> pd.DataFrame:
+        """Extracts data from the Parquet files and returns it as a pandas DataFrame.
+
+        Returns:
+            DataFrame: The extracted data as a pandas DataFrame.
+        """
+        return self._scanner().to_table().to_pandas(**self._kwargs)
+
+    def iter_batches(self, batch_size: int = 131_072) -> Iterator[pd.DataFrame]:
+        """Iterate over the Parquet files in record batches, without reading the whole data in memory.
+
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch. Defaults to 131_072.
+
+        Yields:
+            DataFrame: The data, at most `batch_size` rows at a time.
+        """
+        for batch in self._scanner(batch_size=batch_size).to_batches():
+            yield batch.to_pandas(**self._kwargs)
+
+    def with_columns(self, columns: list[str]) -> "ParquetSource":
+        """Create a copy of the source that reads only the given columns.
+
+        Args:
+            columns (list[str]): The columns to read.
+
+        Returns:
+            ParquetSource: The source that reads only the given columns.
+        """
+        return self.__class__(self._path, columns=columns, filters=self._filters, **self._kwargs)
+
+    def cache_key(self) -> Hashable:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Hashable: The path, the columns, the filters and the arguments of the source.
+        """
+        columns = None if self._columns is None else tuple(self._columns)
+        return (
+            self.__class__.__name__,
+            str(self._path),
+            columns,
+            repr(self._filters),
+            repr(sorted(self._kwargs.items())),
+        )
+
+    def _scanner(self, **kwargs: Any) -> Any:
+        import pyarrow.dataset as ds  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        dataset = ds.dataset(self._path, format="parquet", partitioning="hive")
+        filters = pq.filters_to_expression(self._filters) if isinstance(self._filters, list) else self._filters
+        return dataset.scanner(columns=self._columns, filter=filters, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._path})"
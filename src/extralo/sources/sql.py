@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Any, Optional
 
 import pandas as pd
@@ -13,9 +14,18 @@ class SQLSource:
         engine (object): The database engine object.
         query (str): The SQL query to execute.
         params (dict, optional): The parameters to be passed to the SQL query. Defaults to None.
+        columns (list[str], optional): The columns to select from the result of the last statement, by wrapping it in
+            a subquery, rendered by SQLAlchemy for the dialect of the engine. Defaults to None, which selects all
+            columns.
     """
 
-    def __init__(self, engine: Any, query: str, params: Optional[dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        engine: Any,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        columns: Optional[list[str]] = None,
+    ) -> None:
         try:
             import sqlalchemy  # type: ignore # noqa: F401, PLC0415
             import sqlalchemy.exc  # type: ignore # noqa: F401, PLC0415
@@ -32,6 +42,7 @@ class SQLSource:
         self._engine = engine
         self._query = query
         self._params = params or {}
+        self._columns = columns
 
     def extract(self) -> pd.DataFrame:
         """Extracts data from the database using the provided SQL query.
@@ -44,17 +55,45 @@ class SQLSource:
         import sqlparse as sp  # type: ignore  # noqa: PLC0415
 
         query = sp.split(self._query)  # type: ignore
+        last = sa.text(query[-1]) if self._columns is None else self._project(query[-1])
         with self._engine.begin() as connection:
             for statement in query[:-1]:
                 connection.execute(
                     sa.text(statement), parameters=self._params, execution_options={"no_parameters": True}
                 )
             try:
-                data = pd.read_sql(sa.text(query[-1]), connection, params=self._params)  # type: ignore
+                data = pd.read_sql(last, connection, params=self._params)  # type: ignore
             except sa_exc.ProgrammingError:
-                data = pd.read_sql(sa.text(query[-1]), connection)  # type: ignore
+                data = pd.read_sql(last, connection)  # type: ignore
 
         return data
 
+    def with_columns(self, columns: list[str]) -> "SQLSource":
+        """Create a copy of the source that selects only the given columns from the result of the query.
+
+        Args:
+            columns (list[str]): The columns to select.
+
+        Returns:
+            SQLSource: The source that selects only the given columns.
+        """
+        return self.__class__(self._engine, self._query, self._params, columns=columns)
+
+    def cache_key(self) -> Hashable:
+        """A key that is equal for the sources that read the same data, so that it's extracted only once per run.
+
+        Returns:
+            Hashable: The engine, the query, the parameters and the columns of the source.
+        """
+        columns = None if self._columns is None else tuple(self._columns)
+        return (self.__class__.__name__, self._engine, self._query, repr(sorted(self._params.items())), columns)
+
+    def _project(self, statement: str) -> Any:
+        import sqlalchemy as sa  # noqa: PLC0415
+
+        columns = [sa.column(column) for column in self._columns or []]
+        subquery = sa.text(statement.strip().rstrip(";")).columns(*columns).subquery("extralo_projection")
+        return sa.select(*(subquery.c[column.name] for column in columns))
+
     def __repr__(self) -> str:
         return f"SQLSource(engine={self._engine})"
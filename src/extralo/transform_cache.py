@@ -0,0 +1,158 @@
+import hashlib
+import inspect
+import json
+import marshal
+import os
+import pickle
+import shutil
+import uuid
+from collections.abc import Callable
+from typing import Any, Optional
+
+from extralo._filelock import file_lock
+
+_MANIFEST_FILE = "manifest.json"
+
+
+def _code_digest(transformer: Callable[..., Any]) -> Optional[bytes]:
+    # The instance of a method or of a callable object is part of the key, as the closure of a function.
+    function = inspect.unwrap(transformer)
+    instance = getattr(function, "__self__", None)
+    if not inspect.isfunction(function) and not inspect.ismethod(function):
+        instance, function = function, getattr(type(function), "__call__", None)  # noqa: B004
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return None
+    cells = tuple(cell.cell_contents for cell in getattr(function, "__closure__", None) or ())
+    state = (instance, cells, getattr(function, "__defaults__", None), getattr(function, "__kwdefaults__", None))
+    try:
+        return marshal.dumps(code) + pickle.dumps(state)
+    except (TypeError, ValueError, AttributeError, pickle.PicklingError):
+        return None
+
+
+class TransformCache:
+    """A local cache of the outputs of transformers, to skip running them again with the same inputs.
+
+    The key of each entry combines a fingerprint of every input DataFrame, the code object of the transformer and
+    the values in its closure and defaults. The outputs are stored as Arrow IPC files and memory-mapped back on a
+    hit. When the cache gets bigger than `max_size`, the least recently used entries are removed.
+
+    Changes in the global variables or the functions called by the transformer are not detected, so the cache must
+    be cleared when they change. Requires pyarrow.
+
+    Args:
+        directory (str): The directory where the outputs are kept.
+        max_size (int, optional): The maximum size of the cache, in bytes. Defaults to 1 GiB.
+    """
+
+    def __init__(self, directory: str, max_size: int = 1024**3) -> None:
+        try:
+            import pyarrow  # noqa: F401, PLC0415
+        except ImportError as err:
+            raise ImportError(
+                "PyArrow is required to use TransformCache. Please install it with `pip install pyarrow`."
+            ) from err
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._lock_path = os.path.join(directory, "cache")
+        self._max_size = max_size
+
+    @staticmethod
+    def key(transformer: Callable[..., Any], data: dict[str, Any]) -> Optional[str]:
+        """Compute the key of the outputs of the transformer for the given inputs.
+
+        Args:
+            transformer (Callable[..., dict[str, Any]]): The transformer.
+            data (dict[str, Any]): The inputs of the transformer.
+
+        Returns:
+            Optional[str]: The key, or None when the transformer or the inputs can't be fingerprinted.
+        """
+        from extralo._fingerprint import fingerprint  # noqa: PLC0415
+
+        code = _code_digest(transformer)
+        if code is None:
+            return None
+        digest = hashlib.blake2b(code, digest_size=20)
+        for name in sorted(data):
+            value = fingerprint(data[name])
+            if value is None:
+                return None
+            digest.update(f"{name}={value};".encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Read the outputs stored with the given key.
+
+        Args:
+            key (str): The key of the outputs.
+
+        Returns:
+            Optional[dict[str, Any]]: The outputs, or None when they are not in the cache.
+        """
+        from extralo._ipc import restore  # noqa: PLC0415
+
+        entry = os.path.join(self._directory, key)
+        with file_lock(self._lock_path):
+            manifest = os.path.join(entry, _MANIFEST_FILE)
+            if not os.path.exists(manifest):
+                return None
+            with open(manifest, encoding="utf-8") as file:
+                files = json.load(file)
+            os.utime(manifest)
+            return {name: restore(os.path.join(entry, file)) for name, file in files.items()}
+
+    def save(self, key: str, outputs: dict[str, Any]) -> None:
+        """Store the outputs with the given key, evicting the least recently used entries when over the size limit.
+
+        Args:
+            key (str): The key of the outputs.
+            outputs (dict[str, Any]): The outputs of the transformer.
+        """
+        from extralo._ipc import persist  # noqa: PLC0415
+
+        staging = os.path.join(self._directory, f".{key}-{uuid.uuid4().hex}")
+        os.makedirs(staging)
+        try:
+            files = {
+                name: os.path.basename(persist(value, os.path.join(staging, str(index))))
+                for index, (name, value) in enumerate(outputs.items())
+            }
+            with open(os.path.join(staging, _MANIFEST_FILE), "w", encoding="utf-8") as file:
+                json.dump(files, file)
+            with file_lock(self._lock_path):
+                entry = os.path.join(self._directory, key)
+                shutil.rmtree(entry, ignore_errors=True)
+                os.replace(staging, entry)
+                self._evict()
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache."""
+        with file_lock(self._lock_path):
+            for entry in self._entries():
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def _entries(self) -> list[str]:
+        return [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory)
+            if not name.startswith(".") and os.path.exists(os.path.join(self._directory, name, _MANIFEST_FILE))
+        ]
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: os.path.getmtime(os.path.join(entry, _MANIFEST_FILE)))
+        sizes = {
+            entry: sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry)) for entry in entries
+        }
+        total = sum(sizes.values())
+        for entry in entries[:-1]:
+            if total <= self._max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(directory={self._directory})"
@@ -0,0 +1,190 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Protocol, Union
+
+import loguru
+import pandas as pd
+
+
+class Schema(Protocol):
+    """Protocol for a schema that validates a DataFrame, like a pandera `DataFrameSchema` or `DataFrameModel`."""
+
+    def validate(self, check_obj: pd.DataFrame, *args: Any, **kwargs: Any) -> pd.DataFrame:
+        """Validate the DataFrame, raising an error when it doesn't match the schema.
+
+        Args:
+            check_obj (DataFrame): The DataFrame to validate.
+            *args: Additional arguments of the validation.
+            **kwargs: Additional keyword arguments of the validation.
+
+        Returns:
+            DataFrame: The validated DataFrame, possibly with coerced types.
+        """
+        ...
+
+
+def _schema_object(schema: Schema) -> Any:
+    to_schema = getattr(schema, "to_schema", None)
+    return to_schema() if to_schema is not None else schema
+
+
+# The built-in checks that test each row on its own, and give the same result on any split of the rows.
+_ROW_CHECKS = frozenset(
+    {
+        "equal_to",
+        "not_equal_to",
+        "greater_than",
+        "greater_than_or_equal_to",
+        "less_than",
+        "less_than_or_equal_to",
+        "in_range",
+        "isin",
+        "notin",
+        "str_matches",
+        "str_contains",
+        "str_startswith",
+        "str_endswith",
+        "str_length",
+    }
+)
+
+
+def _components(schema: Any) -> list[Any]:
+    columns = getattr(schema, "columns", {}) or {}
+    index = getattr(schema, "index", None)
+    indexes = getattr(index, "indexes", None) or ([index] if index is not None else [])
+    return [*columns.values(), *indexes]
+
+
+def _row_check(check: Any) -> bool:
+    return getattr(check, "groupby", None) is None and (
+        getattr(check, "element_wise", False) or getattr(check, "name", None) in _ROW_CHECKS
+    )
+
+
+def _checks_whole_frame(schema: Schema) -> bool:
+    # Uniqueness, checks of the whole DataFrame and checks that may aggregate a column, like
+    # `is_monotonic_increasing`, can give different results on chunks.
+    schema = _schema_object(schema)
+    if getattr(schema, "unique", None) or getattr(schema, "checks", None):
+        return True
+    return any(
+        getattr(component, "unique", False)
+        or not all(_row_check(check) for check in getattr(component, "checks", None) or [])
+        for component in _components(schema)
+    )
+
+
+def _transforms(schema: Schema) -> bool:
+    # Whether validating may change the data: coerce types, parse values, fill defaults, or add or drop rows and
+    # columns.
+    schema = _schema_object(schema)
+    if (
+        getattr(schema, "coerce", False)
+        or getattr(schema, "parsers", None)
+        or getattr(schema, "drop_invalid_rows", False)
+        or getattr(schema, "add_missing_columns", False)
+        or getattr(schema, "strict", False) == "filter"
+    ):
+        return True
+    return any(
+        getattr(component, "coerce", False)
+        or getattr(component, "parsers", None)
+        or getattr(component, "default", None) is not None
+        or getattr(component, "drop_invalid_rows", False)
+        for component in _components(schema)
+    )
+
+
+class SchemaValidation:
+    """Options to validate the data of an ETL against schemas, like pandera schemas.
+
+    The keys are validated concurrently, and large DataFrames are split in chunks of rows that are validated
+    concurrently too, so the validation uses all the cores instead of running serially on the full data. Only the
+    schemas whose checks test each row on its own are split: schemas that check uniqueness, have checks of the whole
+    DataFrame, or custom column checks that may aggregate the column, like `is_monotonic_increasing`, are validated on
+    the whole DataFrame. When the schema may change the data, like coercing types, parsing values or dropping invalid
+    rows, the validated chunks are concatenated back.
+
+    With `sample`, only a random sample of the rows is validated, which is much faster for very large inputs but can
+    miss invalid rows. In this mode the data is only checked, and types are not coerced.
+
+    Args:
+        chunk_size (Optional[int], optional): The number of rows of each chunk. Defaults to 1_000_000. None
+            validates each DataFrame whole.
+        sample (Optional[Union[int, float]], optional): The number of rows, or the fraction of the rows, to validate.
+            Defaults to None, which validates all rows.
+        max_workers (Optional[int], optional): The number of threads used to validate. Defaults to None, which uses
+            the number of cores.
+        random_state (Optional[int], optional): The seed used to draw the sample. Defaults to None.
+        **kwargs: Additional keyword arguments to be passed to the `validate` method of the schemas.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = 1_000_000,
+        sample: Optional[Union[int, float]] = None,
+        max_workers: Optional[int] = None,
+        random_state: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._chunk_size = chunk_size
+        self._sample = sample
+        self._max_workers = max_workers or os.cpu_count()
+        self._random_state = random_state
+        self._kwargs = kwargs
+
+    def validate(self, data: dict[str, Any], schemas: dict[str, Schema], logger: "loguru.Logger") -> dict[str, Any]:
+        """Validate the data of each key against its schema.
+
+        Args:
+            data (dict[str, DataFrame]): The data to validate.
+            schemas (dict[str, Schema]): The schema of each key. Keys without a schema are not validated.
+            logger (loguru.Logger): The logger used to log the validation.
+
+        Returns:
+            dict[str, DataFrame]: The validated data.
+
+        Raises:
+            KeyError: If there is a schema for a key that is not in the data.
+        """
+        missing = schemas.keys() - data.keys()
+        if missing:
+            raise KeyError(f"Schemas were given for {missing}, but there is no data with these keys")
+        if not schemas:
+            return data
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                name: [
+                    executor.submit(schema.validate, part, **self._kwargs) for part in self._parts(data[name], schema)
+                ]
+                for name, schema in schemas.items()
+            }
+            validated = dict(data)
+            for name, parts in futures.items():
+                results = [future.result() for future in parts]
+                validated[name] = self._combine(data[name], schemas[name], results)
+                logger.info(f"Validated '{name}' against {schemas[name]}")
+        return validated
+
+    def _parts(self, data: pd.DataFrame, schema: Schema) -> list[pd.DataFrame]:
+        if self._sample is not None:
+            if isinstance(self._sample, float):
+                return [data.sample(frac=self._sample, random_state=self._random_state)]
+            return [data.sample(n=min(self._sample, len(data)), random_state=self._random_state)]
+        if self._chunk_size is None or len(data) <= self._chunk_size or _checks_whole_frame(schema):
+            return [data]
+        return [data.iloc[start : start + self._chunk_size] for start in range(0, len(data), self._chunk_size)]
+
+    def _combine(self, data: pd.DataFrame, schema: Schema, results: list[pd.DataFrame]) -> pd.DataFrame:
+        if self._sample is not None:
+            return data
+        if len(results) == 1:
+            return results[0]
+        if not _transforms(schema):
+            return data
+        return pd.concat(results)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(chunk_size={self._chunk_size}, sample={self._sample})"
@@ -1,10 +1,19 @@
 import os
+from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 from deltalake import DeltaTable, write_deltalake
 from pandas.testing import assert_frame_equal
 
-from extralo.destinations.delta_lake import DeltaLakeDestination, SparkDeltaLakeDestination
+from extralo import ETL
+from extralo.destinations.delta_lake import (
+    ArrowDeltaLakeDestination,
+    DeltaLakeDestination,
+    DeltaLakeMaintenance,
+    SparkDeltaLakeDestination,
+)
 
 
 def test_delta_lake_destination_load(tmpdir):
@@ -34,6 +43,118 @@ def test_delta_lake_destination_load(tmpdir):
     )
 
 
+def test_arrow_delta_lake_destination_load_streams_reader(tmpdir):
+    schema = pa.schema([("col1", pa.int32()), ("col2", pa.string())])
+    batches = [pa.record_batch({"col1": [i, i], "col2": ["a", "b"]}) for i in range(3)]
+    reader = pa.RecordBatchReader.from_batches(batches[0].schema, iter(batches))
+
+    file_path = os.path.join(tmpdir, "test")
+    ArrowDeltaLakeDestination(table_uri=file_path, mode="append", schema=schema).load(reader)
+
+    obtained_data = DeltaTable(file_path).to_pyarrow_table()
+
+    assert obtained_data.schema == schema
+    assert obtained_data.num_rows == 6
+
+
+def test_arrow_delta_lake_destination_reader_fans_out_to_every_destination(tmpdir):
+    batches = [pa.record_batch({"col1": [i, i], "col2": ["a", "b"]}) for i in range(3)]
+
+    class ReaderSource:
+        def extract(self):
+            return pa.RecordBatchReader.from_batches(batches[0].schema, iter(batches))
+
+    paths = [os.path.join(tmpdir, "first"), os.path.join(tmpdir, "second")]
+    ETL(
+        sources={"data": ReaderSource()},
+        destinations={"data": [ArrowDeltaLakeDestination(table_uri=path, mode="append") for path in paths]},
+    ).execute()
+
+    assert [DeltaTable(path).to_pyarrow_table().num_rows for path in paths] == [6, 6]
+
+
+def test_delta_lake_destination_runs_maintenance(tmpdir):
+    file_path = os.path.join(tmpdir, "test")
+    maintenance = DeltaLakeMaintenance(
+        optimize_every=3, vacuum_every=3, vacuum_retention_hours=0, enforce_retention_duration=False
+    )
+    delta_lake_destination = DeltaLakeDestination(table_uri=file_path, mode="append", maintenance=maintenance)
+
+    for i in range(4):
+        delta_lake_destination.load(pd.DataFrame({"col1": [i]}))
+
+    table = DeltaTable(file_path)
+    operations = [commit["operation"] for commit in table.history()]
+    assert operations.count("OPTIMIZE") == 1
+    assert operations.count("VACUUM END") == 1
+    assert len(table.file_uris()) == 2
+    assert len([name for name in os.listdir(file_path) if name.endswith(".parquet")]) == 2
+    assert sorted(table.to_pandas()["col1"]) == [0, 1, 2, 3]
+
+
+def test_delta_lake_destination_compacts_small_files(tmpdir):
+    file_path = os.path.join(tmpdir, "test")
+    maintenance = DeltaLakeMaintenance(max_small_files=2)
+    delta_lake_destination = DeltaLakeDestination(
+        table_uri=file_path, mode="append", maintenance=maintenance, max_row_group_size=1
+    )
+
+    for i in range(3):
+        delta_lake_destination.load(pd.DataFrame({"col1": [i]}))
+
+    assert len(DeltaTable(file_path).file_uris()) == 1
+
+
+def test_delta_lake_destination_merge(tmpdir):
+    file_path = os.path.join(tmpdir, "test")
+    delta_lake_destination = DeltaLakeDestination(table_uri=file_path, mode="merge", merge_on=["id"])
+
+    delta_lake_destination.load(pd.DataFrame({"id": [1, 2, 3], "value": ["a", "b", "c"]}))
+    delta_lake_destination.load(pd.DataFrame({"id": [2, 4], "value": ["bb", "d"]}))
+
+    obtained_data = DeltaTable(file_path).to_pandas().sort_values("id").reset_index(drop=True)
+    expected_data = pd.DataFrame({"id": [1, 2, 3, 4], "value": ["a", "bb", "c", "d"]})
+    assert_frame_equal(obtained_data, expected_data)
+
+    DeltaLakeDestination(table_uri=file_path, mode="merge", merge_on=["id"], delete_unmatched=True).load(
+        pd.DataFrame({"id": [1], "value": ["aa"]})
+    )
+
+    assert_frame_equal(DeltaTable(file_path).to_pandas(), pd.DataFrame({"id": [1], "value": ["aa"]}))
+
+
+def test_delta_lake_destination_merge_uses_storage_options(tmpdir, monkeypatch):
+    import deltalake  # noqa: PLC0415
+
+    storage_options = {}
+    received = []
+
+    class SpyDeltaTable(DeltaTable):
+        def __init__(self, table_uri, *args, storage_options=None, **kwargs):
+            received.append(storage_options)
+            super().__init__(table_uri, *args, storage_options=storage_options, **kwargs)
+
+        @staticmethod
+        def is_deltatable(table_uri, storage_options=None):
+            received.append(storage_options)
+            return DeltaTable.is_deltatable(table_uri, storage_options=storage_options)
+
+    monkeypatch.setattr(deltalake, "DeltaTable", SpyDeltaTable)
+    file_path = os.path.join(tmpdir, "test")
+    destination = DeltaLakeDestination(
+        table_uri=file_path,
+        mode="merge",
+        merge_on=["id"],
+        maintenance=DeltaLakeMaintenance(optimize_every=1),
+        storage_options=storage_options,
+    )
+    destination.load(pd.DataFrame({"id": [1], "value": ["a"]}))
+    destination.load(pd.DataFrame({"id": [1], "value": ["b"]}))
+
+    assert len(received) >= 5
+    assert all(options is storage_options for options in received)
+
+
 def test_spark_delta_lake_destination_load(spark):
     # Create a sample DataFrame
     initial_data = pd.DataFrame({"col1": [1, 1, 2, 2, 3, 3], "col2": ["a", "b", "c", "d", "e", "f"]})
@@ -58,3 +179,65 @@ def test_spark_delta_lake_destination_load(spark):
         obtained_data.sort_values("col2").reset_index(drop=True),
         expected_data.sort_values("col2").reset_index(drop=True),
     )
+
+
+def test_spark_delta_lake_destination_load_in_chunks(spark):
+    data = pd.DataFrame({"col1": [1, 1, 2, 2, 3], "col2": ["a", "b", "c", "d", "e"]})
+
+    delta_lake_destination = SparkDeltaLakeDestination(
+        spark=spark, table="test_chunks_table", mode="overwrite", chunksize=2
+    )
+    delta_lake_destination.load(data)
+
+    obtained_data = spark.sql("SELECT * FROM test_chunks_table").toPandas()
+
+    assert_frame_equal(
+        obtained_data.sort_values("col2").reset_index(drop=True),
+        data.sort_values("col2").reset_index(drop=True),
+    )
+
+
+class FakeSparkSession:
+    def __init__(self, arrow=None):
+        self.settings = {} if arrow is None else {"spark.sql.execution.arrow.pyspark.enabled": arrow}
+        self.writes = []
+        self.conf = self
+        self.catalog = self
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+    def set(self, key, value):
+        self.settings[key] = value
+
+    def unset(self, key):
+        self.settings.pop(key, None)
+
+    def tableExists(self, table):  # noqa: N802
+        return False
+
+    def createDataFrame(self, data, schema=None):  # noqa: N802
+        session = self
+
+        class Writer:
+            def saveAsTable(self, table, mode, **kwargs):  # noqa: N802
+                session.writes.append((len(data), mode, dict(session.settings), kwargs.get("replaceWhere")))
+
+        return MagicMock(write=Writer())
+
+
+@pytest.mark.parametrize("arrow", [None, "false"])
+def test_spark_delta_lake_destination_writes_chunks_in_sequence(arrow):
+    spark = FakeSparkSession(arrow)
+
+    SparkDeltaLakeDestination(spark=spark, table="table", mode="overwrite", chunksize=2).load(
+        pd.DataFrame({"col1": range(5)})
+    )
+
+    enabled = {"spark.sql.execution.arrow.pyspark.enabled": "true"}
+    assert spark.writes == [
+        (2, "overwrite", enabled, "true"),
+        (2, "append", enabled, None),
+        (1, "append", enabled, None),
+    ]
+    assert spark.settings == ({} if arrow is None else {"spark.sql.execution.arrow.pyspark.enabled": arrow})
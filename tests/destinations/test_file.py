@@ -1,9 +1,21 @@
+import gzip
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pandas as pd
+import pytest
 from pandas.testing import assert_frame_equal
 
-from extralo.destinations import CSVAppendDestination, CSVDestination, XLSXDestination
+from extralo import ETL, ETLSequentialLoad
+from extralo.destinations import (
+    CSVAppendDestination,
+    CSVDestination,
+    JSONLinesDestination,
+    JSONObjStreamDestination,
+    XLSXDestination,
+    XLSXWorkbookDestination,
+)
 
 
 def test_csv_append_destination_load(tmpdir):
@@ -57,3 +69,252 @@ def test_xlsx_destination_load(tmpdir):
 
     loaded_data = pd.read_excel(file_path)
     assert_frame_equal(loaded_data, data)
+
+
+def test_xlsx_workbook_destination_writes_all_sheets_once(tmpdir, monkeypatch):
+    first = pd.DataFrame({"A": [1, 2, 3]})
+    second = pd.DataFrame({"B": ["x", "y"]})
+
+    writes = []
+    excel_writer = pd.ExcelWriter
+
+    def counting_excel_writer(*args, **kwargs):
+        writes.append(args)
+        return excel_writer(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "ExcelWriter", counting_excel_writer)
+
+    file_path = os.path.join(tmpdir, "test.xlsx")
+    workbook = XLSXWorkbookDestination(file_path)
+
+    class Source:
+        def __init__(self, data):
+            self._data = data
+
+        def extract(self):
+            return self._data
+
+    ETL(
+        sources={"first": Source(first), "second": Source(second)},
+        destinations={
+            "first": [workbook.sheet("first", index=False)],
+            "second": [workbook.sheet("second", index=False)],
+        },
+    ).execute()
+
+    assert len(writes) == 1
+    loaded_data = pd.read_excel(file_path, sheet_name=None)
+    assert_frame_equal(loaded_data["first"], first)
+    assert_frame_equal(loaded_data["second"], second)
+
+
+def test_xlsx_workbook_destination_discards_sheets_of_failed_runs(tmpdir):
+    first = pd.DataFrame({"A": [1, 2, 3]})
+    second = pd.DataFrame({"B": ["x", "y"]})
+
+    class Source:
+        def __init__(self, data):
+            self._data = data
+
+        def extract(self):
+            return self._data
+
+    def failing_transformer(first, second):
+        raise ValueError("transform failed")
+
+    file_path = os.path.join(tmpdir, "test.xlsx")
+    workbook = XLSXWorkbookDestination(file_path)
+    first_sheet = workbook.sheet("first", index=False)
+    second_sheet = workbook.sheet("second", index=False)
+
+    first_sheet.load(first.assign(A=0))
+    with pytest.raises(ValueError, match="transform failed"):
+        ETL(
+            sources={"first": Source(first), "second": Source(second)},
+            destinations={"first": [first_sheet], "second": [second_sheet]},
+            transformer=failing_transformer,
+        ).execute()
+    assert not os.path.exists(file_path)
+
+    second_sheet.load(second)
+    assert not os.path.exists(file_path)
+    first_sheet.load(first)
+    assert_frame_equal(pd.read_excel(file_path, sheet_name="first"), first)
+
+
+def test_xlsx_workbook_destination_writes_the_loaded_sheets_when_others_are_skipped(tmpdir):
+    frames = {"first": pd.DataFrame({"A": [1, 2]}), "second": pd.DataFrame({"B": ["x"]})}
+
+    class Source:
+        def __init__(self, name):
+            self.name = name
+
+        def extract(self):
+            return frames[self.name]
+
+    file_path = os.path.join(tmpdir, "test.xlsx")
+
+    def execute():
+        workbook = XLSXWorkbookDestination(file_path)
+        ETL(
+            sources={name: Source(name) for name in frames},
+            destinations={name: [workbook.sheet(name, index=False)] for name in frames},
+            name="workbook",
+            fingerprints_file=os.path.join(tmpdir, "fingerprints.json"),
+        ).execute()
+
+    execute()
+    frames["second"] = pd.DataFrame({"B": ["y", "z"]})
+    execute()
+
+    loaded_data = pd.read_excel(file_path, sheet_name=None)
+    assert_frame_equal(loaded_data["first"], frames["first"])
+    assert_frame_equal(loaded_data["second"], frames["second"])
+
+
+def test_xlsx_workbook_destination_writes_the_sheets_of_a_resumed_run(tmpdir):
+    pytest.importorskip("pyarrow")
+    first = pd.DataFrame({"A": [1, 2]})
+    second = pd.DataFrame({"B": ["x"]})
+    fail = [True]
+
+    class Source:
+        def __init__(self, data):
+            self._data = data
+
+        def extract(self):
+            return self._data
+
+    class FlakyDestination:
+        def load(self, data):
+            if fail.pop():
+                raise ValueError("load failed")
+
+    file_path = os.path.join(tmpdir, "test.xlsx")
+
+    def etl():
+        workbook = XLSXWorkbookDestination(file_path)
+        return ETLSequentialLoad(
+            sources={"first": Source(first), "second": Source(second)},
+            destinations={
+                "first": [workbook.sheet("first", index=False)],
+                "second": [FlakyDestination(), workbook.sheet("second", index=False)],
+            },
+            checkpoint_dir=os.path.join(tmpdir, "checkpoint"),
+        )
+
+    with pytest.raises(ValueError, match="load failed"):
+        etl().execute()
+    fail.append(False)
+    etl().resume()
+
+    loaded_data = pd.read_excel(file_path, sheet_name=None)
+    assert_frame_equal(loaded_data["first"], first)
+    assert_frame_equal(loaded_data["second"], second)
+
+
+def test_csv_append_destination_concurrent_loads(tmpdir):
+    data = pd.DataFrame({"A": range(1000), "B": range(1000)})
+
+    file_path = os.path.join(tmpdir, "test.csv")
+    destinations = [CSVAppendDestination(file_path, index=False) for _ in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda destination: destination.load(data), destinations))
+
+    loaded_data = pd.read_csv(file_path)
+    assert_frame_equal(loaded_data, pd.concat([data] * 8).reset_index(drop=True))
+
+
+def _append_rows(file_path):
+    data = pd.DataFrame({"A": range(100), "B": range(100)})
+    for _ in range(10):
+        CSVAppendDestination(file_path, index=False).load(data)
+
+
+def test_csv_append_destination_loads_from_processes(tmpdir):
+    file_path = os.path.join(tmpdir, "test.csv")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_append_rows, [file_path] * 4))
+
+    assert len(pd.read_csv(file_path)) == 4 * 10 * 100
+    assert os.listdir(tmpdir) == ["test.csv"]
+
+
+def test_csv_append_destination_compressed_chunks(tmpdir):
+    data = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+    file_path = os.path.join(tmpdir, "test.csv.gz")
+    destination = CSVAppendDestination(file_path, compression="gzip", index=False)
+    destination.load(iter([data, data]))
+    destination.load(data)
+
+    loaded_data = pd.read_csv(file_path, compression="gzip")
+    assert_frame_equal(loaded_data, pd.concat([data] * 3).reset_index(drop=True))
+
+
+@pytest.mark.parametrize("name", ["test.csv", "test.csv.gz", "test.csv.bz2", "test.csv.xz"])
+def test_csv_append_destination_infers_the_compression(tmpdir, name):
+    data = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+    file_path = os.path.join(tmpdir, name)
+    destination = CSVAppendDestination(file_path, index=False)
+    destination.load(data)
+    destination.load(data)
+
+    loaded_data = pd.read_csv(file_path)
+    assert_frame_equal(loaded_data, pd.concat([data] * 2).reset_index(drop=True))
+    if name.endswith(".gz"):
+        with open(file_path, "rb") as file:
+            assert file.read(2) == b"\x1f\x8b"
+
+
+def test_json_lines_destination_load(tmpdir):
+    data = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+
+    file_path = os.path.join(tmpdir, "test.jsonl.gz")
+    JSONLinesDestination(file_path, compression="gzip", chunksize=2).load(data)
+
+    loaded_data = pd.read_json(file_path, lines=True, compression="gzip")
+    assert_frame_equal(loaded_data, data)
+
+
+def test_json_obj_stream_destination_load(tmpdir):
+    records = ({"id": i} for i in range(3))
+
+    file_path = os.path.join(tmpdir, "test.json")
+    JSONObjStreamDestination(file_path).load(records)
+
+    with open(file_path, encoding="utf-8") as file:
+        assert json.load(file) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    file_path = os.path.join(tmpdir, "test.jsonl.gz")
+    JSONObjStreamDestination(file_path, lines=True, compression="gzip").load([{"id": 0}, {"id": 1}])
+
+    with gzip.open(file_path, "rt", encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == [{"id": 0}, {"id": 1}]
+
+
+def test_csv_destinations_share_the_serialized_payload(tmpdir, monkeypatch):
+    data = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    calls = []
+    to_csv = pd.DataFrame.to_csv
+
+    def counting_to_csv(self, *args, **kwargs):
+        calls.append(args)
+        return to_csv(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", counting_to_csv)
+
+    class SourceStub:
+        def extract(self):
+            return data
+
+    files = [os.path.join(tmpdir, f"{name}.csv") for name in ("first", "second", "third")]
+    ETL(
+        sources={"data": SourceStub()},
+        destinations={"data": [CSVDestination(file, index=False) for file in files]},
+    ).execute()
+
+    assert len(calls) == 1
+    for file in files:
+        assert_frame_equal(pd.read_csv(file), data)
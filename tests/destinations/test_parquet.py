@@ -0,0 +1,66 @@
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from pandas.testing import assert_frame_equal
+
+from extralo.destinations import ParquetDestination
+
+
+def test_parquet_destination_load(tmpdir):
+    data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+    path = os.path.join(tmpdir, "test")
+    destination = ParquetDestination(path, row_group_size=2)
+    destination.load(data)
+    destination.load(data)
+
+    obtained_data = pd.read_parquet(path)
+    assert_frame_equal(obtained_data, data)
+    assert pq.ParquetFile(os.path.join(path, os.listdir(path)[0])).num_row_groups == 2
+
+
+def test_parquet_destination_load_partitioned(tmpdir):
+    initial_data = pd.DataFrame({"col1": [1, 1, 2, 2, 3], "col2": ["a", "b", "c", "d", "e"]})
+
+    path = os.path.join(tmpdir, "test")
+    ParquetDestination(path, partition_by="col1").load(initial_data)
+    ParquetDestination(path, partition_by="col1").load(pd.DataFrame({"col1": [1], "col2": ["aa"]}))
+    ParquetDestination(path, mode="append", partition_by="col1").load(pd.DataFrame({"col1": [3], "col2": ["ee"]}))
+
+    assert sorted(os.listdir(path)) == ["col1=1", "col1=2", "col1=3"]
+
+    obtained_data = pd.read_parquet(path)
+    obtained_data["col1"] = obtained_data["col1"].astype("int64")
+    expected_data = pd.DataFrame({"col2": ["aa", "c", "d", "e", "ee"], "col1": [1, 2, 2, 3, 3]})
+    assert_frame_equal(obtained_data.sort_values("col2").reset_index(drop=True), expected_data)
+
+
+def test_parquet_destination_load_streams_chunks(tmpdir):
+    chunks = [pd.DataFrame({"col1": [i, i + 1], "col2": ["a", "b"]}) for i in range(0, 6, 2)]
+
+    path = os.path.join(tmpdir, "test")
+    ParquetDestination(path).load(iter(chunks))
+
+    assert len(os.listdir(path)) == 1
+    assert_frame_equal(pd.read_parquet(path), pd.concat(chunks, ignore_index=True))
+
+
+@pytest.mark.parametrize("partition_by", [None, "col1"])
+def test_parquet_destination_failed_overwrite_keeps_old_data(tmpdir, partition_by):
+    data = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+    path = os.path.join(tmpdir, "test")
+    ParquetDestination(path, partition_by=partition_by).load(data)
+
+    def failing_chunks():
+        yield pd.DataFrame({"col1": [1], "col2": ["aa"]})
+        raise RuntimeError("read failed")
+
+    with pytest.raises(RuntimeError, match="read failed"):
+        ParquetDestination(path, partition_by=partition_by).load(failing_chunks())
+
+    obtained_data = pd.read_parquet(path)
+    obtained_data["col1"] = obtained_data["col1"].astype("int64")
+    assert_frame_equal(obtained_data.sort_values("col2").reset_index(drop=True)[list(data.columns)], data)
+    assert os.listdir(tmpdir) == ["test"]
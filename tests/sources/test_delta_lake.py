@@ -1,10 +1,11 @@
 import os
 
 import pandas as pd
+import pyarrow as pa
 from deltalake import write_deltalake
 from pandas.testing import assert_frame_equal
 
-from extralo.sources.delta_lake import DeltaLakeSource, SparkDeltaLakeSource
+from extralo.sources.delta_lake import ArrowDeltaLakeSource, DeltaLakeSource, SparkDeltaLakeSource
 
 
 def test_delta_lake_source_extract(tmpdir):
@@ -23,6 +24,54 @@ def test_delta_lake_source_extract(tmpdir):
     assert_frame_equal(obtained_data, expected_data)
 
 
+def test_delta_lake_source_with_columns(tmpdir):
+    initial_data = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"], "col3": [1.0, 2.0]})
+
+    file_path = os.path.join(tmpdir, "test")
+    write_deltalake(file_path, initial_data)
+
+    obtained_data = DeltaLakeSource(table_uri=file_path).with_columns(["col1", "col3"]).extract()
+
+    assert_frame_equal(obtained_data, initial_data[["col1", "col3"]])
+
+
+def test_delta_lake_source_filters_and_batches(tmpdir):
+    file_path = os.path.join(tmpdir, "test")
+    write_deltalake(file_path, pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+    write_deltalake(file_path, pd.DataFrame({"col1": [10, 20, 30], "col2": ["d", "e", "f"]}), mode="append")
+
+    delta_lake_source = DeltaLakeSource(table_uri=file_path, filters=[("col1", ">=", 20)])
+
+    scanned_files = {batch.fragment.path for batch in delta_lake_source._scanner().scan_batches()}
+    assert len(scanned_files) == 1
+    assert_frame_equal(
+        delta_lake_source.extract().sort_values("col1").reset_index(drop=True),
+        pd.DataFrame({"col1": [20, 30], "col2": ["e", "f"]}),
+    )
+
+    batches = list(DeltaLakeSource(table_uri=file_path, columns=["col1"]).iter_batches(batch_size=2))
+    assert all(len(batch) <= 2 for batch in batches)
+    assert sorted(pd.concat(batches)["col1"]) == [1, 2, 3, 10, 20, 30]
+
+
+def test_arrow_delta_lake_source_extract(tmpdir):
+    initial_data = pa.table({"col1": [1, 1, 2, 2], "col2": ["a", "b", "c", "d"]})
+
+    file_path = os.path.join(tmpdir, "test")
+    write_deltalake(file_path, initial_data, partition_by="col1")
+
+    source = ArrowDeltaLakeSource(table_uri=file_path, partitions=[("col1", "=", "2")], columns=["col2"])
+    obtained_data = source.extract()
+
+    assert isinstance(obtained_data, pa.Table)
+    assert obtained_data.sort_by("col2") == pa.table({"col2": ["c", "d"]})
+
+    reader = ArrowDeltaLakeSource(table_uri=file_path, stream=True).extract()
+
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert reader.read_all().num_rows == 4
+
+
 def test_spark_delta_lake_source_extract(spark):
     # Create a sample DataFrame
     initial_data = pd.DataFrame({"col1": [1, 1, 2, 2, 3, 3], "col2": ["a", "b", "c", "d", "e", "f"]})
@@ -39,3 +88,20 @@ def test_spark_delta_lake_source_extract(spark):
         obtained_data.sort_values("col2").reset_index(drop=True),
         expected_data.sort_values("col2").reset_index(drop=True),
     )
+
+
+def test_spark_delta_lake_source_iter_batches(spark):
+    initial_data = pd.DataFrame({"col1": [1, 1, 2, 2, 3, 3], "col2": ["a", "b", "c", "d", "e", "f"]})
+
+    spark.createDataFrame(initial_data).write.format("delta").mode("overwrite").saveAsTable("test_batches_table")
+
+    delta_lake_source = SparkDeltaLakeSource(spark=spark, query="select * from test_batches_table")
+
+    batches = list(delta_lake_source.iter_batches(batch_size=4))
+
+    assert spark.conf.get("spark.sql.execution.arrow.pyspark.enabled") == "true"
+    assert all(len(batch) <= 4 for batch in batches)
+    assert_frame_equal(
+        pd.concat(batches).sort_values("col2").reset_index(drop=True),
+        initial_data.sort_values("col2").reset_index(drop=True),
+    )
@@ -0,0 +1,133 @@
+import os
+
+import pandas as pd
+import pytest
+
+from extralo.etl import ETL
+from extralo.sources import DirectorySource, JSONSource
+
+
+class FailingDestination:
+    def load(self, data):
+        raise RuntimeError("load failed")
+
+
+class MemoryDestination:
+    def __init__(self):
+        self.data = []
+
+    def load(self, data):
+        self.data.append(data)
+
+
+@pytest.fixture
+def landing(tmp_path):
+    directory = tmp_path / "landing"
+    directory.mkdir()
+    return directory
+
+
+def write(directory, name, values, mtime=None):
+    path = directory / name
+    pd.DataFrame({"value": values}).to_csv(path, index=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_directory_source_reads_only_new_files(landing, tmp_path):
+    write(landing, "a.csv", [1, 2])
+    write(landing, "b.csv", [3])
+    source = DirectorySource(str(landing), str(tmp_path / "manifest.json"), path_column="file")
+
+    data = source.extract()
+    assert sorted(data["value"]) == [1, 2, 3]
+    assert set(data["file"]) == {"a.csv", "b.csv"}
+    source.commit()
+
+    write(landing, "c.csv", [4])
+    assert source.extract()["value"].tolist() == [4]
+    source.commit()
+    assert source.extract().empty
+
+
+def test_directory_source_reads_changed_files_again(landing, tmp_path):
+    write(landing, "a.csv", [1], mtime=1_000)
+    source = DirectorySource(str(landing), str(tmp_path / "manifest.json"), checksum=True)
+    source.extract()
+    source.commit()
+
+    write(landing, "a.csv", [1], mtime=2_000)
+    assert source.extract().empty
+    write(landing, "a.csv", [5], mtime=3_000)
+    assert source.extract()["value"].tolist() == [5]
+
+
+def test_directory_source_commits_only_when_the_etl_succeeds(landing, tmp_path):
+    write(landing, "a.csv", [1])
+    source = DirectorySource(str(landing), str(tmp_path / "manifest.json"))
+
+    with pytest.raises(Exception, match="load failed"):
+        ETL(sources={"data": source}, destinations={"data": [FailingDestination()]}).execute()
+
+    destination = MemoryDestination()
+    etl = ETL(sources={"data": source}, destinations={"data": [destination]})
+    etl.execute()
+    etl.execute()
+    assert [len(data) for data in destination.data] == [1, 0]
+
+
+def test_directory_source_commits_when_a_new_etl_resumes(landing, tmp_path):
+    pytest.importorskip("pyarrow")
+    write(landing, "a.csv", [1])
+
+    def etl(destination):
+        source = DirectorySource(str(landing), str(tmp_path / "manifest.json"))
+        return ETL(
+            sources={"data": source}, destinations={"data": [destination]}, checkpoint_dir=str(tmp_path / "checkpoint")
+        )
+
+    with pytest.raises(Exception, match="load failed"):
+        etl(FailingDestination()).execute()
+
+    destination = MemoryDestination()
+    etl(destination).resume()
+    etl(destination).execute()
+    assert [len(data) for data in destination.data] == [1, 0]
+
+
+def test_directory_source_skips_old_files_and_names(landing, tmp_path):
+    pd.DataFrame({"value": [0]}).to_json(landing / "2024-01-01.json", orient="records")
+    pd.DataFrame({"value": [1]}).to_json(landing / "2024-01-02.json", orient="records")
+    source = DirectorySource(
+        str(landing), str(tmp_path / "manifest.json"), source_class=JSONSource, pattern="*.json", sorted_names=True
+    )
+    source.extract()
+    source.commit()
+
+    pd.DataFrame({"value": [2]}).to_json(landing / "2024-01-01T12.json", orient="records")
+    pd.DataFrame({"value": [3]}).to_json(landing / "2024-01-03.json", orient="records")
+    assert source.extract()["value"].tolist() == [3]
+
+
+def test_directory_source_lookback_prunes_the_manifest(landing, tmp_path):
+    write(landing, "old.csv", [1], mtime=1_000)
+    write(landing, "new.csv", [2], mtime=100_000)
+    source = DirectorySource(str(landing), str(tmp_path / "manifest.json"), lookback=3_600)
+    source.extract()
+    source.commit()
+
+    write(landing, "older.csv", [3], mtime=2_000)
+    assert source.extract().empty
+    assert list(source._manifest.read()["files"]) == ["new.csv"]
+
+
+def test_directory_source_recursive(landing, tmp_path):
+    (landing / "day=1").mkdir()
+    write(landing / "day=1", "a.csv", [1])
+    write(landing, "b.csv", [2])
+
+    flat = DirectorySource(str(landing), str(tmp_path / "flat.json"))
+    nested = DirectorySource(str(landing), str(tmp_path / "nested.json"), recursive=True, path_column="file")
+
+    assert flat.extract()["value"].tolist() == [2]
+    assert sorted(nested.extract()["file"]) == ["b.csv", "day=1/a.csv"]
@@ -1,6 +1,10 @@
+import math
+import struct
+
 import pandas as pd
+import pytest
 
-from extralo.sources import CSVSource, XLSXSource
+from extralo.sources import CSVSource, JSONSource, SASSource, XLSXSource
 
 
 def test_csv_source_extract(tmp_path):
@@ -35,3 +39,223 @@ def test_xlsx_source_extract(tmp_path):
 
     # Assert that the extracted data matches the original DataFrame
     assert extracted_data.equals(df)
+
+
+def test_xlsx_source_sheets_parse_workbook_once(tmp_path, monkeypatch):
+    xlsx_file = tmp_path / "test.xlsx"
+    first = pd.DataFrame({"A": [1, 2, 3]})
+    second = pd.DataFrame({"B": ["x", "y"]})
+    with pd.ExcelWriter(xlsx_file) as writer:
+        first.to_excel(writer, sheet_name="first", index=False)
+        second.to_excel(writer, sheet_name="second", index=False)
+
+    calls = []
+    read_excel = pd.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        calls.append(kwargs["sheet_name"])
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", counting_read_excel)
+
+    workbook = XLSXSource(xlsx_file)
+    first_source = workbook.sheet("first")
+    second_source = workbook.sheet("second")
+
+    assert first_source.extract().equals(first)
+    assert second_source.extract().equals(second)
+    assert calls == [["first", "second"]]
+
+
+def test_xlsx_source_sheets_parse_the_file_again_when_it_changes(tmp_path):
+    xlsx_file = tmp_path / "test.xlsx"
+
+    def write(value):
+        with pd.ExcelWriter(xlsx_file) as writer:
+            pd.DataFrame({"A": [value]}).to_excel(writer, sheet_name="first", index=False)
+            pd.DataFrame({"B": [value]}).to_excel(writer, sheet_name="second", index=False)
+
+    write(1)
+    workbook = XLSXSource(xlsx_file)
+    first_source = workbook.sheet("first")
+    workbook.sheet("second")
+    assert first_source.extract().to_dict() == {"A": {0: 1}}
+
+    write(22)
+    assert first_source.extract().to_dict() == {"A": {0: 22}}
+
+
+def test_xlsx_source_read_only(tmp_path):
+    xlsx_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"Name": ["John", "Alice", "Bob"], "Age": [25, 30, 35]})
+    df.to_excel(xlsx_file, index=False)
+
+    xlsx_source = XLSXSource(xlsx_file, read_only=True)
+
+    assert xlsx_source.extract().equals(df)
+
+    batches = list(xlsx_source.iter_batches(batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert pd.concat(batches).equals(df)
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_xlsx_source_with_columns_and_header(tmp_path, read_only):
+    xlsx_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"Name": ["John", "Alice"], "Age": [25, 30], "City": ["New York", "London"]})
+    df.to_excel(xlsx_file, index=False, startrow=1)
+
+    assert XLSXSource(xlsx_file, read_only=read_only, header=1).with_columns(["Name"]).extract().equals(df)
+
+    no_header = XLSXSource(xlsx_file, read_only=read_only, header=None).with_columns(["Name"]).extract()
+    assert no_header.shape == (4, 3)
+
+
+def test_xlsx_source_read_only_rejects_unsupported_arguments(tmp_path):
+    with pytest.raises(ValueError, match="not supported"):
+        XLSXSource(tmp_path / "test.xlsx", read_only=True, dtype=str)
+
+
+def test_csv_source_with_columns(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    df = pd.DataFrame({"Name": ["John", "Alice"], "Age": [25, 30], "City": ["New York", "London"]})
+    df.to_csv(csv_file, index=False)
+
+    assert CSVSource(csv_file).with_columns(["Name", "City"]).extract().equals(df[["Name", "City"]])
+
+
+def test_json_source_iter_batches(tmp_path):
+    json_file = tmp_path / "test.json"
+    df = pd.DataFrame({"Name": ["John", "Alice", "Bob"], "Age": [25, 30, 35]})
+    df.to_json(json_file, orient="records", lines=True)
+
+    batches = list(JSONSource(json_file, lines=True).iter_batches(batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert JSONSource(json_file, lines=True, chunksize=2).extract().equals(df)
+
+
+class SASReaderStub:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+
+def test_sas_source_iter_batches_decodes_chunks(monkeypatch):
+    chunks = [
+        pd.DataFrame({"name": [b"John", b"Alice"], "birth": [0.0, 1.0]}),
+        pd.DataFrame({"name": [b"Bob", None], "birth": [366.0, None]}),
+    ]
+    monkeypatch.setattr(pd, "read_sas", lambda *args, **kwargs: SASReaderStub(chunks))
+
+    sas_source = SASSource("test.sas7bdat", encoding="utf-8", date_columns=["birth"])
+
+    extracted_data = pd.concat(list(sas_source.iter_batches(batch_size=2)), ignore_index=True)
+
+    assert list(extracted_data["name"][:3]) == ["John", "Alice", "Bob"]
+    assert pd.isna(extracted_data["name"][3])
+    assert list(extracted_data["birth"][:3]) == list(pd.to_datetime(["1960-01-01", "1960-01-02", "1961-01-01"]))
+    assert pd.isna(extracted_data["birth"][3])
+
+
+def test_sas_source_reads_xport_file_in_chunks(tmp_path):
+    sas_file = tmp_path / "test.xpt"
+    _write_xport(sas_file, pd.DataFrame({"name": ["John", "Alice", "Bob"], "birth": [1.0, 366.0, None]}))
+
+    sas_source = SASSource(sas_file, encoding="utf-8", date_columns=["birth"], chunksize=2)
+    batches = list(sas_source.iter_batches(batch_size=2))
+    extracted_data = sas_source.extract()
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert extracted_data["name"].tolist() == ["John", "Alice", "Bob"]
+    assert list(extracted_data["birth"][:2]) == list(pd.to_datetime(["1960-01-02", "1961-01-01"]))
+    assert pd.isna(extracted_data["birth"][2])
+    pd.testing.assert_frame_equal(
+        extracted_data, SASSource(sas_file, encoding="utf-8", date_columns=["birth"]).extract(), check_dtype=False
+    )
+
+
+def _ibm_float(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return b"." + bytes(7)
+    if value == 0:
+        return bytes(8)
+    sign = 0x80 if value < 0 else 0
+    value = abs(value)
+    exponent = math.floor(math.log(value, 16)) + 1
+    mantissa = round(value / 16**exponent * 2**56)
+    if mantissa >= 2**56:
+        exponent += 1
+        mantissa >>= 4
+    return bytes([sign | (exponent + 64)]) + mantissa.to_bytes(7, "big")
+
+
+def _record(text):
+    return text.ljust(80).encode("ascii")
+
+
+def _header(name, count=""):
+    return _record(f"HEADER RECORD*******{name:<8}HEADER RECORD!!!!!!!{count:0>30}")
+
+
+def _write_xport(path, data, name="TEST"):
+    """Write a SAS XPORT (version 5) file with numeric and text columns."""
+    created = "01JAN60:00:00:00"
+    text = {column: not pd.api.types.is_numeric_dtype(data[column]) for column in data.columns}
+    lengths = {column: max(data[column].map(len).max(), 1) if text[column] else 8 for column in data.columns}
+    namestrs = b""
+    position = 0
+    for number, column in enumerate(data.columns, start=1):
+        namestrs += struct.pack(
+            ">hhhh8s40s8shhh2s8shhl52s",
+            2 if text[column] else 1,
+            0,
+            lengths[column],
+            number,
+            column.encode().ljust(8),
+            b"".ljust(40),
+            b"".ljust(8),
+            0,
+            0,
+            0,
+            b"  ",
+            b"".ljust(8),
+            0,
+            0,
+            position,
+            bytes(52),
+        )
+        position += lengths[column]
+    rows = b""
+    for _, row in data.iterrows():
+        for column in data.columns:
+            if text[column]:
+                rows += row[column].encode().ljust(lengths[column])
+            else:
+                rows += _ibm_float(row[column])
+
+    content = b"".join(
+        [
+            _header("LIBRARY"),
+            _record(f"{'SAS':<8}{'SAS':<8}{'SASLIB':<8}{'9.4':<8}{'Linux':<8}{'':<24}{created}"),
+            _record(created),
+            _header("MEMBER", "000000000000000001600000000140"),
+            _header("DSCRPTR"),
+            _record(f"{'SAS':<8}{name:<8}{'SASDATA':<8}{'9.4':<8}{'Linux':<8}{'':<24}{created}"),
+            _record(created),
+            _header("NAMESTR", f"{len(data.columns):04d}00000000000000000000"),
+            namestrs.ljust(math.ceil(len(namestrs) / 80) * 80, b" "),
+            _header("OBS"),
+            rows.ljust(math.ceil(len(rows) / 80) * 80, b" "),
+        ]
+    )
+    with open(path, "wb") as file:
+        file.write(content)
@@ -0,0 +1,30 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.testing import assert_frame_equal
+
+from extralo.sources import ParquetSource
+
+
+def test_parquet_source_extract(tmpdir):
+    file_path = os.path.join(tmpdir, "test.parquet")
+    data = pd.DataFrame({"col1": [1, 2, 3, 4], "col2": ["a", "b", "c", "d"], "col3": [1.0, 2.0, 3.0, 4.0]})
+    data.to_parquet(file_path, index=False)
+
+    obtained_data = ParquetSource(file_path, columns=["col1", "col2"], filters=[("col1", ">", 2)]).extract()
+
+    expected_data = pd.DataFrame({"col1": [3, 4], "col2": ["c", "d"]})
+    assert_frame_equal(obtained_data, expected_data)
+
+
+def test_parquet_source_iter_batches(tmpdir):
+    file_path = os.path.join(tmpdir, "test.parquet")
+    data = pd.DataFrame({"col1": range(10)})
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), file_path, row_group_size=4)
+
+    batches = list(ParquetSource(file_path).iter_batches(batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert_frame_equal(pd.concat(batches, ignore_index=True), data)
@@ -1,5 +1,6 @@
 import pandas as pd
 import sqlalchemy as sa
+from sqlalchemy.dialects import oracle
 
 from extralo.sources import SQLSource
 
@@ -19,3 +20,35 @@ def test_sql_source_extract():
 
     # Assert that the extracted data matches the expected DataFrame
     assert extracted_data.equals(data)
+
+
+def test_sql_source_extract_with_columns():
+    engine = sa.create_engine("sqlite:///:memory:")
+    data = pd.DataFrame({"id": [1, 2, 3], "name": ["John", "Alice", "Bob"]})
+    data.to_sql("test_table", engine, index=False)
+
+    sql_source = SQLSource(engine, "SELECT * FROM test_table;").with_columns(["name"])
+
+    assert sql_source.extract().equals(data[["name"]])
+
+
+def test_sql_source_with_columns_renders_for_the_dialect():
+    engine = sa.create_engine("sqlite:///:memory:")
+    data = pd.DataFrame({"id": [1, 2, 3], "name": ["John", "Alice", "Bob"]})
+    data.to_sql("test_table", engine, index=False)
+
+    source = SQLSource(engine, "SELECT * FROM test_table WHERE id > :id", params={"id": 1}).with_columns(["name"])
+    assert source.extract()["name"].tolist() == ["Alice", "Bob"]
+
+    statement = str(source._project("SELECT * FROM test_table").compile(dialect=oracle.dialect()))
+    assert " AS " not in statement.upper()
+
+
+def test_sql_source_cache_key():
+    engine = sa.create_engine("sqlite:///:memory:")
+
+    source = SQLSource(engine, "SELECT * FROM test_table", params={"a": 1})
+
+    assert source.cache_key() == SQLSource(engine, "SELECT * FROM test_table", params={"a": 1}).cache_key()
+    assert source.cache_key() != SQLSource(engine, "SELECT * FROM test_table", params={"a": 2}).cache_key()
+    assert source.cache_key() != source.with_columns(["a"]).cache_key()
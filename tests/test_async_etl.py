@@ -0,0 +1,109 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from extralo.async_etl import AsyncETL
+from extralo.runner import ETLRunner
+
+
+class AsyncSourceStub:
+    def __init__(self, value):
+        self.value = value
+
+    async def extract(self):
+        await asyncio.sleep(0.01)
+        return pd.DataFrame({"a": [self.value]})
+
+
+class SyncSourceStub:
+    def extract(self):
+        return pd.DataFrame({"a": [2]})
+
+
+class AsyncDestStub:
+    def __init__(self, fail=False):
+        self.loaded = []
+        self.fail = fail
+
+    async def load(self, data):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ValueError("failed")
+        self.loaded.append(data)
+
+
+class SyncDestStub:
+    def __init__(self):
+        self.loaded = []
+
+    def load(self, data):
+        self.loaded.append(data)
+
+
+def test_async_etl_mixes_async_and_sync_steps():
+    async_dest, sync_dest = AsyncDestStub(), SyncDestStub()
+
+    def transform(first, second):
+        return {"both": pd.concat([first, second], ignore_index=True)}
+
+    etl = AsyncETL(
+        sources={"first": AsyncSourceStub(1), "second": SyncSourceStub()},
+        transformer=transform,
+        destinations={"both": [async_dest, sync_dest]},
+    )
+    asyncio.run(etl.execute())
+
+    assert async_dest.loaded[0]["a"].tolist() == [1, 2]
+    assert sync_dest.loaded[0] is async_dest.loaded[0]
+
+
+def test_async_etl_runs_many_pipelines_concurrently():
+    destinations = [AsyncDestStub() for _ in range(200)]
+    etls = [AsyncETL(sources={"a": AsyncSourceStub(1)}, destinations={"a": [dest]}) for dest in destinations]
+
+    async def main():
+        semaphore = asyncio.Semaphore(100)
+        await asyncio.gather(*(etl.execute(semaphore) for etl in etls))
+
+    asyncio.run(main())
+
+    assert all(len(dest.loaded) == 1 for dest in destinations)
+
+
+def test_async_etl_fails_when_a_destination_fails():
+    etl = AsyncETL(sources={"a": AsyncSourceStub(1)}, destinations={"a": [AsyncDestStub(fail=True)]})
+
+    with pytest.raises(Exception, match="Failed to load data"):
+        asyncio.run(etl.execute())
+
+
+def test_runner_awaits_async_etls():
+    dest = AsyncDestStub()
+    etls = [
+        AsyncETL(sources={"a": AsyncSourceStub(1)}, destinations={"a": [dest]}),
+        AsyncETL(sources={"a": AsyncSourceStub(2)}, destinations={"a": [AsyncDestStub(fail=True)]}),
+    ]
+
+    with ETLRunner(max_workers=2) as runner:
+        report = runner.run(etls)
+
+    assert report.succeeded == [etls[0]]
+    assert [etl for etl, _ in report.failed] == [etls[1]]
+    assert dest.loaded[0]["a"].tolist() == [1]
+
+
+def test_async_etl_cant_be_resumed():
+    etl = AsyncETL(sources={"a": AsyncSourceStub(1)}, destinations={"a": []})
+
+    with pytest.raises(ValueError, match="checkpoint_dir is required"):
+        etl.resume()
+
+
+def test_async_etl_copies_the_data_of_equivalent_sources():
+    source = AsyncSourceStub(1)
+    data = asyncio.run(AsyncETL(sources={"a": source, "b": source}, destinations={"a": [], "b": []}).extract())
+
+    assert data["a"] is not data["b"]
+    data["b"]["a"] = 2
+    assert data["a"]["a"].tolist() == [1]
@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from extralo.compaction import DtypeCompaction, memory_usage
+from extralo.etl import ETL
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "id": pd.Series(range(1000), dtype="int64"),
+            "delta": pd.Series([-1, 1] * 500, dtype="int64"),
+            "value": pd.Series([0.5] * 1000, dtype="float64"),
+            "state": pd.Series(["SP", "RJ"] * 500, dtype=object),
+            "date": pd.Series(["2024-01-01", "2024-01-02"] * 500, dtype=object),
+        }
+    )
+
+
+def test_compaction_downcasts_integers_and_converts_categoricals(data):
+    compacted = DtypeCompaction().compact(data)
+
+    assert compacted["id"].dtype == "uint16"
+    assert compacted["delta"].dtype == "int8"
+    assert compacted["value"].dtype == "float64"
+    assert isinstance(compacted["state"].dtype, pd.CategoricalDtype)
+    assert memory_usage(compacted) < memory_usage(data)
+    pd.testing.assert_frame_equal(compacted.astype(data.dtypes), data)
+
+
+def test_compaction_parses_dates(data):
+    compacted = DtypeCompaction(parse_dates="infer", categorical_threshold=None).compact(data)
+
+    assert pd.api.types.is_datetime64_any_dtype(compacted["date"])
+    assert not pd.api.types.is_datetime64_any_dtype(compacted["state"])
+
+
+def test_compaction_doesnt_infer_dates_from_year_like_codes():
+    data = pd.DataFrame(
+        {"code": ["2001", "2002", "2003", "2004"], "month": ["2024-01", "2024-02", "2024-03", "2024-04"]}
+    )
+
+    compacted = DtypeCompaction(parse_dates="infer", categorical_threshold=None).compact(data)
+
+    assert not pd.api.types.is_datetime64_any_dtype(compacted["code"])
+    assert not pd.api.types.is_datetime64_any_dtype(compacted["month"])
+
+
+def test_compaction_fails_for_invalid_dates(data):
+    with pytest.raises(ValueError):
+        DtypeCompaction(parse_dates=["state"]).compact(data)
+
+
+def test_compaction_keeps_non_string_column_labels():
+    data = pd.DataFrame([[1, "a"], [2, "a"]], columns=pd.MultiIndex.from_tuples([("x", 1), ("y", 2)]))
+
+    compacted = DtypeCompaction().compact(pd.DataFrame({0: [1, 2], 1: ["a", "a"]}))
+    assert list(compacted.columns) == [0, 1]
+    assert compacted[0].dtype == "uint8"
+    assert isinstance(compacted[1].dtype, pd.CategoricalDtype)
+
+    compacted = DtypeCompaction().compact(data)
+    assert list(compacted.columns) == list(data.columns)
+    assert compacted[("x", 1)].dtype == "uint8"
+
+
+def test_compaction_skips_unhashable_values():
+    data = pd.DataFrame({"tags": [["a"], ["b", "c"]], "meta": [{"a": 1}, {"a": 1}]})
+
+    compacted = DtypeCompaction().compact(data)
+
+    assert compacted["tags"].tolist() == [["a"], ["b", "c"]]
+    assert compacted["meta"].dtype == object
+
+
+def test_etl_compacts_extracted_data(data):
+    class SourceStub:
+        def extract(self):
+            return data
+
+    loaded = {}
+
+    class DestStub:
+        def load(self, data):
+            loaded["source"] = data
+
+    ETL(
+        sources={"source": SourceStub()},
+        destinations={"source": [DestStub()]},
+        compaction={"source": DtypeCompaction(columns=["id"])},
+    ).execute()
+
+    assert loaded["source"]["id"].dtype == "uint16"
+    assert loaded["source"]["delta"].dtype == "int64"
@@ -0,0 +1,89 @@
+import json
+import time
+
+import pandas as pd
+import pytest
+
+from extralo import etl as etl_module
+from extralo._durations import DurationStore
+from extralo.etl import ETL
+from extralo.runner import ETLRunner
+
+
+class SleepySource:
+    def __init__(self, name, seconds, started):
+        self.name = name
+        self.seconds = seconds
+        self.started = started
+
+    def extract(self):
+        self.started.append(self.name)
+        time.sleep(self.seconds)
+        return pd.DataFrame({"a": [1]})
+
+
+def test_runner_starts_the_longest_extractions_first(tmp_path):
+    started = []
+
+    def etl():
+        sources = {"fast": SleepySource("fast", 0.0, started), "slow": SleepySource("slow", 0.05, started)}
+        return ETL(
+            sources=sources, destinations={"fast": [], "slow": []}, name="etl", durations_file=str(tmp_path / "d.json")
+        )
+
+    with ETLRunner(io_workers=1) as runner:
+        runner.run([etl()])
+        assert started == ["fast", "slow"]
+        started.clear()
+        runner.run([etl()])
+
+    assert started == ["slow", "fast"]
+
+
+def test_etl_keeps_one_duration_per_task_across_runs(tmp_path):
+    path = tmp_path / "d.json"
+
+    class DestStub:
+        def load(self, data):
+            return
+
+    for _ in range(3):
+        ETL(
+            sources={"a": SleepySource("a", 0.0, [])},
+            destinations={"a": [DestStub(), DestStub()]},
+            name="etl",
+            durations_file=str(path),
+        ).execute()
+
+    assert sorted(json.loads(path.read_text())) == ["extract:etl:a", "load:etl:a:0", "load:etl:a:1"]
+
+
+def test_etl_computes_the_source_size_only_without_a_duration(tmp_path, monkeypatch):
+    sized = []
+    monkeypatch.setattr(etl_module, "source_size", lambda source: sized.append(source) or 10)
+
+    for _ in range(2):
+        ETL(
+            sources={"a": SleepySource("a", 0.0, [])},
+            destinations={"a": []},
+            name="etl",
+            durations_file=str(tmp_path / "d.json"),
+        ).extract()
+
+    assert len(sized) == 1
+    assert json.loads((tmp_path / "d.json").read_text())["extract:etl:a"]["size"] == 10
+
+
+def test_etl_requires_a_name_to_record_durations(tmp_path):
+    with pytest.raises(ValueError, match="name is required"):
+        ETL(sources={"a": SleepySource("a", 0.0, [])}, destinations={"a": []}, durations_file=str(tmp_path / "d.json"))
+
+
+def test_duration_store_estimates_new_tasks_from_their_size(tmp_path):
+    store = DurationStore(str(tmp_path / "d.json"))
+    store.record("extract", "known", 2.0, 100)
+    store.flush()
+
+    assert store.recorded("extract", "known")
+    assert not store.recorded("extract", "new")
+    assert store.estimate("extract", "new", 50) == 1.0
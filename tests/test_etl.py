@@ -1,9 +1,16 @@
+import gc
+import json
+import threading
+import time
+import weakref
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
-from extralo.etl import ETL, IncompatibleStepsError
+from extralo._conversion import cached
+from extralo.etl import ETL, ETLSequentialLoad, IncompatibleStepsError
 
 
 @pytest.fixture
@@ -76,3 +83,329 @@ def test_etl_fails_when_source_and_transformer_are_incompatible(mock_source, moc
             transformer=mock_transform_2,
             destinations={"source_trans": [mock_dest]},
         )
+
+
+class ProjectableSourceStub:
+    def __init__(self, columns=None):
+        self.columns = columns
+
+    def with_columns(self, columns):
+        return ProjectableSourceStub(columns)
+
+    def extract(self):
+        return pd.DataFrame({"a": [1], "b": [2], "c": [3]})[self.columns or ["a", "b", "c"]]
+
+
+def test_etl_pushes_columns_down_to_sources(mock_dest):
+    etl = ETL(
+        sources={"source": ProjectableSourceStub()},
+        destinations={"source": [mock_dest]},
+        columns={"source": ["a", "c"]},
+    )
+
+    assert list(etl.extract()["source"].columns) == ["a", "c"]
+
+
+def test_etl_infers_columns_from_transformer_annotations(mock_dest):
+    pandera = pytest.importorskip("pandera.pandas")
+    from pandera.typing import DataFrame
+
+    class Schema(pandera.DataFrameModel):
+        b: int
+
+    def transform(source: DataFrame[Schema]):
+        return {"source": source}
+
+    etl = ETL(
+        sources={"source": ProjectableSourceStub()},
+        transformer=transform,
+        destinations={"source": [mock_dest]},
+        columns="infer",
+    )
+
+    assert list(etl.extract()["source"].columns) == ["b"]
+
+
+def test_etl_spills_data_over_the_memory_budget(tmp_path):
+    pytest.importorskip("pyarrow")
+    frames = {"small": pd.DataFrame({"a": [1]}), "large": pd.DataFrame({"a": range(1000)})}
+    loaded = {}
+
+    class SourceStub:
+        def __init__(self, name):
+            self.name = name
+
+        def extract(self):
+            return frames[self.name]
+
+    class DestStub:
+        def __init__(self, name):
+            self.name = name
+
+        def load(self, data):
+            loaded.setdefault(self.name, []).append(data)
+
+    ETL(
+        sources={name: SourceStub(name) for name in frames},
+        destinations={name: [DestStub(name), DestStub(name)] for name in frames},
+        memory_budget=1024,
+        spill_dir=str(tmp_path),
+    ).execute()
+
+    assert loaded["small"][0] is frames["small"]
+    assert loaded["large"][0] is not frames["large"]
+    assert loaded["large"][0] is loaded["large"][1]
+    pd.testing.assert_frame_equal(loaded["large"][0], frames["large"])
+    assert not list(tmp_path.iterdir())
+
+
+def test_etl_spills_data_that_arrow_cannot_write(tmp_path):
+    pytest.importorskip("pyarrow")
+    frame = pd.DataFrame({"a": pd.Series([1, "a"] * 500, dtype=object)})
+    loaded = []
+
+    class SourceStub:
+        def extract(self):
+            return frame
+
+    class DestStub:
+        def load(self, data):
+            loaded.append(data)
+
+    ETL(
+        sources={"source": SourceStub()},
+        destinations={"source": [DestStub()]},
+        memory_budget=1024,
+        spill_dir=str(tmp_path),
+    ).execute()
+
+    pd.testing.assert_frame_equal(loaded[0], frame)
+    assert not list(tmp_path.iterdir())
+
+
+def test_etl_loads_spilled_data_within_the_memory_budget(tmp_path):
+    pytest.importorskip("pyarrow")
+    frames = {name: pd.DataFrame({"a": range(1000)}) for name in ("first", "second", "third")}
+    lock = threading.Lock()
+    running = []
+    concurrent = []
+
+    class SourceStub:
+        def __init__(self, name):
+            self.name = name
+
+        def extract(self):
+            return frames[self.name]
+
+    class DestStub:
+        def load(self, data):
+            with lock:
+                running.append(data)
+                concurrent.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(data)
+
+    ETL(
+        sources={name: SourceStub(name) for name in frames},
+        destinations={name: [DestStub()] for name in frames},
+        memory_budget=1024,
+        spill_dir=str(tmp_path),
+    ).execute()
+
+    assert concurrent == [1, 1, 1]
+
+
+def test_etl_releases_loaded_data():
+    references = {}
+
+    class SourceStub:
+        def extract(self):
+            return pd.DataFrame({"a": [1]})
+
+    class DestStub:
+        def __init__(self, name):
+            self.name = name
+
+        def load(self, data):
+            gc.collect()
+            references[self.name] = weakref.ref(data)
+            if self.name == "second":
+                references["first_alive"] = references["first"]() is not None
+
+    ETLSequentialLoad(
+        sources={"first": SourceStub(), "second": SourceStub()},
+        destinations={"first": [DestStub("first")], "second": [DestStub("second")]},
+    ).execute()
+
+    assert references["first_alive"] is False
+
+
+@pytest.mark.parametrize("etl_class", [ETL, ETLSequentialLoad])
+def test_etl_shares_conversions_only_during_the_load(etl_class):
+    conversions = []
+    frame = pd.DataFrame({"a": [1]})
+
+    class SourceStub:
+        def extract(self):
+            return frame
+
+    class DestStub:
+        def load(self, data):
+            cached(data, "key", lambda: conversions.append(data))
+
+    etl_class(sources={"a": SourceStub()}, destinations={"a": [DestStub(), DestStub()]}).execute()
+    assert len(conversions) == 1
+
+    DestStub().load(frame)
+    assert len(conversions) == 2
+
+
+def test_etl_resumes_only_the_failed_loads(tmp_path):
+    pytest.importorskip("pyarrow")
+    calls = {"extract": 0, "first": 0, "second": 0}
+
+    class SourceStub:
+        def extract(self):
+            calls["extract"] += 1
+            return pd.DataFrame({"a": [1, 2]})
+
+    class DestStub:
+        def __init__(self, name, fail=False):
+            self.name = name
+            self.fail = fail
+
+        def load(self, data):
+            calls[self.name] += 1
+            if self.fail:
+                self.fail = False
+                raise TimeoutError("lock timeout")
+            pd.testing.assert_frame_equal(data, pd.DataFrame({"a": [1, 2]}))
+
+    etl = ETL(
+        sources={"source": SourceStub()},
+        destinations={"source": [DestStub("first"), DestStub("second", fail=True)]},
+        checkpoint_dir=str(tmp_path),
+    )
+    with pytest.raises(Exception, match="lock timeout"):
+        etl.execute()
+    etl.resume()
+
+    assert calls == {"extract": 1, "first": 1, "second": 2}
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        lambda: pa.RecordBatchReader.from_batches(
+            pa.schema([("a", pa.int64())]), [pa.record_batch({"a": [1]}), pa.record_batch({"a": [2]})]
+        ),
+        lambda: (pd.DataFrame({"a": [a]}) for a in (1, 2)),
+    ],
+    ids=["reader", "generator"],
+)
+def test_etl_checkpoints_streams(tmp_path, stream):
+    loaded = []
+
+    class SourceStub:
+        def extract(self):
+            return stream()
+
+    class DestStub:
+        def load(self, data):
+            loaded.append(data)
+
+    ETL(
+        sources={"source": SourceStub()},
+        destinations={"source": [DestStub()]},
+        checkpoint_dir=str(tmp_path),
+    ).execute()
+
+    assert len(loaded) == 1
+    data = loaded[0]
+    values = data.column("a").to_pylist() if isinstance(data, pa.Table) else pd.concat(data)["a"].tolist()
+    assert values == [1, 2]
+
+
+def test_etl_extracts_equivalent_sources_once():
+    extractions = []
+
+    class KeyedSource:
+        def extract(self):
+            extractions.append(self)
+            return pd.DataFrame({"a": [1]})
+
+        def cache_key(self):
+            return "same-query"
+
+    shared = ProjectableSourceStub()
+    data = ETL(
+        sources={"first": KeyedSource(), "second": KeyedSource(), "third": shared, "fourth": shared},
+        destinations={name: [] for name in ("first", "second", "third", "fourth")},
+    ).extract()
+
+    assert len(extractions) == 1
+    assert data["first"] is not data["second"]
+    assert data["third"] is not data["fourth"]
+    data["second"]["a"] = 2
+    data["fourth"]["d"] = 4
+    assert data["first"]["a"].tolist() == [1]
+    assert "d" not in data["third"]
+
+
+def test_etl_skips_loads_of_unchanged_data(tmp_path):
+    frames = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 3]})]
+    loaded = []
+
+    class SourceStub:
+        def extract(self):
+            return frames.pop(0)
+
+    class DestStub:
+        def load(self, data):
+            loaded.append(data)
+
+    for _ in range(3):
+        ETL(
+            sources={"source": SourceStub()},
+            destinations={"source": [DestStub()]},
+            name="etl",
+            fingerprints_file=str(tmp_path / "fingerprints.json"),
+        ).execute()
+
+    assert [data["a"].tolist() for data in loaded] == [[1, 2], [1, 3]]
+    assert len(json.loads((tmp_path / "fingerprints.json").read_text())) == 1
+
+
+def test_etl_loads_unchanged_data_to_a_destination_pointed_elsewhere(tmp_path):
+    loaded = []
+
+    class SourceStub:
+        def extract(self):
+            return pd.DataFrame({"a": [1, 2]})
+
+    class DestStub:
+        def __init__(self, file):
+            self.file = file
+
+        def load(self, data):
+            loaded.append(self.file)
+
+        def __repr__(self):
+            return f"DestStub(file={self.file})"
+
+    for file in ("first.csv", "first.csv", "second.csv"):
+        ETL(
+            sources={"source": SourceStub()},
+            destinations={"source": [DestStub(file)]},
+            name="etl",
+            fingerprints_file=str(tmp_path / "fingerprints.json"),
+        ).execute()
+
+    assert loaded == ["first.csv", "second.csv"]
+
+
+def test_etl_requires_a_name_to_record_fingerprints(tmp_path):
+    with pytest.raises(ValueError, match="name is required"):
+        ETL(sources={}, destinations={}, fingerprints_file=str(tmp_path / "fingerprints.json"))
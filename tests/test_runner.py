@@ -0,0 +1,195 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from extralo.etl import ETL
+from extralo.runner import ETLRunner, ETLScheduler
+
+
+class SourceStub:
+    def extract(self):
+        return pd.DataFrame({"a": [1]})
+
+
+class EngineDestStub:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, engine, fail=False):
+        self._engine = engine
+        self.fail = fail
+
+    def load(self, data):
+        with self.lock:
+            EngineDestStub.active += 1
+            EngineDestStub.peak = max(EngineDestStub.peak, EngineDestStub.active)
+        time.sleep(0.01)
+        with self.lock:
+            EngineDestStub.active -= 1
+        if self.fail:
+            raise ValueError("failed")
+
+
+def test_runner_reports_succeeded_and_failed_etls():
+    etls = [
+        ETL(sources={"a": SourceStub()}, destinations={"a": [EngineDestStub(None, fail=i == 3)]}, name=str(i))
+        for i in range(20)
+    ]
+
+    with ETLRunner(max_workers=4) as runner:
+        report = runner.run(etls)
+
+    assert report.total == 20
+    assert [etl for etl, _ in report.failed] == [etls[3]]
+    assert isinstance(report.failed[0][1], Exception)
+    assert report.throughput > 0
+
+
+def test_runner_limits_concurrent_operations_per_engine():
+    EngineDestStub.peak = 0
+    engine = object()
+    etls = [ETL(sources={"a": SourceStub()}, destinations={"a": [EngineDestStub(engine)]}) for _ in range(20)]
+
+    with ETLRunner(max_workers=8, engine_limits={engine: 2}) as runner:
+        report = runner.run(etls)
+
+    assert len(report.succeeded) == 20
+    assert EngineDestStub.peak <= 2
+
+
+def test_runner_engine_limits_dont_hold_the_shared_threads():
+    finished = []
+    engine = object()
+
+    class SlowDest:
+        _engine = engine
+
+        def load(self, data):
+            time.sleep(0.1)
+            finished.append("slow")
+
+    class FastDest:
+        def load(self, data):
+            finished.append("fast")
+
+    etls = [ETL(sources={"a": SourceStub()}, destinations={"a": [SlowDest()]}) for _ in range(4)]
+    etls.append(ETL(sources={"a": SourceStub()}, destinations={"a": [FastDest()]}))
+
+    with ETLRunner(max_workers=8, io_workers=2, engine_limits={engine: 1}) as runner:
+        report = runner.run(etls)
+
+    assert len(report.succeeded) == 5
+    assert finished[0] == "fast"
+
+
+def test_scheduler_respects_dependencies_and_shares_sources():
+    order = []
+    extractions = []
+
+    class CountingSource:
+        def extract(self):
+            extractions.append(self)
+            time.sleep(0.05)
+            return pd.DataFrame({"a": [1]})
+
+        def cache_key(self):
+            return "same-table"
+
+    class OrderDest:
+        def __init__(self, name, fail=False):
+            self.name = name
+            self.fail = fail
+
+        def load(self, data):
+            if self.fail:
+                raise ValueError("failed")
+            order.append(self.name)
+
+    def etl(name, fail=False):
+        return ETL(sources={"a": CountingSource()}, destinations={"a": [OrderDest(name, fail)]}, name=name)
+
+    etls = {"first": etl("first"), "second": etl("second"), "broken": etl("broken", fail=True), "last": etl("last")}
+    with ETLScheduler(max_workers=4) as scheduler:
+        report = scheduler.run(etls, dependencies={"second": ["first"], "last": ["broken"]})
+
+    assert order.index("first") < order.index("second")
+    assert report.skipped == [etls["last"]]
+    assert [etl for etl, _ in report.failed] == [etls["broken"]]
+    # "first" and "broken" share one extraction, while "second" extracts again after "first" finished.
+    assert len(extractions) == 2
+
+
+def test_scheduler_doesnt_share_data_extracted_before_a_dependency_finished():
+    table = {"value": "old"}
+    loaded = {}
+
+    class TableSource:
+        def extract(self):
+            return dict(table)
+
+        def cache_key(self):
+            return "table"
+
+    class TableDest:
+        def load(self, data):
+            time.sleep(0.05)
+            table["value"] = "new"
+
+    class RecordDest:
+        def __init__(self, name):
+            self.name = name
+
+        def load(self, data):
+            loaded[self.name] = data["value"]
+
+    etls = {
+        "writer": ETL(sources={"a": SourceStub()}, destinations={"a": [TableDest()]}),
+        "early": ETL(sources={"a": TableSource()}, destinations={"a": [RecordDest("early")]}),
+        "late": ETL(sources={"a": TableSource()}, destinations={"a": [RecordDest("late")]}),
+    }
+    with ETLScheduler(max_workers=4) as scheduler:
+        report = scheduler.run(etls, dependencies={"late": ["writer"]})
+
+    assert len(report.succeeded) == 3
+    assert loaded == {"early": "old", "late": "new"}
+
+
+def test_scheduler_gives_each_etl_its_own_copy_of_shared_data():
+    loaded = {}
+
+    class SharedSource:
+        def extract(self):
+            return pd.DataFrame({"a": [1]})
+
+        def cache_key(self):
+            return "shared"
+
+    class RecordDest:
+        def __init__(self, name):
+            self.name = name
+
+        def load(self, data):
+            loaded[self.name] = list(data.columns)
+
+    def add_column(a):
+        a["added"] = 1
+        return {"a": a}
+
+    etls = {
+        "one": ETL(sources={"a": SharedSource()}, destinations={"a": [RecordDest("one")]}, transformer=add_column),
+        "two": ETL(sources={"a": SharedSource()}, destinations={"a": [RecordDest("two")]}),
+    }
+    with ETLScheduler(max_workers=1) as scheduler:
+        scheduler.run(etls)
+
+    assert loaded == {"one": ["a", "added"], "two": ["a"]}
+
+
+def test_scheduler_rejects_cyclic_dependencies():
+    etls = {name: ETL(sources={"a": SourceStub()}, destinations={"a": []}) for name in ("a", "b")}
+
+    with ETLScheduler() as scheduler, pytest.raises(ValueError, match="cycle"):
+        scheduler.run(etls, dependencies={"a": ["b"], "b": ["a"]})
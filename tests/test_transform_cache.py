@@ -0,0 +1,73 @@
+import os
+
+import pandas as pd
+import pytest
+
+from extralo.etl import ETL
+
+pytest.importorskip("pyarrow")
+
+from extralo.transform_cache import TransformCache  # noqa: E402
+
+
+class SourceStub:
+    def __init__(self, values):
+        self.values = values
+
+    def extract(self):
+        return pd.DataFrame({"a": self.values})
+
+
+class DestStub:
+    def __init__(self):
+        self.loaded = []
+
+    def load(self, data):
+        self.loaded.append(data)
+
+
+CALLS = []
+
+
+def make_transform(offset):
+    def transform(source):
+        CALLS.append(offset)
+        return {"source": source.assign(a=source["a"] + offset)}
+
+    return transform
+
+
+def run(cache, values, transform):
+    destination = DestStub()
+    ETL(
+        sources={"source": SourceStub(values)},
+        transformer=transform,
+        destinations={"source": [destination]},
+        transform_cache=cache,
+    ).execute()
+    return destination.loaded[0]
+
+
+def test_transform_cache_reuses_outputs_for_the_same_inputs_and_code(tmp_path):
+    cache = TransformCache(str(tmp_path))
+    CALLS.clear()
+
+    first = run(cache, [1, 2], make_transform(1))
+    second = run(cache, [1, 2], make_transform(1))
+    run(cache, [1, 3], make_transform(1))
+    run(cache, [1, 2], make_transform(2))
+
+    assert CALLS == [1, 1, 2]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_transform_cache_evicts_the_least_recently_used_entries(tmp_path):
+    cache = TransformCache(str(tmp_path), max_size=1)
+    CALLS.clear()
+
+    run(cache, [1], make_transform(1))
+    run(cache, [2], make_transform(1))
+
+    assert len(os.listdir(tmp_path)) == 1
+    run(cache, [2], make_transform(1))
+    assert CALLS == [1, 1]
@@ -0,0 +1,154 @@
+import pandas as pd
+import pytest
+from loguru import logger
+
+from extralo.compaction import DtypeCompaction
+from extralo.etl import ETL
+from extralo.validation import SchemaValidation
+
+pa = pytest.importorskip("pandera.pandas")
+
+
+class CountingSchema:
+    def __init__(self, schema):
+        self.schema = schema
+        self.rows = []
+
+    def validate(self, check_obj, **kwargs):
+        self.rows.append(len(check_obj))
+        return self.schema.validate(check_obj, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.schema, name)
+
+
+class MemorySource:
+    def __init__(self, data):
+        self._data = data
+
+    def extract(self):
+        return self._data
+
+
+class MemoryDestination:
+    def __init__(self):
+        self.data = None
+
+    def load(self, data):
+        self.data = data
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"id": range(10), "value": [1.0] * 10})
+
+
+@pytest.fixture
+def schema():
+    return pa.DataFrameSchema({"id": pa.Column(int, pa.Check.ge(0)), "value": pa.Column(float)})
+
+
+def test_validation_splits_large_frames_in_chunks(data, schema):
+    counting = CountingSchema(schema)
+
+    validated = SchemaValidation(chunk_size=4).validate({"data": data}, {"data": counting}, logger)
+
+    assert sorted(counting.rows) == [2, 4, 4]
+    assert validated["data"] is data
+
+
+def test_validation_concatenates_coerced_chunks(data):
+    schema = pa.DataFrameSchema({"id": pa.Column(float, coerce=True)})
+
+    validated = SchemaValidation(chunk_size=4).validate({"data": data}, {"data": schema}, logger)
+
+    assert validated["data"]["id"].dtype == "float64"
+    pd.testing.assert_index_equal(validated["data"].index, data.index)
+
+
+def test_validation_checks_uniqueness_on_the_whole_frame():
+    counting = CountingSchema(pa.DataFrameSchema({"id": pa.Column(int, unique=True)}))
+    data = pd.DataFrame({"id": [1, 2, 3, 1]})
+
+    with pytest.raises(pa.errors.SchemaError):
+        SchemaValidation(chunk_size=2).validate({"data": data}, {"data": counting}, logger)
+    assert counting.rows == [4]
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pa.DataFrameSchema({"id": pa.Column(int, pa.Check(lambda s: s.is_monotonic_increasing))}),
+        pa.DataFrameSchema({"id": pa.Column(int)}, checks=pa.Check(lambda df: df["id"].is_monotonic_increasing)),
+    ],
+)
+def test_validation_checks_aggregates_on_the_whole_frame(schema):
+    counting = CountingSchema(schema)
+    data = pd.DataFrame({"id": [1, 2, 0, 1]})
+
+    with pytest.raises(pa.errors.SchemaError):
+        SchemaValidation(chunk_size=2).validate({"data": data}, {"data": counting}, logger)
+    assert counting.rows == [4]
+
+
+@pytest.mark.parametrize(
+    ("schema", "expected"),
+    [
+        (pa.DataFrameSchema({"id": pa.Column(int, pa.Check.ge(3))}, drop_invalid_rows=True), [3, 4, 5, 6, 7, 8, 9]),
+        (pa.DataFrameSchema({"id": pa.Column(int, parsers=pa.Parser(lambda s: s * 2))}), list(range(0, 20, 2))),
+    ],
+)
+def test_validation_concatenates_transformed_chunks(data, schema, expected):
+    counting = CountingSchema(schema)
+
+    validated = SchemaValidation(chunk_size=4, lazy=True).validate({"data": data}, {"data": counting}, logger)
+
+    assert sorted(counting.rows) == [2, 4, 4]
+    assert validated["data"]["id"].tolist() == expected
+
+
+def test_validation_sample(data, schema):
+    counting = CountingSchema(schema)
+
+    SchemaValidation(sample=3, random_state=0).validate({"data": data}, {"data": counting}, logger)
+    SchemaValidation(sample=0.5, random_state=0).validate({"data": data}, {"data": counting}, logger)
+
+    assert counting.rows == [3, 5]
+
+
+def test_validation_fails_for_unknown_keys(data, schema):
+    with pytest.raises(KeyError):
+        SchemaValidation().validate({"data": data}, {"other": schema}, logger)
+
+
+def test_etl_validates_before_and_after(data, schema):
+    destination = MemoryDestination()
+    after = pa.DataFrameSchema({"id": pa.Column(int), "value": pa.Column(float, pa.Check.le(1))})
+    etl = ETL(
+        sources={"data": MemorySource(data)},
+        transformer=lambda data: {"data": data.assign(value=data["value"] * 2)},
+        destinations={"data": [destination]},
+        before={"data": schema},
+        after={"data": after},
+    )
+
+    with pytest.raises(pa.errors.SchemaError):
+        etl.execute()
+    assert destination.data is None
+
+
+def test_etl_validates_before_the_compaction(data, schema):
+    destination = MemoryDestination()
+    ETL(
+        sources={"data": MemorySource(data)},
+        destinations={"data": [destination]},
+        compaction=DtypeCompaction(downcast_floats=True),
+        before={"data": pa.DataFrameSchema({"id": pa.Column("int64"), "value": pa.Column("float64")})},
+    ).execute()
+
+    assert destination.data.dtypes.tolist() == ["uint8", "float32"]
+
+
+def test_etl_fails_for_before_schemas_without_sources(data, schema):
+    with pytest.raises(KeyError):
+        ETL(sources={"data": MemorySource(data)}, destinations={"data": []}, before={"other": schema})